@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from services.core.actions import PlaceBuy, PlaceSell
+from services.core.artifacts import ArtifactWriter, AsyncArtifactWriter
+from services.core.market.generator import generate_market_path
+from services.core.simulator import simulate_plan
+from services.core.state import RiskLimits, State
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Synchronous vs pooled artifact writes.")
+    parser.add_argument("--runs", type=int, default=2_000, help="Runs to write")
+    parser.add_argument("--workers", type=int, default=4, help="Writer threads")
+    parser.add_argument("--max-pending", type=int, default=64, help="Queued write bound")
+    parser.add_argument(
+        "--step-work-ms",
+        type=float,
+        default=0.5,
+        help="Simulated evaluation time between writes, as in run_loop",
+    )
+    parser.add_argument(
+        "--spin",
+        action="store_true",
+        help="Hold the GIL during step work instead of sleeping",
+    )
+    return parser.parse_args()
+
+
+def _work(milliseconds: float, spin: bool) -> None:
+    if not spin:
+        time.sleep(milliseconds / 1e3)
+        return
+    deadline = time.perf_counter() + milliseconds / 1e3
+    while time.perf_counter() < deadline:
+        pass
+
+
+def main() -> None:
+    args = parse_args()
+    market_path = generate_market_path(["AAPL", "MSFT"], n_steps=4, seed=0)
+    state = State(cash_balance=10_000.0, risk_limits=RiskLimits(2.0, 0.8, 5_000.0))
+    plan = [
+        PlaceBuy(symbol="AAPL", quantity=2, price=0.0),
+        PlaceBuy(symbol="MSFT", quantity=1, price=0.0),
+        PlaceSell(symbol="AAPL", quantity=1, price=0.0),
+    ]
+    results = [simulate_plan(state, plan, market_path) for _ in range(args.runs)]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        writer = ArtifactWriter(Path(tmp) / "sync")
+        started = time.perf_counter()
+        for result in results:
+            _work(args.step_work_ms, args.spin)
+            writer.write(result)
+        sync_total = time.perf_counter() - started
+
+        pooled = AsyncArtifactWriter(
+            Path(tmp) / "async", max_workers=args.workers, max_pending=args.max_pending
+        )
+        started = time.perf_counter()
+        for result in results:
+            _work(args.step_work_ms, args.spin)
+            pooled.write(result)
+        submitted = time.perf_counter() - started
+        pooled.close()
+        async_total = time.perf_counter() - started
+
+    mode = "GIL-bound" if args.spin else "GIL-releasing"
+    print(f"{args.runs} runs, {args.step_work_ms} ms of {mode} step work each")
+    print(f"sync:  {sync_total:.2f}s")
+    print(
+        f"async: {async_total:.2f}s ({args.workers} workers; loop done after {submitted:.2f}s, "
+        f"flush {async_total - submitted:.2f}s)"
+    )
+    print(f"speedup: {sync_total / async_total:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from services.core.actions import PlaceBuy, PlaceSell
+from services.core.market.generator import generate_market_path
+from services.core.simulator import decode_simulation, encode_simulation, simulate_plan
+from services.core.state import RiskLimits, State
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark JSON vs binary run encoding.")
+    parser.add_argument("--steps", type=int, default=2_000, help="Plan length")
+    parser.add_argument("--tickers", default="AAPL,MSFT", help="Comma-separated tickers")
+    parser.add_argument("--repeat", type=int, default=5, help="Timing repetitions")
+    return parser.parse_args()
+
+
+def _best_of(repeat: int, func) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def main() -> None:
+    args = parse_args()
+    tickers = [ticker.strip().upper() for ticker in args.tickers.split(",") if ticker.strip()]
+    market_path = generate_market_path(tickers, n_steps=args.steps, seed=7)
+    state = State(cash_balance=1e12, risk_limits=RiskLimits(1e6, 1.0, 1e15))
+    plan = []
+    for step_index in range(args.steps):
+        symbol = tickers[step_index % len(tickers)]
+        action_type = PlaceBuy if (step_index // len(tickers)) % 2 == 0 else PlaceSell
+        plan.append(action_type(symbol=symbol, quantity=1, price=0.0))
+    result = simulate_plan(state, plan, market_path, run_id="bench")
+
+    print(f"plan length: {args.steps}")
+    for codec_format in ("json", "binary"):
+        payload = encode_simulation(result, codec_format)
+        assert decode_simulation(payload) == result
+        encode = _best_of(args.repeat, lambda: encode_simulation(result, codec_format))
+        decode = _best_of(args.repeat, lambda: decode_simulation(payload))
+        megabytes = len(payload) / 1e6
+        print(
+            f"{codec_format:>6}: {len(payload):>10,} bytes | "
+            f"encode {megabytes / encode:6.1f} MB/s ({encode * 1e3:.1f} ms) | "
+            f"decode {megabytes / decode:6.1f} MB/s ({decode * 1e3:.1f} ms)"
+        )
+
+
+if __name__ == "__main__":
+    main()
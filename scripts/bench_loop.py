@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from services.core.actions import PlaceBuy, PlaceSell
+from services.core.broker import LocalPaperBroker, OrderRequest
+from services.core.loop.run import _execution_rows_for_actions
+from services.core.market import MarketPath
+from services.core.simulator import simulate_plan
+from services.core.state import RiskLimits, State
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Per-step transition accounting benchmark.")
+    parser.add_argument("--positions", type=int, default=500, help="Open positions held")
+    parser.add_argument("--actions", type=int, default=4, help="Actions per approved step")
+    parser.add_argument("--repeat", type=int, default=200, help="Timed steps per variant")
+    return parser.parse_args()
+
+
+def _orders(actions, step_index: int):
+    return [
+        OrderRequest(
+            run_id="bench",
+            step_index=step_index,
+            action_index=index,
+            symbol=action.symbol,
+            side="BUY" if isinstance(action, PlaceBuy) else "SELL",
+            quantity=action.quantity,
+            limit_price=action.price,
+        )
+        for index, action in enumerate(actions)
+    ]
+
+
+def legacy_step(state, actions, prices, market_path, broker):
+    simulate_plan(state, actions, market_path)
+    rows = _execution_rows_for_actions(
+        step_index=0,
+        run_id="bench",
+        decision="APPROVED",
+        actions=actions,
+        prices=prices,
+        reason="bench",
+        verification="verified OK",
+        prior_state=state,
+    )
+    events = broker.execute(_orders(actions, 0), prices, starting_state=state)
+    return rows, events
+
+
+def single_pass_step(state, actions, prices, market_path, broker):
+    simulation = simulate_plan(state, actions, market_path)
+    states = list(simulation.trajectory)
+    exposures = [item.exposure_value(prices) for item in states]
+    rows = _execution_rows_for_actions(
+        step_index=0,
+        run_id="bench",
+        decision="APPROVED",
+        actions=actions,
+        prices=prices,
+        reason="bench",
+        verification="verified OK",
+        states=states,
+        exposures=exposures,
+    )
+    events = broker.fill_events(_orders(actions, 0), prices, states, exposures)
+    return rows, events
+
+
+def main() -> None:
+    args = parse_args()
+    symbols = [f"S{index:05d}" for index in range(args.positions)]
+    prices = {symbol: 10.0 + index % 7 for index, symbol in enumerate(symbols)}
+    state = State(
+        cash_balance=1_000_000.0,
+        positions={symbol: 5.0 for symbol in symbols},
+        risk_limits=RiskLimits(10.0, 1.0, 1_000_000.0),
+    )
+    actions = [
+        (PlaceBuy if index % 2 == 0 else PlaceSell)(
+            symbol=symbols[index % len(symbols)], quantity=1.0, price=prices[symbols[index]]
+        )
+        for index in range(args.actions)
+    ]
+    market_path = MarketPath(symbols=symbols, steps=[prices] * len(actions))
+    broker = LocalPaperBroker()
+
+    legacy_rows, legacy_events = legacy_step(state, actions, prices, market_path, broker)
+    rows, events = single_pass_step(state, actions, prices, market_path, broker)
+    assert rows == legacy_rows and events == legacy_events
+
+    timings = {}
+    for name, step in (("legacy", legacy_step), ("single pass", single_pass_step)):
+        started = time.perf_counter()
+        for _ in range(args.repeat):
+            step(state, actions, prices, market_path, broker)
+        timings[name] = (time.perf_counter() - started) / args.repeat
+
+    print(f"{args.positions} positions, {args.actions} actions per step")
+    for name, seconds in timings.items():
+        print(f"{name}: {seconds * 1e3:.2f} ms/step")
+    print(f"speedup: {timings['legacy'] / timings['single pass']:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
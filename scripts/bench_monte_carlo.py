@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from services.core.actions import PlaceBuy, PlaceSell
+from services.core.market.generator import generate_market_path
+from services.core.simulator import simulate_plan
+from services.core.simulator.monte_carlo import simulate_monte_carlo
+from services.core.state import RiskLimits, State
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Monte Carlo plan robustness benchmark.")
+    parser.add_argument("--paths", type=int, default=10_000, help="Number of market paths")
+    parser.add_argument("--steps", type=int, default=250, help="Plan length")
+    parser.add_argument("--tickers", default="AAPL,MSFT", help="Comma-separated tickers")
+    parser.add_argument("--seed", type=int, default=0, help="First path seed")
+    parser.add_argument(
+        "--mode", choices=["vectorized", "python"], default="vectorized", help="Path generator"
+    )
+    parser.add_argument(
+        "--baseline-paths", type=int, default=50, help="Paths timed with simulate_plan"
+    )
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    tickers = [ticker.strip().upper() for ticker in args.tickers.split(",") if ticker.strip()]
+    state = State(cash_balance=50_000.0, risk_limits=RiskLimits(2.0, 0.5, 20_000.0))
+    plan = []
+    for step_index in range(args.steps):
+        symbol = tickers[step_index % len(tickers)]
+        action_type = PlaceBuy if (step_index // len(tickers)) % 3 < 2 else PlaceSell
+        plan.append(action_type(symbol=symbol, quantity=1, price=0.0))
+
+    started = time.perf_counter()
+    result = simulate_monte_carlo(
+        state, plan, tickers, n_paths=args.paths, seed=args.seed, mode=args.mode
+    )
+    vectorized = time.perf_counter() - started
+
+    started = time.perf_counter()
+    for seed in range(args.seed, args.seed + args.baseline_paths):
+        path = generate_market_path(tickers, n_steps=args.steps, seed=seed, mode=args.mode)
+        simulate_plan(state, plan, path)
+    per_path = (time.perf_counter() - started) / args.baseline_paths
+
+    print(json.dumps(result.to_dict(), indent=2))
+    print(f"monte carlo: {args.paths} paths x {args.steps} steps in {vectorized:.2f}s")
+    print(
+        f"simulate_plan loop (estimated): {per_path * args.paths:.1f}s "
+        f"({per_path * 1e3:.1f} ms/path)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from services.core.actions import PlaceBuy, PlaceSell
+from services.core.market.generator import generate_market_path
+from services.core.simulator import simulate_plan, simulate_plan_lean
+from services.core.state import RiskLimits, State
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark full vs lean plan simulation.")
+    parser.add_argument("--steps", type=int, default=20_000, help="Plan length")
+    parser.add_argument("--tickers", default="AAPL,MSFT", help="Comma-separated tickers")
+    parser.add_argument("--repeat", type=int, default=3, help="Timing repetitions")
+    return parser.parse_args()
+
+
+def _best_of(repeat: int, func) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def main() -> None:
+    args = parse_args()
+    tickers = [ticker.strip().upper() for ticker in args.tickers.split(",") if ticker.strip()]
+    market_path = generate_market_path(tickers, n_steps=args.steps, seed=7)
+    state = State(cash_balance=1e12, risk_limits=RiskLimits(1e6, 1.0, 1e15))
+    plan = []
+    for step_index in range(args.steps):
+        symbol = tickers[step_index % len(tickers)]
+        action_type = PlaceBuy if (step_index // len(tickers)) % 2 == 0 else PlaceSell
+        plan.append(action_type(symbol=symbol, quantity=1, price=0.0))
+
+    full_result = simulate_plan(state, plan, market_path)
+    lean_result = simulate_plan_lean(state, plan, market_path)
+    assert lean_result.approved == full_result.approved
+    assert lean_result.final_state == full_result.trajectory[-1]
+
+    full = _best_of(args.repeat, lambda: simulate_plan(state, plan, market_path))
+    lean = _best_of(args.repeat, lambda: simulate_plan_lean(state, plan, market_path))
+    print(f"plan length: {args.steps} | approved: {lean_result.approved}")
+    print(f"simulate_plan:      {full:.3f}s ({full / args.steps * 1e6:.1f} us/step)")
+    print(f"simulate_plan_lean: {lean:.3f}s ({lean / args.steps * 1e6:.1f} us/step)")
+    print(f"speedup: {full / lean:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from services.core.market import MarketPath
+from services.core.market.binary import write_binary_fixture
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Convert market path fixtures between formats.")
+    parser.add_argument("--input", required=True, help="Source fixture (JSON or binary)")
+    parser.add_argument("--out", required=True, help="Output fixture path")
+    parser.add_argument(
+        "--format",
+        choices=["json", "binary"],
+        default="binary",
+        help="Output format",
+    )
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    source_path = Path(args.input)
+    output_path = Path(args.out)
+    market_path = MarketPath.from_fixture(source_path)
+
+    if args.format == "binary":
+        write_binary_fixture(
+            output_path,
+            market_path,
+            provenance={"converted_from": source_path.name},
+        )
+    else:
+        payload = {
+            "symbols": list(market_path.symbols),
+            "steps": [dict(step) for step in market_path.steps],
+        }
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        output_path.write_text(json.dumps(payload, indent=2))
+
+    print(
+        f"Wrote fixture: {output_path} "
+        f"(symbols={','.join(market_path.symbols)}, steps={len(market_path.steps)}, "
+        f"format={args.format})"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import argparse
-import json
 import sys
 from pathlib import Path
 
@@ -17,6 +16,7 @@ from services.core.loop.formatting import (
 from services.core.loop.ledger import write_execution_bundle, write_execution_ledger
 from services.core.market.path import MarketPath
 from services.core.observability import (
+    JsonlTapeWriter,
     render_tape_row,
     write_report_md,
     write_tape_csv,
@@ -38,12 +38,17 @@ def parse_args() -> argparse.Namespace:
         help="Strategy spec JSON",
     )
     parser.add_argument("--steps", type=int, default=10, help="Number of steps")
+    parser.add_argument(
+        "--artifact-workers",
+        type=int,
+        default=0,
+        help="Background artifact writer threads (0 writes inline)",
+    )
     return parser.parse_args()
 
 
 def load_market_path(path: str) -> MarketPath:
-    payload = json.loads(Path(path).read_text())
-    return MarketPath(symbols=payload["symbols"], steps=payload["steps"])
+    return MarketPath.from_fixture(Path(path))
 
 
 def main() -> None:
@@ -59,16 +64,20 @@ def main() -> None:
     artifact_dir = data_dir / "artifacts"
     tape_json_path = data_dir / "tape.json"
     tape_csv_path = data_dir / "tape.csv"
+    tape_jsonl_path = data_dir / "tape.jsonl"
     report_path = data_dir / "report.md"
     executions_path = data_dir / "executions.json"
 
     steps = min(args.steps, len(market_path.steps))
-    result = run_loop(
-        market_path=market_path,
-        strategy=strategy,
-        steps=steps,
-        data_dir=data_dir,
-    )
+    with JsonlTapeWriter(tape_jsonl_path, index=True) as tape_sink:
+        result = run_loop(
+            market_path=market_path,
+            strategy=strategy,
+            steps=steps,
+            data_dir=data_dir,
+            artifact_workers=args.artifact_workers,
+            tape_sink=tape_sink,
+        )
 
     print("step | prices | signals | actions | decision | why | exposure | run_id | artifact_dir")
     print("-" * 120)
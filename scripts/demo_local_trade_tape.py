@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import argparse
-import json
 import sys
 from pathlib import Path
 
@@ -44,8 +43,7 @@ def parse_args() -> argparse.Namespace:
 
 
 def load_market_path(path: str) -> MarketPath:
-    payload = json.loads(Path(path).read_text())
-    return MarketPath(symbols=payload["symbols"], steps=payload["steps"])
+    return MarketPath.from_fixture(Path(path))
 
 
 def format_signal_map(signals: dict) -> dict:
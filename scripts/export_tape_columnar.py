@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from services.core.observability import iter_tape
+from services.core.observability.columnar import ColumnarTape
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Export a trade tape to columnar .npz.")
+    parser.add_argument("--tape", required=True, help="Path to tape.json or tape.jsonl")
+    parser.add_argument("--out", default=None, help="Output .npz (defaults next to the tape)")
+    parser.add_argument("--max-steps", type=int, default=None, help="Limit steps")
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    tape_path = Path(args.tape)
+    out_path = Path(args.out) if args.out else tape_path.with_suffix(".npz")
+
+    tape = ColumnarTape.from_rows(iter_tape(tape_path, max_steps=args.max_steps))
+    tape.save(out_path)
+
+    summary = {
+        "rows": len(tape),
+        "symbols": tape.symbols,
+        "decisions": tape.decision_counts(),
+        "signals": tape.signal_counts(),
+        "output": str(out_path),
+    }
+    print(json.dumps(summary, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -10,6 +10,7 @@ if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
 from services.core.market import generate_market_path
+from services.core.market.generator import GENERATOR_MODES
 
 
 def parse_args() -> argparse.Namespace:
@@ -17,6 +18,18 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument("--tickers", required=True, help="Comma-separated ticker symbols")
     parser.add_argument("--steps", required=True, type=int, help="Number of steps to generate")
     parser.add_argument("--seed", type=int, default=42, help="Random seed")
+    parser.add_argument(
+        "--mode",
+        choices=GENERATOR_MODES,
+        default="python",
+        help="Generator mode (vectorized requires numpy)",
+    )
+    parser.add_argument(
+        "--format",
+        choices=["json", "binary"],
+        default="json",
+        help="Fixture format (binary is a JSON header plus a memory-mappable price matrix)",
+    )
     parser.add_argument(
         "--out",
         default="examples/fixtures/trading_path.json",
@@ -35,20 +48,30 @@ def main() -> None:
         tickers=tickers,
         n_steps=args.steps,
         seed=args.seed,
+        mode=args.mode,
     )
 
-    payload = {
-        "symbols": market_path.symbols,
-        "steps": market_path.steps,
-    }
-
     output_path = Path(args.out)
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    output_path.write_text(json.dumps(payload, indent=2))
+    if args.format == "binary":
+        from services.core.market.binary import write_binary_fixture
+
+        write_binary_fixture(
+            output_path,
+            market_path,
+            provenance={"generator": args.mode, "seed": args.seed},
+        )
+    else:
+        payload = {
+            "symbols": market_path.symbols,
+            "steps": [dict(step) for step in market_path.steps],
+        }
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        output_path.write_text(json.dumps(payload, indent=2))
 
     print(
         f"Wrote fixture: {output_path} "
-        f"(tickers={','.join(market_path.symbols)}, steps={args.steps}, seed={args.seed})"
+        f"(tickers={','.join(market_path.symbols)}, steps={args.steps}, seed={args.seed}, "
+        f"mode={args.mode}, format={args.format})"
     )
 
 
@@ -27,9 +27,45 @@ def parse_args() -> argparse.Namespace:
         help="Output format",
     )
     parser.add_argument("--max-rows", type=int, default=None, help="Limit rows")
+    parser.add_argument("--step", type=int, default=None, help="Only this step_index")
+    parser.add_argument("--run-id", default=None, help="Only this run_id")
+    parser.add_argument(
+        "--decision",
+        choices=["APPROVED", "REJECTED"],
+        default=None,
+        help="Only rows with this decision",
+    )
+    parser.add_argument("--symbol", default=None, help="Only rows and events for this symbol")
     return parser.parse_args()
 
 
+def _matches(item: dict, args: argparse.Namespace) -> bool:
+    symbol = args.symbol.strip().upper() if args.symbol else None
+    return (
+        (args.step is None or item.get("step_index") == args.step)
+        and (args.run_id is None or item.get("run_id") == args.run_id)
+        and (args.decision is None or item.get("decision", "APPROVED") == args.decision)
+        and (symbol is None or item.get("symbol") == symbol)
+    )
+
+
+def filter_payload(payload, args: argparse.Namespace):
+    """Keep the ledger rows and events matching the filters.
+
+    Execution files are small (approved steps only), so they are filtered
+    in memory; use replay_tape.py with a tape index to seek in long tapes.
+    """
+    if isinstance(payload, list):
+        return [row for row in payload if _matches(row, args)]
+    bundles = []
+    for bundle in payload.get("executions", []):
+        rows = [row for row in bundle.get("ledger_rows", []) if _matches(row, args)]
+        events = [event for event in bundle.get("events", []) if _matches(event, args)]
+        if rows or events:
+            bundles.append({**bundle, "ledger_rows": rows, "events": events})
+    return {**payload, "executions": bundles}
+
+
 def render_table(rows: list[dict], events: list[ExecutionEvent]) -> None:
     if events:
         print("Execution Events")
@@ -104,6 +140,8 @@ def main() -> None:
     args = parse_args()
     path = Path(args.executions)
     payload = json.loads(path.read_text())
+    if any(value is not None for value in (args.step, args.run_id, args.decision, args.symbol)):
+        payload = filter_payload(payload, args)
 
     rows = _parse_ledger_rows(payload)
     if args.max_rows is not None:
@@ -2,12 +2,22 @@ from __future__ import annotations
 
 import argparse
 import json
+import sys
+import textwrap
+from itertools import islice
 from pathlib import Path
+from typing import Iterable, Iterator
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from services.core.observability import iter_tape, load_tape_index, row_matches
 
 
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Replay trade tape from artifacts.")
-    parser.add_argument("--tape", required=True, help="Path to tape.json")
+    parser.add_argument("--tape", required=True, help="Path to tape.json or tape.jsonl")
     parser.add_argument(
         "--format",
         choices=["table", "json"],
@@ -15,7 +25,38 @@ def parse_args() -> argparse.Namespace:
         help="Output format",
     )
     parser.add_argument("--max-steps", type=int, default=None, help="Limit steps")
-    return parser.parse_args()
+    parser.add_argument("--step", type=int, default=None, help="Only this step_index")
+    parser.add_argument("--run-id", default=None, help="Only this run_id")
+    parser.add_argument(
+        "--decision",
+        choices=["HOLD", "APPROVED", "REJECTED"],
+        default=None,
+        help="Only rows with this decision",
+    )
+    parser.add_argument(
+        "--symbol", default=None, help="Only rows acting on or signalling this symbol"
+    )
+    args = parser.parse_args()
+    if args.max_steps is not None and args.max_steps < 0:
+        parser.error("--max-steps must be non-negative")
+    return args
+
+
+def select_rows(path: Path, args: argparse.Namespace) -> Iterator[dict]:
+    filters = {
+        "step": args.step,
+        "run_id": args.run_id,
+        "decision": args.decision,
+        "symbol": args.symbol.strip().upper() if args.symbol else None,
+    }
+    if all(value is None for value in filters.values()):
+        return iter_tape(path, max_steps=args.max_steps)
+    # JSONL tapes seek through their sidecar index; tape.json arrays are scanned.
+    index = load_tape_index(path)
+    if index is not None:
+        return index.read_rows(path, index.select(**filters)[: args.max_steps])
+    rows = (row for row in iter_tape(path) if row_matches(row, **filters))
+    return islice(rows, args.max_steps)
 
 
 def _compact_prices(prices: dict) -> str:
@@ -48,7 +89,17 @@ def _format_exposure(state_delta: dict, decision: str) -> str:
     return f"exposure {delta:+.2f}"
 
 
-def render_table(rows: list[dict]) -> None:
+def render_json(rows: Iterable[dict]) -> None:
+    # Same output as json.dumps(list(rows), indent=2), one row at a time.
+    opened = False
+    for row in rows:
+        print("[" if not opened else ",")
+        print(textwrap.indent(json.dumps(row, indent=2), "  "), end="")
+        opened = True
+    print("\n]" if opened else "[]")
+
+
+def render_table(rows: Iterable[dict]) -> None:
     print("step | prices | signals | actions | decision | why | exposure | run_id | artifact_dir")
     print("-" * 120)
     for row in rows:
@@ -71,13 +122,10 @@ def render_table(rows: list[dict]) -> None:
 
 def main() -> None:
     args = parse_args()
-    path = Path(args.tape)
-    rows = json.loads(path.read_text())
-    if args.max_steps is not None:
-        rows = rows[: args.max_steps]
+    rows = select_rows(Path(args.tape), args)
 
     if args.format == "json":
-        print(json.dumps(rows, indent=2))
+        render_json(rows)
         return
 
     render_table(rows)
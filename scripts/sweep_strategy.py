@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from services.core.strategy import load_strategy
+from services.core.sweep import format_sweep_table, parameter_grid, random_search, run_sweep
+
+
+def _parse_value(raw: str) -> object:
+    try:
+        return json.loads(raw)
+    except json.JSONDecodeError:
+        return raw
+
+
+def parse_grid(entries: List[str]) -> Dict[str, List[object]]:
+    grid: Dict[str, List[object]] = {}
+    for entry in entries:
+        key, _, values = entry.partition("=")
+        grid[key] = [_parse_value(value) for value in values.split(",")]
+    return grid
+
+
+def parse_space(entries: List[str]) -> Dict[str, object]:
+    space: Dict[str, object] = {}
+    for entry in entries:
+        key, _, values = entry.partition("=")
+        if ":" in values:
+            low, high = (_parse_value(value) for value in values.split(":", 1))
+            space[key] = (low, high)
+        else:
+            space[key] = [_parse_value(value) for value in values.split(",")]
+    return space
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Sweep strategy parameters over the local loop.")
+    parser.add_argument(
+        "--fixture",
+        default="examples/fixtures/trading_path.json",
+        help="MarketPath fixture (binary fixtures are memory-mapped by each worker)",
+    )
+    parser.add_argument(
+        "--strategy",
+        default="examples/strategies/sma_crossover_demo.json",
+        help="Base strategy spec JSON",
+    )
+    parser.add_argument("--steps", type=int, default=None, help="Steps per run (default: all)")
+    parser.add_argument(
+        "--grid",
+        action="append",
+        default=[],
+        help="Grid dimension, e.g. rules.0.short_window=2,3,4 (repeatable)",
+    )
+    parser.add_argument(
+        "--space",
+        action="append",
+        default=[],
+        help="Random dimension, e.g. rules.0.long_window=4:12 or sizing.order_qty=1,2",
+    )
+    parser.add_argument("--samples", type=int, default=0, help="Random search samples")
+    parser.add_argument("--seed", type=int, default=42, help="Random search seed")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes")
+    parser.add_argument(
+        "--metric",
+        default="total_return",
+        choices=["total_return", "final_equity", "trades"],
+        help="Ranking metric",
+    )
+    parser.add_argument("--top", type=int, default=10, help="Rows to print")
+    parser.add_argument("--out", default=None, help="Optional JSON output path")
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    candidates = parameter_grid(parse_grid(args.grid)) if args.grid else []
+    if args.samples:
+        candidates.extend(random_search(parse_space(args.space), args.samples, seed=args.seed))
+    if not candidates:
+        raise SystemExit("Provide --grid and/or --space with --samples.")
+
+    strategy = load_strategy(args.strategy)
+    started = time.perf_counter()
+    results = run_sweep(
+        strategy,
+        args.fixture,
+        candidates,
+        steps=args.steps,
+        max_workers=args.workers,
+        metric=args.metric,
+    )
+    elapsed = time.perf_counter() - started
+
+    print(format_sweep_table(results, top=args.top))
+    print(f"\n{len(results)} candidates in {elapsed:.1f}s")
+    if args.out:
+        out_path = Path(args.out)
+        out_path.parent.mkdir(parents=True, exist_ok=True)
+        out_path.write_text(json.dumps([result.to_dict() for result in results], indent=2))
+        print(f"Wrote {out_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,14 +2,13 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from decimal import Decimal
-from typing import Dict, Optional
+from typing import Optional
 
 import boto3
 
-from services.core.actions import PlaceBuy, PlaceSell
-from services.core.simulator import SimulationResult, StepResult
-from services.core.state import RiskLimits, State
-from services.core.verifier import VerificationError
+from services.core.simulator import SimulationResult
+from services.core.simulator.codec import simulation_from_dict, simulation_to_dict, state_from_dict
+from services.core.state import State
 
 
 @dataclass
@@ -25,18 +24,7 @@ class DdbStateStore:
         item = response.get("Item")
         if not item:
             return None
-        item = _from_ddb(item)
-        risk_limits = item["risk_limits"]
-        return State(
-            cash_balance=item["cash_balance"],
-            positions=item.get("positions", {}),
-            exposure=item.get("exposure", 0.0),
-            risk_limits=RiskLimits(
-                max_leverage=risk_limits["max_leverage"],
-                max_position_pct=risk_limits["max_position_pct"],
-                max_position_value=risk_limits["max_position_value"],
-            ),
-        )
+        return state_from_dict(_from_ddb(item))
 
     def init_state(self, state: State) -> None:
         payload = _to_ddb(state.to_dict())
@@ -55,7 +43,7 @@ class DdbRunStore:
         self._table = boto3.resource("dynamodb").Table(self.table_name)
 
     def save_run(self, simulation_result: SimulationResult) -> None:
-        payload = _serialize_simulation(simulation_result)
+        payload = simulation_to_dict(simulation_result)
         payload["run_id"] = simulation_result.run_id
         self._table.put_item(Item=_to_ddb(payload))
 
@@ -64,7 +52,7 @@ class DdbRunStore:
         item = response.get("Item")
         if not item:
             return None
-        return _deserialize_simulation(_from_ddb(item))
+        return simulation_from_dict(_from_ddb(item))
 
 
 @dataclass
@@ -83,97 +71,6 @@ class DdbPolicyStore:
         return _from_ddb(item) if item else None
 
 
-def _serialize_simulation(result: SimulationResult) -> Dict[str, object]:
-    return {
-        "run_id": result.run_id,
-        "approved": result.approved,
-        "rejected_step_index": result.rejected_step_index,
-        "planner": {
-            "planner_name": result.planner_name,
-            "planner_metadata": result.planner_metadata,
-        },
-        "policy": {
-            "policy_id": result.policy_id,
-            "policy_version": result.policy_version,
-            "policy_hash": result.policy_hash,
-        },
-        "trajectory": [state.to_dict() for state in result.trajectory],
-        "steps": [
-            {
-                "step_index": step.step_index,
-                "action": {
-                    "type": step.action.__class__.__name__,
-                    "symbol": step.action.symbol,
-                    "quantity": step.action.quantity,
-                    "price": step.action.price,
-                },
-                "accepted": step.accepted,
-                "errors": [
-                    {"code": error.code, "message": error.message}
-                    for error in step.errors
-                ],
-                "price_context": step.price_context,
-                "explanation": step.explanation,
-                "state_delta": step.state_delta,
-            }
-            for step in result.steps
-        ],
-    }
-
-
-def _deserialize_simulation(data: dict) -> SimulationResult:
-    def action_from_payload(payload: dict):
-        if payload["type"] == "PlaceBuy":
-            return PlaceBuy(payload["symbol"], payload["quantity"], payload["price"])
-        return PlaceSell(payload["symbol"], payload["quantity"], payload["price"])
-
-    trajectory = [
-        State(
-            cash_balance=state["cash_balance"],
-            positions=state.get("positions", {}),
-            exposure=state.get("exposure", 0.0),
-            risk_limits=RiskLimits(
-                max_leverage=state["risk_limits"]["max_leverage"],
-                max_position_pct=state["risk_limits"]["max_position_pct"],
-                max_position_value=state["risk_limits"]["max_position_value"],
-            ),
-        )
-        for state in data["trajectory"]
-    ]
-
-    steps = [
-        StepResult(
-            step_index=step["step_index"],
-            action=action_from_payload(step["action"]),
-            accepted=step["accepted"],
-            errors=[
-                VerificationError(code=error["code"], message=error["message"])
-                for error in step["errors"]
-            ],
-            price_context=step["price_context"],
-            explanation=step.get("explanation", ""),
-            state_delta=step.get("state_delta", {}),
-        )
-        for step in data["steps"]
-    ]
-
-    policy = data.get("policy", {})
-    planner = data.get("planner", {})
-
-    return SimulationResult(
-        run_id=data["run_id"],
-        trajectory=trajectory,
-        steps=steps,
-        approved=data["approved"],
-        rejected_step_index=data.get("rejected_step_index"),
-        policy_id=policy.get("policy_id"),
-        policy_version=policy.get("policy_version"),
-        policy_hash=policy.get("policy_hash"),
-        planner_name=planner.get("planner_name"),
-        planner_metadata=planner.get("planner_metadata"),
-    )
-
-
 def _to_ddb(value):
     if isinstance(value, float):
         return Decimal(str(value))
@@ -6,7 +6,7 @@ from typing import Dict
 
 import boto3
 
-from services.core.simulator import SimulationResult
+from services.core.simulator import SimulationResult, codec
 
 
 @dataclass
@@ -22,61 +22,9 @@ class S3ArtifactWriter:
         decision_key = f"{prefix}/decision.json"
         deltas_key = f"{prefix}/deltas.json"
 
-        trajectory_payload = {
-            "run_id": result.run_id,
-            "trajectory": [state.to_dict() for state in result.trajectory],
-            "steps": [
-                {
-                    "step_index": step.step_index,
-                    "action": {
-                        "type": step.action.__class__.__name__,
-                        "symbol": step.action.symbol,
-                        "quantity": step.action.quantity,
-                        "price": step.action.price,
-                    },
-                    "price_context": step.price_context,
-                    "accepted": step.accepted,
-                    "errors": [
-                        {"code": error.code, "message": error.message}
-                        for error in step.errors
-                    ],
-                    "explanation": step.explanation,
-                    "state_delta": step.state_delta,
-                }
-                for step in result.steps
-            ],
-        }
-
-        decision_payload = {
-            "run_id": result.run_id,
-            "approved": result.approved,
-            "rejected_step_index": result.rejected_step_index,
-            "errors": [
-                {
-                    "step_index": step.step_index,
-                    "errors": [
-                        {"code": error.code, "message": error.message}
-                        for error in step.errors
-                    ],
-                }
-                for step in result.steps
-                if step.errors
-            ],
-            "planner": {
-                "planner_name": result.planner_name,
-                "planner_metadata": result.planner_metadata,
-            },
-            "policy": {
-                "policy_id": result.policy_id,
-                "policy_version": result.policy_version,
-                "policy_hash": result.policy_hash,
-            },
-        }
-
-        deltas_payload = {
-            "run_id": result.run_id,
-            "deltas": [step.state_delta for step in result.steps],
-        }
+        trajectory_payload = codec.trajectory_payload(result)
+        decision_payload = codec.decision_payload(result)
+        deltas_payload = codec.deltas_payload(result)
 
         self._client.put_object(
             Bucket=self.bucket_name,
@@ -18,11 +18,14 @@ from services.core.agentcore_tools import (
     run_tool_loop,
 )
 from services.core.market import MarketPath
-from services.core.simulator import simulate_plan
+from services.core.simulator import SimulationCache
 from services.core.state import RiskLimits, State
 from services.core.strategy.evaluate import evaluate_signals_with_rationale, signals_to_actions
 from services.core.strategy.load import load_strategy
 
+# Warm containers re-simulate the same evaluated actions across tool calls.
+_SIMULATION_CACHE = SimulationCache(max_entries=128)
+
 
 def _artifact_keys(run_id: str) -> Dict[str, str]:
     prefix = f"artifacts/{run_id}"
@@ -167,7 +170,7 @@ def _build_registry(
                 actions.append(PlaceSell(item["symbol"], item["quantity"], 0.0))
 
         initial_state = _default_state()
-        result = simulate_plan(initial_state, actions, fixture)
+        result = _SIMULATION_CACHE.simulate(initial_state, actions, fixture)
         writer = S3ArtifactWriter(bucket_name=bucket_name)
         artifacts = writer.write(result)
         return ToolResult(
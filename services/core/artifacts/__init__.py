@@ -1,3 +1,4 @@
-from .writer import ArtifactWriter
+from .async_writer import AsyncArtifactWriter
+from .writer import ArtifactWriter, NullArtifactWriter
 
-__all__ = ["ArtifactWriter"]
+__all__ = ["ArtifactWriter", "AsyncArtifactWriter", "NullArtifactWriter"]
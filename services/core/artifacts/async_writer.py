@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Optional, Set
+
+from services.core.artifacts.writer import ArtifactWriter, artifact_paths
+from services.core.simulator import SimulationResult
+
+DEFAULT_WORKERS = 2
+DEFAULT_MAX_PENDING = 64
+
+
+class AsyncArtifactWriter:
+    """``ArtifactWriter`` that writes on a thread pool.
+
+    ``write`` returns the artifact paths at once and queues the write. At
+    most ``max_pending`` writes are queued or running; past that ``write``
+    blocks until one finishes. The first write error is raised from the next
+    ``write``, ``flush`` or ``close`` call. Use it as a context manager, or
+    call ``close``, so pending writes land before the caller reads them.
+    """
+
+    def __init__(
+        self,
+        output_dir: Path,
+        max_workers: int = DEFAULT_WORKERS,
+        max_pending: int = DEFAULT_MAX_PENDING,
+    ) -> None:
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1.")
+        if max_pending < 1:
+            raise ValueError("max_pending must be at least 1.")
+        self.output_dir = output_dir
+        self._writer = ArtifactWriter(output_dir)
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="artifact-writer"
+        )
+        self._slots = threading.BoundedSemaphore(max_pending)
+        self._condition = threading.Condition()
+        self._pending: Set[Future] = set()
+        self._error: Optional[BaseException] = None
+        self._closed = False
+
+    def write(self, result: SimulationResult) -> Dict[str, Path]:
+        self._raise_error()
+        if self._closed:
+            raise ValueError("AsyncArtifactWriter is closed.")
+        self._slots.acquire()
+        try:
+            future = self._executor.submit(self._writer.write, result)
+        except BaseException:
+            self._slots.release()
+            raise
+        with self._condition:
+            self._pending.add(future)
+        future.add_done_callback(self._done)
+        return artifact_paths(self.output_dir, result.run_id)
+
+    def flush(self) -> None:
+        """Wait for every queued write, then raise the first error if any."""
+        with self._condition:
+            self._condition.wait_for(lambda: not self._pending)
+        self._raise_error()
+
+    def close(self) -> None:
+        if self._closed:
+            self._raise_error()
+            return
+        try:
+            self.flush()
+        finally:
+            self._closed = True
+            self._executor.shutdown(wait=True)
+
+    def __enter__(self) -> "AsyncArtifactWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, traceback) -> None:
+        if exc_type is None:
+            self.close()
+            return
+        # Do not mask the caller's exception with a write error.
+        try:
+            self.close()
+        except Exception:
+            pass
+
+    def _done(self, future: Future) -> None:
+        error = future.exception()
+        with self._condition:
+            self._pending.discard(future)
+            if error is not None and self._error is None:
+                self._error = error
+            self._condition.notify_all()
+        self._slots.release()
+
+    def _raise_error(self) -> None:
+        with self._condition:
+            error, self._error = self._error, None
+        if error is not None:
+            raise error
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Sequence
 
 from services.core.broker.base import Broker
 from services.core.broker.types import ExecutionEvent, OrderRequest
@@ -15,50 +15,70 @@ class LocalPaperBroker(Broker):
         price_context: Dict[str, float],
         starting_state: Optional[State] = None,
     ) -> List[ExecutionEvent]:
-        events: List[ExecutionEvent] = []
-        rolling_state = starting_state
+        if starting_state is None:
+            return [
+                _fill_event(order, price_context, None, None, 0.0, 0.0) for order in orders
+            ]
+        states = [starting_state]
         for order in orders:
             price = price_context.get(order.symbol, order.limit_price)
-            event_id = f"{order.run_id}:{order.step_index}:{order.action_index}"
-            if rolling_state is not None:
-                cash_before = rolling_state.cash_balance
-                exposure_before = rolling_state.exposure_value(price_context)
-                positions_before = dict(rolling_state.positions)
-                action = _order_to_action(order, price)
-                transition = apply_action(rolling_state, action)
-                rolling_state = transition.next_state
-                cash_after = rolling_state.cash_balance
-                exposure_after = rolling_state.exposure_value(price_context)
-                positions_after = dict(rolling_state.positions)
-            else:
-                cash_before = 0.0
-                exposure_before = 0.0
-                positions_before = {}
-                cash_after = 0.0
-                exposure_after = 0.0
-                positions_after = {}
-            why = "paper fill"
-            events.append(
-                ExecutionEvent(
-                    event_id=event_id,
-                    run_id=order.run_id,
-                    step_index=order.step_index,
-                    action_index=order.action_index,
-                    symbol=order.symbol,
-                    side=order.side,
-                    quantity=order.quantity,
-                    price=price,
-                    status="FILLED",
-                    cash_before=cash_before,
-                    cash_after=cash_after,
-                    positions_before=positions_before,
-                    positions_after=positions_after,
-                    exposure_before=exposure_before,
-                    exposure_after=exposure_after,
-                    why=why,
-                )
+            action = _order_to_action(order, price)
+            states.append(apply_action(states[-1], action).next_state)
+        return self.fill_events(orders, price_context, states)
+
+    def fill_events(
+        self,
+        orders: List[OrderRequest],
+        price_context: Dict[str, float],
+        states: Sequence[State],
+        exposures: Optional[Sequence[float]] = None,
+    ) -> List[ExecutionEvent]:
+        """Events for orders whose transitions were already applied.
+
+        ``states[i]`` and ``states[i + 1]`` are the states around order ``i``;
+        ``exposures`` optionally holds their ``exposure_value(price_context)``.
+        """
+        if exposures is None:
+            exposures = [state.exposure_value(price_context) for state in states]
+        return [
+            _fill_event(
+                order,
+                price_context,
+                states[index],
+                states[index + 1],
+                exposures[index],
+                exposures[index + 1],
             )
-        return events
+            for index, order in enumerate(orders)
+        ]
+
+
+def _fill_event(
+    order: OrderRequest,
+    price_context: Dict[str, float],
+    before: Optional[State],
+    after: Optional[State],
+    exposure_before: float,
+    exposure_after: float,
+) -> ExecutionEvent:
+    return ExecutionEvent(
+        event_id=f"{order.run_id}:{order.step_index}:{order.action_index}",
+        run_id=order.run_id,
+        step_index=order.step_index,
+        action_index=order.action_index,
+        symbol=order.symbol,
+        side=order.side,
+        quantity=order.quantity,
+        price=price_context.get(order.symbol, order.limit_price),
+        status="FILLED",
+        cash_before=before.cash_balance if before is not None else 0.0,
+        cash_after=after.cash_balance if after is not None else 0.0,
+        positions_before=dict(before.positions) if before is not None else {},
+        positions_after=dict(after.positions) if after is not None else {},
+        exposure_before=exposure_before,
+        exposure_after=exposure_after,
+        why="paper fill",
+    )
 
 
 def _order_to_action(order: OrderRequest, price: float) -> object:
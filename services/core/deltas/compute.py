@@ -13,7 +13,9 @@ def compute_state_delta(
     prior_equity = prior.equity(prices)
     next_equity = next_state.equity(prices)
 
-    symbols = set(prior.positions) | set(next_state.positions)
+    symbols = next_state.changed_symbols(prior)
+    if symbols is None:
+        symbols = set(prior.positions) | set(next_state.positions)
     positions = {}
     for symbol in symbols:
         before = prior.positions.get(symbol, 0.0)
@@ -1,27 +1,54 @@
 from __future__ import annotations
 
+from contextlib import nullcontext
 from dataclasses import replace
-from typing import Dict, List
+from typing import Dict, List, Optional, Sequence
 
 from services.core.actions import PlaceBuy
-from services.core.artifacts import ArtifactWriter
+from services.core.artifacts import ArtifactWriter, AsyncArtifactWriter, NullArtifactWriter
 from services.core.broker import LocalPaperBroker, OrderRequest
 from services.core.deltas.compute import compute_state_delta
 from services.core.execution import execute_run
+from services.core.loop.schedule import CadenceScheduler
 from services.core.loop.types import ExecutionBundle, ExecutionRow, LoopResult
 from services.core.market import MarketPath
-from services.core.observability import TapeRow
-from services.core.persistence import PolicyStore, RunStore, StateStore
+from services.core.observability import JsonlTapeWriter, TapeRow
+from services.core.persistence import (
+    InMemoryPolicyStore,
+    InMemoryRunStore,
+    InMemoryStateStore,
+    LogRunStore,
+    PolicyStore,
+    StateStore,
+)
 from services.core.simulator import simulate_plan
 from services.core.state import RiskLimits, State
-from services.core.strategy import evaluate_signals_with_rationale, signals_to_actions
+from services.core.strategy import Signal, signals_to_actions
+from services.core.strategy.evaluate import StrategyEvaluation
+from services.core.strategy.vectorized import precompute_signals
 from services.core.transitions import apply_action
 
+INITIAL_CASH = 1_000.0
+
 
 def _format_signals(signals: Dict[str, object]) -> Dict[str, str]:
     return {symbol: signal.value for symbol, signal in signals.items()}
 
 
+def _merge_evaluation(
+    signals: Dict[str, Signal],
+    rationales: Dict[str, str],
+    evaluation: StrategyEvaluation,
+) -> None:
+    # As between rules of one strategy, the last non-HOLD signal wins.
+    for symbol, signal in evaluation.signals.items():
+        if symbol not in signals or signal != Signal.HOLD:
+            signals[symbol] = signal
+            rationales[symbol] = evaluation.rationales.get(symbol, "")
+    for symbol, rationale in evaluation.rationales.items():
+        rationales.setdefault(symbol, rationale)
+
+
 def _actions_with_prices(actions: List[object], prices: Dict[str, float]) -> List[object]:
     priced_actions = []
     for action in actions:
@@ -53,31 +80,31 @@ def _execution_rows_for_actions(
     decision: str,
     actions: List[object],
     prices: Dict[str, float],
-    prior_state: State,
-    next_state: State,
     reason: str,
     verification: str,
+    prior_state: Optional[State] = None,
+    states: Optional[Sequence[State]] = None,
+    exposures: Optional[Sequence[float]] = None,
 ) -> List[ExecutionRow]:
+    """Ledger rows for ``actions``; ``states[i] -> states[i + 1]`` is action ``i``.
+
+    ``run_loop`` passes the simulated trajectory and its exposures. Without
+    ``states`` the actions are re-applied to ``prior_state``.
+    """
     if decision != "APPROVED":
         return []
+    if states is None:
+        states = [prior_state]
+        for action in actions:
+            states.append(apply_action(states[-1], action).next_state)
+    if exposures is None:
+        exposures = [item.exposure_value(prices) for item in states]
 
     execution_rows: List[ExecutionRow] = []
-    rolling_state = prior_state
-
-    for action in actions:
+    for index, action in enumerate(actions):
         side = "BUY" if isinstance(action, PlaceBuy) else "SELL"
         symbol = action.symbol
-        qty = action.quantity
-        price = prices.get(symbol, action.price)
-        positions_before = _positions_slice(rolling_state, [symbol])
-        cash_before = rolling_state.cash_balance
-        exposure_before = rolling_state.exposure_value(prices)
-        transition = apply_action(rolling_state, action)
-        rolling_state = transition.next_state
-        positions_after = _positions_slice(rolling_state, [symbol])
-        cash_after = rolling_state.cash_balance
-        exposure_after = rolling_state.exposure_value(prices)
-        symbol_reason = _extract_symbol_reason(reason, symbol)
+        before, after = states[index], states[index + 1]
         execution_rows.append(
             ExecutionRow(
                 step_index=step_index,
@@ -85,35 +112,73 @@ def _execution_rows_for_actions(
                 decision=decision,
                 symbol=symbol,
                 side=side,
-                quantity=qty,
-                price=price,
-                cash_before=cash_before,
-                cash_after=cash_after,
-                exposure_before=exposure_before,
-                exposure_after=exposure_after,
-                positions_before=positions_before,
-                positions_after=positions_after,
-                reason=symbol_reason,
+                quantity=action.quantity,
+                price=prices.get(symbol, action.price),
+                cash_before=before.cash_balance,
+                cash_after=after.cash_balance,
+                exposure_before=exposures[index],
+                exposure_after=exposures[index + 1],
+                positions_before=_positions_slice(before, [symbol]),
+                positions_after=_positions_slice(after, [symbol]),
+                reason=_extract_symbol_reason(reason, symbol),
                 verification=verification,
             )
         )
     return execution_rows
 
 
+def _step_market_path(market_path: MarketPath, prices: Dict[str, float], n_actions: int):
+    # simulate_plan prices action i at path step i; every action of a loop
+    # step trades at that step's prices.
+    return MarketPath(symbols=market_path.symbols, steps=[prices] * n_actions)
+
+
 def run_loop(
     *,
     market_path: MarketPath,
     strategy: object,
     steps: int,
     data_dir: object,
+    ephemeral: bool = False,
+    materialize_artifacts: bool = False,
+    artifact_workers: int = 0,
+    tape_sink: Optional[JsonlTapeWriter] = None,
+    retain_tape: bool = True,
 ) -> LoopResult:
-    data_dir = data_dir
+    """Run the strategy loop over ``steps`` market steps.
+
+    ``strategy`` is one strategy or a list of them. Each is evaluated only on
+    its ``timing.evaluation_frequency_steps`` cadence; steps where no strategy
+    is due are skipped and get no tape row. When several strategies are due
+    on a step their actions are simulated together as one plan.
+
+    With ``ephemeral`` the stores live in memory and nothing is written
+    under ``data_dir``; tape rows still carry the artifact paths, and
+    ``materialize_artifacts`` writes those artifacts once the loop ends.
+    With ``artifact_workers`` > 0 artifacts are written by that many
+    background threads while the loop moves on; they are all on disk when
+    the loop returns and a failed write is raised from the loop.
+
+    Tape rows are written to ``tape_sink`` as they are produced; with
+    ``retain_tape=False`` they are not kept in ``LoopResult.tape_rows``.
+    The caller owns the sink and closes it.
+    """
     artifact_dir = data_dir / "artifacts"
 
-    state_store = StateStore(data_dir / "state.json")
-    run_store = RunStore(data_dir / "runs.json")
-    policy_store = PolicyStore(data_dir / "policies.json")
-    artifact_writer = ArtifactWriter(artifact_dir)
+    if ephemeral:
+        state_store = InMemoryStateStore()
+        run_store = InMemoryRunStore()
+        policy_store = InMemoryPolicyStore()
+        artifact_writer = NullArtifactWriter(artifact_dir)
+    else:
+        state_store = StateStore(data_dir / "state.json")
+        run_store = LogRunStore(data_dir / "runs.jsonl")
+        policy_store = PolicyStore(data_dir / "policies.json")
+        artifact_writer = (
+            AsyncArtifactWriter(artifact_dir, max_workers=artifact_workers)
+            if artifact_workers > 0
+            else ArtifactWriter(artifact_dir)
+        )
 
     policy = {
         "policy_id": "default",
@@ -126,7 +191,7 @@ def run_loop(
     policy_store.save_policy(policy)
 
     state = State(
-        cash_balance=1_000.0,
+        cash_balance=INITIAL_CASH,
         positions={},
         exposure=0.0,
         risk_limits=RiskLimits(2.0, 0.8, 5_000.0),
@@ -134,137 +199,186 @@ def run_loop(
     state_store.init_state(state)
 
     tape_rows: List[TapeRow] = []
+
+    def record_tape(row: TapeRow) -> None:
+        if tape_sink is not None:
+            tape_sink.write(row)
+        if retain_tape:
+            tape_rows.append(row)
+
     execution_rows: List[ExecutionRow] = []
     execution_bundles: List[ExecutionBundle] = []
     broker = LocalPaperBroker()
-
-    for step_index in range(steps):
-        prices = market_path.price_context(step_index)
-        evaluation = evaluate_signals_with_rationale(
-            strategy=strategy,
-            state=state,
-            price_ctx=prices,
-            step_index=step_index,
-            market_path=market_path,
+    strategies = list(strategy) if isinstance(strategy, (list, tuple)) else [strategy]
+    scheduler = CadenceScheduler.for_strategies(strategies, steps)
+    signal_matrices = [
+        precompute_signals(
+            item, market_path, n_steps=steps, evaluation_steps=scheduler.steps_for(index)
         )
-        signals = _format_signals(evaluation.signals)
-        rationales = evaluation.rationales
+        for index, item in enumerate(strategies)
+    ]
+
+    writer_scope = (
+        artifact_writer if isinstance(artifact_writer, AsyncArtifactWriter) else nullcontext()
+    )
+    with writer_scope:
+        for step_index, due in scheduler:
+            prices = market_path.price_context(step_index)
+            evaluations = [signal_matrices[index].evaluation(step_index) for index in due]
+
+            # Each due strategy sizes its orders against the state left by the
+            # orders of the strategies before it on this step.
+            actions = []
+            sizing_state = state
+            order_evaluations = []
+            for position, (index, evaluation) in enumerate(zip(due, evaluations)):
+                strategy_actions = signals_to_actions(
+                    strategies[index], sizing_state, prices, evaluation.signals
+                )
+                actions.extend(strategy_actions)
+                order_evaluations.extend((action, evaluation) for action in strategy_actions)
+                if position + 1 < len(due):
+                    for action in _actions_with_prices(strategy_actions, prices):
+                        sizing_state = apply_action(sizing_state, action).next_state
 
-        actions = signals_to_actions(strategy, state, prices, evaluation.signals)
-        action_payloads = [action.to_dict() for action in actions]
+            if len(evaluations) == 1:
+                step_signals, rationales = evaluations[0].signals, evaluations[0].rationales
+            else:
+                step_signals, rationales = {}, {}
+                for evaluation in evaluations:
+                    _merge_evaluation(step_signals, rationales, evaluation)
+                # A traded symbol shows the signal behind its order, which the
+                # merged signal of another strategy may contradict.
+                for action, evaluation in order_evaluations:
+                    step_signals[action.symbol] = evaluation.signals[action.symbol]
+                    rationales[action.symbol] = evaluation.rationales.get(action.symbol, "")
+            signals = _format_signals(step_signals)
+            action_payloads = [action.to_dict() for action in actions]
+
+            if not actions:
+                delta = compute_state_delta(state, state, prices)
+                record_tape(
+                    TapeRow(
+                        step_index=step_index,
+                        prices=prices,
+                        signals=signals,
+                        rationales=rationales,
+                        actions=action_payloads,
+                        decision="HOLD",
+                        why="strategy HOLD",
+                        explanation="",
+                        state_delta=delta,
+                        verifier_errors=[],
+                        run_id="-",
+                        artifact_dir=str(artifact_dir),
+                    )
+                )
+                continue
+
+            priced_actions = _actions_with_prices(actions, prices)
+            simulation = simulate_plan(
+                state,
+                priced_actions,
+                _step_market_path(market_path, prices, len(priced_actions)),
+                policy_id=policy["policy_id"],
+                policy_version=policy.get("policy_version"),
+                policy_hash=policy.get("policy_hash"),
+            )
+            run_store.save_run(simulation)
+            artifacts = artifact_writer.write(simulation)
+
+            decision = "APPROVED" if simulation.approved else "REJECTED"
+            explanation = simulation.steps[-1].explanation if simulation.steps else ""
+            verifier_errors = [
+                {"code": error.code, "message": error.message}
+                for error in (simulation.steps[-1].errors if simulation.steps else [])
+            ]
+            if simulation.approved and simulation.trajectory:
+                final_state = simulation.trajectory[-1]
+                delta = compute_state_delta(state, final_state, prices)
+            else:
+                final_state = state
+                delta = compute_state_delta(state, state, prices)
 
-        if not actions:
-            delta = compute_state_delta(state, state, prices)
-            tape_rows.append(
+            why_parts = [
+                f"{symbol}: {rationale}"
+                for symbol, rationale in rationales.items()
+                if signals.get(symbol) != "HOLD"
+            ]
+            reason = "; ".join(why_parts) if why_parts else "strategy HOLD"
+            verification = "verified OK" if simulation.approved else "verification failed"
+            why = f"{reason} | {verification}"
+
+            record_tape(
                 TapeRow(
                     step_index=step_index,
                     prices=prices,
                     signals=signals,
                     rationales=rationales,
                     actions=action_payloads,
-                    decision="HOLD",
-                    why="strategy HOLD",
-                    explanation="",
+                    decision=decision,
+                    why=why,
+                    explanation=explanation,
                     state_delta=delta,
-                    verifier_errors=[],
-                    run_id="-",
-                    artifact_dir=str(artifact_dir),
+                    verifier_errors=verifier_errors,
+                    run_id=simulation.run_id,
+                    artifact_dir=str(artifacts["decision"]).rsplit("/", 1)[0],
                 )
             )
-            continue
-
-        priced_actions = _actions_with_prices(actions, prices)
-        simulation = simulate_plan(
-            state,
-            priced_actions,
-            market_path,
-            policy_id=policy["policy_id"],
-            policy_version=policy.get("policy_version"),
-            policy_hash=policy.get("policy_hash"),
-        )
-        run_store.save_run(simulation)
-        artifacts = artifact_writer.write(simulation)
-
-        decision = "APPROVED" if simulation.approved else "REJECTED"
-        explanation = simulation.steps[-1].explanation if simulation.steps else ""
-        verifier_errors = [
-            {"code": error.code, "message": error.message}
-            for error in (simulation.steps[-1].errors if simulation.steps else [])
-        ]
-        if simulation.approved and simulation.trajectory:
-            final_state = simulation.trajectory[-1]
-            delta = compute_state_delta(state, final_state, prices)
-        else:
-            final_state = state
-            delta = compute_state_delta(state, state, prices)
-
-        why_parts = [
-            f"{symbol}: {rationale}"
-            for symbol, rationale in rationales.items()
-            if signals.get(symbol) != "HOLD"
-        ]
-        reason = "; ".join(why_parts) if why_parts else "strategy HOLD"
-        verification = "verified OK" if simulation.approved else "verification failed"
-        why = f"{reason} | {verification}"
-
-        tape_rows.append(
-            TapeRow(
+
+            # The simulated trajectory is the single application of the actions;
+            # the ledger and broker events are read off it.
+            transition_states = list(simulation.trajectory) if simulation.approved else []
+            exposures = [item.exposure_value(prices) for item in transition_states]
+            ledger_rows = _execution_rows_for_actions(
                 step_index=step_index,
-                prices=prices,
-                signals=signals,
-                rationales=rationales,
-                actions=action_payloads,
-                decision=decision,
-                why=why,
-                explanation=explanation,
-                state_delta=delta,
-                verifier_errors=verifier_errors,
                 run_id=simulation.run_id,
-                artifact_dir=str(artifacts["decision"]).rsplit("/", 1)[0],
+                decision=decision,
+                actions=priced_actions,
+                prices=prices,
+                states=transition_states,
+                exposures=exposures,
+                reason=reason,
+                verification=verification,
             )
-        )
+            execution_rows.extend(ledger_rows)
 
-        ledger_rows = _execution_rows_for_actions(
-            step_index=step_index,
-            run_id=simulation.run_id,
-            decision=decision,
-            actions=priced_actions,
-            prices=prices,
-            prior_state=state,
-            next_state=final_state,
-            reason=reason,
-            verification=verification,
-        )
-        execution_rows.extend(ledger_rows)
-
-        if decision == "APPROVED" and priced_actions:
-            orders = [
-                OrderRequest(
-                    run_id=simulation.run_id,
-                    step_index=step_index,
-                    action_index=index,
-                    symbol=action.symbol,
-                    side="BUY" if isinstance(action, PlaceBuy) else "SELL",
-                    quantity=action.quantity,
-                    limit_price=action.price,
-                )
-                for index, action in enumerate(priced_actions)
-            ]
-            events = broker.execute(orders, prices, starting_state=state)
-            execution_bundles.append(
-                ExecutionBundle(
-                    step_index=step_index,
-                    run_id=simulation.run_id,
-                    artifact_dir=str(artifacts["decision"]).rsplit("/", 1)[0],
-                    events=events,
-                    ledger_rows=ledger_rows,
+            if decision == "APPROVED" and priced_actions:
+                orders = [
+                    OrderRequest(
+                        run_id=simulation.run_id,
+                        step_index=step_index,
+                        action_index=index,
+                        symbol=action.symbol,
+                        side="BUY" if isinstance(action, PlaceBuy) else "SELL",
+                        quantity=action.quantity,
+                        limit_price=action.price,
+                    )
+                    for index, action in enumerate(priced_actions)
+                ]
+                events = broker.fill_events(orders, prices, transition_states, exposures)
+                execution_bundles.append(
+                    ExecutionBundle(
+                        step_index=step_index,
+                        run_id=simulation.run_id,
+                        artifact_dir=str(artifacts["decision"]).rsplit("/", 1)[0],
+                        events=events,
+                        ledger_rows=ledger_rows,
+                    )
                 )
-            )
 
-        if simulation.approved:
-            execution = execute_run(run_store, state_store, simulation.run_id)
-            if execution.state is not None:
-                state = execution.state
+            if simulation.approved:
+                execution = execute_run(run_store, state_store, simulation.run_id)
+                if execution.state is not None:
+                    state = execution.state
+
+    if tape_sink is not None:
+        tape_sink.flush()
+
+    if ephemeral and materialize_artifacts:
+        writer = ArtifactWriter(artifact_dir)
+        for run in run_store.runs():
+            writer.write(run)
 
     return LoopResult(
         tape_rows=tape_rows,
@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+import heapq
+from typing import Iterator, List, Sequence, Tuple
+
+
+class CadenceScheduler:
+    """Merges the evaluation cadences of several strategies over a path.
+
+    Strategy ``i`` is due on steps ``0, f_i, 2 * f_i, ...`` below ``n_steps``.
+    Iterating yields ``(step_index, due)`` for the steps where at least one
+    strategy is due, with ``due`` in strategy order; other steps are never
+    visited, so the cost follows the number of evaluation points.
+    """
+
+    def __init__(self, frequencies: Sequence[int], n_steps: int) -> None:
+        if not frequencies:
+            raise ValueError("At least one cadence is required.")
+        if any(frequency < 1 for frequency in frequencies):
+            raise ValueError("Evaluation frequencies must be at least 1 step.")
+        if n_steps < 0:
+            raise ValueError("n_steps must be non-negative.")
+        self.frequencies = list(frequencies)
+        self.n_steps = n_steps
+
+    @classmethod
+    def for_strategies(cls, strategies: Sequence[object], n_steps: int) -> "CadenceScheduler":
+        return cls([strategy.timing.evaluation_frequency_steps for strategy in strategies], n_steps)
+
+    def steps_for(self, index: int) -> range:
+        """Steps on which strategy ``index`` is due."""
+        return range(0, self.n_steps, self.frequencies[index])
+
+    @property
+    def evaluation_count(self) -> int:
+        """Number of steps the scheduler yields."""
+        return sum(1 for _ in self)
+
+    def __iter__(self) -> Iterator[Tuple[int, List[int]]]:
+        if self.n_steps == 0:
+            return
+        if len(set(self.frequencies)) == 1:
+            for step_index in range(0, self.n_steps, self.frequencies[0]):
+                yield step_index, list(range(len(self.frequencies)))
+            return
+        heap = [(0, index) for index in range(len(self.frequencies))]
+        heapq.heapify(heap)
+        while heap:
+            step_index = heap[0][0]
+            due: List[int] = []
+            while heap and heap[0][0] == step_index:
+                _, index = heapq.heappop(heap)
+                due.append(index)
+                next_step = step_index + self.frequencies[index]
+                if next_step < self.n_steps:
+                    heapq.heappush(heap, (next_step, index))
+            yield step_index, due
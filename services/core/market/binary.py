@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import json
+import struct
+from pathlib import Path
+from typing import Dict
+
+import numpy as np
+
+from services.core.market.columnar import ColumnarMarketPath
+from services.core.market.path import BINARY_MAGIC, MarketPath
+
+# Layout: magic | u32 header length | JSON header | zero padding | price matrix.
+# The matrix is C-ordered little-endian float64 (steps x symbols) starting at
+# the first DATA_ALIGNMENT boundary after the header, so it can be memory-mapped.
+FORMAT_VERSION = 1
+DATA_ALIGNMENT = 64
+PRICE_DTYPE = "<f8"
+
+_HEADER_LENGTH = struct.Struct("<I")
+
+
+def is_binary_fixture(path: Path) -> bool:
+    with Path(path).open("rb") as handle:
+        return handle.read(len(BINARY_MAGIC)) == BINARY_MAGIC
+
+
+def _data_offset(header_length: int) -> int:
+    end = len(BINARY_MAGIC) + _HEADER_LENGTH.size + header_length
+    return -(-end // DATA_ALIGNMENT) * DATA_ALIGNMENT
+
+
+def read_binary_header(path: Path) -> Dict[str, object]:
+    with Path(path).open("rb") as handle:
+        if handle.read(len(BINARY_MAGIC)) != BINARY_MAGIC:
+            raise ValueError(f"Not a binary market path fixture: {path}")
+        (header_length,) = _HEADER_LENGTH.unpack(handle.read(_HEADER_LENGTH.size))
+        header = json.loads(handle.read(header_length))
+    if header.get("format_version") != FORMAT_VERSION:
+        raise ValueError(f"Unsupported fixture format version: {header.get('format_version')}")
+    header["data_offset"] = _data_offset(header_length)
+    return header
+
+
+def write_binary_fixture(
+    path: Path,
+    market_path: MarketPath | ColumnarMarketPath,
+    provenance: Dict[str, object] | None = None,
+) -> Path:
+    if isinstance(market_path, MarketPath):
+        market_path = ColumnarMarketPath.from_market_path(market_path)
+
+    prices = np.ascontiguousarray(market_path.prices, dtype=PRICE_DTYPE)
+    header = {
+        "format_version": FORMAT_VERSION,
+        "symbols": list(market_path.symbols),
+        "n_steps": int(prices.shape[0]),
+        "dtype": PRICE_DTYPE,
+        "order": "C",
+        "provenance": dict(provenance if provenance is not None else market_path.metadata),
+    }
+    header_bytes = json.dumps(header, sort_keys=True).encode("utf-8")
+    padding = _data_offset(len(header_bytes)) - (
+        len(BINARY_MAGIC) + _HEADER_LENGTH.size + len(header_bytes)
+    )
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("wb") as handle:
+        handle.write(BINARY_MAGIC)
+        handle.write(_HEADER_LENGTH.pack(len(header_bytes)))
+        handle.write(header_bytes)
+        handle.write(b"\x00" * padding)
+        prices.tofile(handle)
+    return path
+
+
+def open_binary_fixture(path: Path) -> ColumnarMarketPath:
+    header = read_binary_header(path)
+    symbols = list(header["symbols"])
+    shape = (int(header["n_steps"]), len(symbols))
+    if shape[0] == 0 or shape[1] == 0:
+        prices = np.empty(shape, dtype=header["dtype"])
+    else:
+        prices = np.memmap(
+            path,
+            dtype=header["dtype"],
+            mode="r",
+            offset=int(header["data_offset"]),
+            shape=shape,
+            order="C",
+        )
+    return ColumnarMarketPath(
+        symbols=symbols,
+        prices=prices,
+        metadata=dict(header.get("provenance") or {}),
+    )
@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, List
+
+import numpy as np
+
+from services.core.market.path import MarketPath
+
+
+def _read_only(array: np.ndarray) -> np.ndarray:
+    if not array.flags.writeable:
+        return array
+    view = array.view()
+    view.flags.writeable = False
+    return view
+
+
+class StepView(Mapping):
+    """Read-only mapping over one row of a price matrix.
+
+    NaN cells mark symbols that have no price at that step, mirroring the
+    missing keys of a dict-based step.
+    """
+
+    __slots__ = ("_row", "_columns")
+
+    def __init__(self, row: np.ndarray, columns: Dict[str, int]) -> None:
+        self._row = row
+        self._columns = columns
+
+    def __getitem__(self, symbol: str) -> float:
+        value = float(self._row[self._columns[symbol]])
+        if value != value:
+            raise KeyError(symbol)
+        return value
+
+    def __contains__(self, symbol: object) -> bool:
+        column = self._columns.get(symbol)
+        return column is not None and not np.isnan(self._row[column])
+
+    def __iter__(self) -> Iterator[str]:
+        for symbol, column in self._columns.items():
+            if not np.isnan(self._row[column]):
+                yield symbol
+
+    def __len__(self) -> int:
+        return int(np.count_nonzero(~np.isnan(self._row)))
+
+    def __repr__(self) -> str:
+        return f"StepView({dict(self)!r})"
+
+
+class StepSequence(Sequence):
+    """Adapter exposing a price matrix through the ``MarketPath.steps`` API."""
+
+    __slots__ = ("_prices", "_columns")
+
+    def __init__(self, prices: np.ndarray, columns: Dict[str, int]) -> None:
+        self._prices = prices
+        self._columns = columns
+
+    def __len__(self) -> int:
+        return self._prices.shape[0]
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return StepSequence(self._prices[index], self._columns)
+        return StepView(self._prices[index], self._columns)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Sequence):
+            return NotImplemented
+        return len(self) == len(other) and all(
+            step == other_step for step, other_step in zip(self, other)
+        )
+
+    __hash__ = None
+
+
+@dataclass(frozen=True, eq=False)
+class ColumnarMarketPath:
+    """Market path stored as a float64 ``steps x symbols`` matrix.
+
+    ``price_context`` keeps the dict-returning contract of ``MarketPath``;
+    ``step_view`` and ``history`` hand out read-only views without copying.
+    """
+
+    symbols: List[str]
+    prices: np.ndarray
+    metadata: Dict[str, object] = field(default_factory=dict)
+    columns: Dict[str, int] = field(init=False)
+
+    def __post_init__(self) -> None:
+        prices = np.asarray(self.prices, dtype=np.float64)
+        if prices.ndim != 2 or prices.shape[1] != len(self.symbols):
+            raise ValueError("prices must be a 2-D matrix with one column per symbol.")
+        columns = {symbol: column for column, symbol in enumerate(self.symbols)}
+        if len(columns) != len(self.symbols):
+            raise ValueError("symbols must be unique.")
+        object.__setattr__(self, "symbols", list(self.symbols))
+        object.__setattr__(self, "prices", _read_only(prices))
+        object.__setattr__(self, "columns", columns)
+
+    @property
+    def n_steps(self) -> int:
+        return self.prices.shape[0]
+
+    @property
+    def steps(self) -> StepSequence:
+        return StepSequence(self.prices, self.columns)
+
+    def _check_step(self, step_index: int) -> None:
+        if step_index < 0 or step_index >= self.n_steps:
+            raise IndexError("Step index out of range")
+
+    def price_context(self, step_index: int) -> Dict[str, float]:
+        self._check_step(step_index)
+        return {
+            symbol: value
+            for symbol, value in zip(self.symbols, self.prices[step_index].tolist())
+            if value == value
+        }
+
+    def step_view(self, step_index: int) -> StepView:
+        self._check_step(step_index)
+        return StepView(self.prices[step_index], self.columns)
+
+    def history(self, symbol: str, end: int | None = None) -> np.ndarray:
+        return self.prices[:end, self.columns[symbol]]
+
+    def to_market_path(self) -> MarketPath:
+        return MarketPath(
+            symbols=list(self.symbols),
+            steps=[dict(step) for step in self.steps],
+        )
+
+    @classmethod
+    def from_market_path(cls, path: MarketPath) -> "ColumnarMarketPath":
+        symbols = list(path.symbols)
+        prices = np.array(
+            [[step.get(symbol, np.nan) for symbol in symbols] for step in path.steps],
+            dtype=np.float64,
+        ).reshape(len(path.steps), len(symbols))
+        return cls(symbols=symbols, prices=prices)
@@ -2,10 +2,15 @@ from __future__ import annotations
 
 import math
 import random
-from typing import Dict, List
+from typing import TYPE_CHECKING, Dict, List
 
 from services.core.market.path import MarketPath
 
+if TYPE_CHECKING:
+    from services.core.market.columnar import ColumnarMarketPath
+
+GENERATOR_MODES = ("python", "vectorized")
+
 DEFAULT_BASELINES: Dict[str, float] = {
     "AAPL": 100.0,
     "MSFT": 198.0,
@@ -18,6 +23,13 @@ DEFAULT_BASELINES: Dict[str, float] = {
     "QQQ": 420.0,
 }
 
+DRIFT = 0.0003
+VOLATILITY = 0.012
+JUMP_CHANCE = 0.05
+JUMP_LOW = -0.05
+JUMP_HIGH = 0.05
+MIN_PRICE = 0.01
+
 
 def _normalize_tickers(tickers: List[str]) -> List[str]:
     normalized = []
@@ -38,7 +50,7 @@ def _baseline_for(ticker: str, baselines: Dict[str, float]) -> float:
 
 
 def _clamp_price(price: float) -> float:
-    return max(price, 0.01)
+    return max(price, MIN_PRICE)
 
 
 def generate_market_path(
@@ -46,31 +58,32 @@ def generate_market_path(
     n_steps: int,
     seed: int = 42,
     baselines: Dict[str, float] | None = None,
-) -> MarketPath:
+    mode: str = "python",
+) -> MarketPath | ColumnarMarketPath:
     if n_steps <= 0:
         raise ValueError("n_steps must be positive.")
+    if mode not in GENERATOR_MODES:
+        raise ValueError(f"Unknown generator mode: {mode}")
 
-    rng = random.Random(seed)
     normalized = _normalize_tickers(tickers)
     baseline_map = baselines or DEFAULT_BASELINES
+    baseline_prices = [_baseline_for(ticker, baseline_map) for ticker in normalized]
 
-    prices = {ticker: _baseline_for(ticker, baseline_map) for ticker in normalized}
-    steps = []
+    if mode == "vectorized":
+        return _generate_vectorized(normalized, baseline_prices, n_steps, seed)
 
-    drift = 0.0003
-    volatility = 0.012
-    jump_chance = 0.05
-    jump_low = -0.05
-    jump_high = 0.05
+    rng = random.Random(seed)
+    prices = dict(zip(normalized, baseline_prices))
+    steps = []
 
     for _ in range(n_steps):
         step_payload = {}
         for ticker in normalized:
             prev = prices[ticker]
-            shock = rng.gauss(0.0, volatility)
-            growth = drift + shock
-            if rng.random() < jump_chance:
-                growth += rng.uniform(jump_low, jump_high)
+            shock = rng.gauss(0.0, VOLATILITY)
+            growth = DRIFT + shock
+            if rng.random() < JUMP_CHANCE:
+                growth += rng.uniform(JUMP_LOW, JUMP_HIGH)
 
             next_price = prev * math.exp(growth)
             next_price = round(_clamp_price(next_price), 2)
@@ -78,4 +91,36 @@ def generate_market_path(
             step_payload[ticker] = next_price
         steps.append(step_payload)
 
-    return MarketPath(symbols=normalized, steps=steps)
\ No newline at end of file
+    return MarketPath(symbols=normalized, steps=steps)
+
+
+def _generate_vectorized(
+    tickers: List[str],
+    baseline_prices: List[float],
+    n_steps: int,
+    seed: int,
+) -> ColumnarMarketPath:
+    # Draws come from numpy's PCG64 stream, so a seed reproduces the same
+    # vectorized path but not the pure-Python reference path. Rounding and the
+    # price floor are applied to the output only; they do not feed back into
+    # the next step as they do in the reference loop.
+    import numpy as np
+
+    from services.core.market.columnar import ColumnarMarketPath
+
+    rng = np.random.default_rng(seed)
+    shape = (n_steps, len(tickers))
+    growth = rng.normal(DRIFT, VOLATILITY, size=shape)
+    jumps = rng.random(size=shape) < JUMP_CHANCE
+    growth += np.where(jumps, rng.uniform(JUMP_LOW, JUMP_HIGH, size=shape), 0.0)
+
+    log_prices = np.cumsum(growth, axis=0, out=growth)
+    log_prices += np.log(np.asarray(baseline_prices, dtype=np.float64))
+    prices = np.exp(log_prices, out=log_prices)
+    np.maximum(prices, MIN_PRICE, out=prices)
+    np.round(prices, 2, out=prices)
+    return ColumnarMarketPath(
+        symbols=tickers,
+        prices=prices,
+        metadata={"generator": "vectorized", "seed": seed},
+    )
\ No newline at end of file
@@ -3,7 +3,12 @@ from __future__ import annotations
 import json
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List
+from typing import TYPE_CHECKING, Dict, List
+
+if TYPE_CHECKING:
+    from services.core.market.columnar import ColumnarMarketPath
+
+BINARY_MAGIC = b"EWMPATH\x00"
 
 
 @dataclass(frozen=True)
@@ -16,7 +21,18 @@ class MarketPath:
             raise IndexError("Step index out of range")
         return dict(self.steps[step_index])
 
+    def to_columnar(self) -> "ColumnarMarketPath":
+        from services.core.market.columnar import ColumnarMarketPath
+
+        return ColumnarMarketPath.from_market_path(self)
+
     @classmethod
-    def from_fixture(cls, path: Path) -> "MarketPath":
-        data = json.loads(path.read_text())
+    def from_fixture(cls, path: Path) -> "MarketPath | ColumnarMarketPath":
+        with Path(path).open("rb") as handle:
+            magic = handle.read(len(BINARY_MAGIC))
+        if magic == BINARY_MAGIC:
+            from services.core.market.binary import open_binary_fixture
+
+            return open_binary_fixture(path)
+        data = json.loads(Path(path).read_text())
         return cls(symbols=data["symbols"], steps=data["steps"])
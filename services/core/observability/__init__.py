@@ -1,14 +1,28 @@
 from services.core.observability.tape import (
+    JsonlTapeWriter,
     TapeRow,
+    iter_tape,
     render_tape_row,
     write_report_md,
     write_tape_csv,
     write_tape_json,
 )
+from services.core.observability.tape_index import (
+    TapeIndex,
+    build_tape_index,
+    load_tape_index,
+    row_matches,
+)
 
 __all__ = [
+    "JsonlTapeWriter",
+    "TapeIndex",
     "TapeRow",
+    "build_tape_index",
+    "iter_tape",
+    "load_tape_index",
     "render_tape_row",
+    "row_matches",
     "write_report_md",
     "write_tape_csv",
     "write_tape_json",
@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+from array import array
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, Mapping, Optional, Union
+
+import numpy as np
+
+from services.core.observability.tape import TapeRow
+from services.core.strategy.vectorized import SIGNAL_CODES
+
+DECISION_CODES: Dict[str, int] = {"HOLD": 0, "APPROVED": 1, "REJECTED": 2}
+CODE_DECISIONS: Dict[int, str] = {code: decision for decision, code in DECISION_CODES.items()}
+TAPE_SIGNAL_CODES: Dict[str, int] = {signal.value: code for signal, code in SIGNAL_CODES.items()}
+
+_SCALAR_COLUMNS = ("step_index", "decision", "n_actions", "cash", "equity", "exposure")
+
+
+@dataclass(frozen=True)
+class ColumnarTape:
+    """A trade tape as typed NumPy columns, one entry per tape row.
+
+    ``prices`` and ``signals`` are ``rows x symbols``; a symbol missing from
+    a row has a NaN price and a HOLD (0) signal. Signals use the
+    ``SignalMatrix`` codes (BUY=1, SELL=-1, HOLD=0) and decisions
+    ``DECISION_CODES``. ``cash``, ``equity`` and ``exposure`` are the values
+    after the step, read from ``state_delta``.
+    """
+
+    symbols: List[str]
+    step_index: np.ndarray
+    prices: np.ndarray
+    signals: np.ndarray
+    decision: np.ndarray
+    n_actions: np.ndarray
+    cash: np.ndarray
+    equity: np.ndarray
+    exposure: np.ndarray
+
+    def __len__(self) -> int:
+        return int(self.step_index.shape[0])
+
+    @classmethod
+    def from_rows(
+        cls,
+        rows: Iterable[Union[TapeRow, Mapping[str, object]]],
+        symbols: Optional[List[str]] = None,
+    ) -> "ColumnarTape":
+        """Build the columns in one pass over ``rows``, which may be a stream.
+
+        Symbols are taken in order of first appearance unless ``symbols``
+        fixes them, in which case other symbols are dropped.
+        """
+        builder = _ColumnBuilder(symbols)
+        for row in rows:
+            builder.add(row.to_dict() if isinstance(row, TapeRow) else row)
+        return builder.build()
+
+    def columns(self) -> Dict[str, np.ndarray]:
+        """Flat 1-D columns (``price_<SYMBOL>``, ``signal_<SYMBOL>``, ...).
+
+        The mapping can be handed to ``pyarrow.table`` or ``pandas.DataFrame``
+        as is.
+        """
+        flat = {name: getattr(self, name) for name in _SCALAR_COLUMNS}
+        for position, symbol in enumerate(self.symbols):
+            flat[f"price_{symbol}"] = self.prices[:, position]
+            flat[f"signal_{symbol}"] = self.signals[:, position]
+        return flat
+
+    def decision_counts(self) -> Dict[str, int]:
+        counts = np.bincount(self.decision, minlength=len(DECISION_CODES))
+        return {CODE_DECISIONS[code]: int(count) for code, count in enumerate(counts)}
+
+    def signal_counts(self) -> Dict[str, Dict[str, int]]:
+        counts: Dict[str, Dict[str, int]] = {}
+        for position, symbol in enumerate(self.symbols):
+            column = self.signals[:, position]
+            counts[symbol] = {
+                signal: int(np.count_nonzero(column == code))
+                for signal, code in TAPE_SIGNAL_CODES.items()
+            }
+        return counts
+
+    def save(self, path: Path) -> None:
+        np.savez(path, symbols=np.array(self.symbols, dtype=str), **self._arrays())
+
+    @classmethod
+    def load(cls, path: Path) -> "ColumnarTape":
+        with np.load(path, allow_pickle=False) as data:
+            return cls(
+                symbols=[str(symbol) for symbol in data["symbols"]],
+                **{name: data[name] for name in ("prices", "signals", *_SCALAR_COLUMNS)},
+            )
+
+    def _arrays(self) -> Dict[str, np.ndarray]:
+        return {
+            "prices": self.prices,
+            "signals": self.signals,
+            **{name: getattr(self, name) for name in _SCALAR_COLUMNS},
+        }
+
+
+class _ColumnBuilder:
+    def __init__(self, symbols: Optional[List[str]]) -> None:
+        self._fixed = symbols is not None
+        self._symbols: List[str] = list(symbols or [])
+        self._prices: Dict[str, array] = {symbol: array("d") for symbol in self._symbols}
+        self._signals: Dict[str, array] = {symbol: array("b") for symbol in self._symbols}
+        self._step_index = array("q")
+        self._decision = array("b")
+        self._n_actions = array("i")
+        self._cash = array("d")
+        self._equity = array("d")
+        self._exposure = array("d")
+
+    def add(self, row: Mapping[str, object]) -> None:
+        count = len(self._step_index)
+        prices = row.get("prices") or {}
+        signals = row.get("signals") or {}
+        if not self._fixed:
+            for symbol in (*prices, *signals):
+                if symbol not in self._prices:
+                    self._symbols.append(symbol)
+                    self._prices[symbol] = array("d", [float("nan")]) * count
+                    self._signals[symbol] = array("b", [0]) * count
+        for symbol in self._symbols:
+            self._prices[symbol].append(prices.get(symbol, float("nan")))
+            self._signals[symbol].append(TAPE_SIGNAL_CODES.get(signals.get(symbol, "HOLD"), 0))
+
+        delta = row.get("state_delta") or {}
+        self._step_index.append(row["step_index"])
+        self._decision.append(DECISION_CODES[row["decision"]])
+        self._n_actions.append(len(row.get("actions") or ()))
+        self._cash.append(_after(delta, "cash"))
+        self._equity.append(_after(delta, "equity"))
+        self._exposure.append(_after(delta, "exposure"))
+
+    def build(self) -> ColumnarTape:
+        rows = len(self._step_index)
+        prices = np.empty((rows, len(self._symbols)), dtype=np.float64)
+        signals = np.empty((rows, len(self._symbols)), dtype=np.int8)
+        for position, symbol in enumerate(self._symbols):
+            prices[:, position] = np.frombuffer(self._prices[symbol], dtype=np.float64)
+            signals[:, position] = np.frombuffer(self._signals[symbol], dtype=np.int8)
+        return ColumnarTape(
+            symbols=list(self._symbols),
+            step_index=np.frombuffer(self._step_index, dtype=np.int64).copy(),
+            prices=prices,
+            signals=signals,
+            decision=np.frombuffer(self._decision, dtype=np.int8).copy(),
+            n_actions=np.frombuffer(self._n_actions, dtype=np.int32).copy(),
+            cash=np.frombuffer(self._cash, dtype=np.float64).copy(),
+            equity=np.frombuffer(self._equity, dtype=np.float64).copy(),
+            exposure=np.frombuffer(self._exposure, dtype=np.float64).copy(),
+        )
+
+
+def _after(delta: Mapping[str, object], field: str) -> float:
+    value = delta.get(field)
+    return float(value["after"]) if value else float("nan")
+
+
+def write_tape_columnar(path: Path, rows: Iterable[Union[TapeRow, Mapping[str, object]]]) -> None:
+    ColumnarTape.from_rows(rows).save(path)
@@ -4,10 +4,14 @@ import csv
 import json
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List
+from typing import BinaryIO, Dict, Iterator, List, Optional, TextIO
 
+from services.core.observability.tape_index import TapeIndex, tape_index_path
 from services.core.state import State
 
+TAPE_FLUSH_EVERY = 100
+_READ_CHUNK = 1 << 16
+
 
 @dataclass(frozen=True)
 class TapeRow:
@@ -93,6 +97,112 @@ def write_tape_json(path: Path, rows: List[TapeRow]) -> None:
     path.write_text(json.dumps([row.to_dict() for row in rows], indent=2))
 
 
+class JsonlTapeWriter:
+    """Appends one compact JSON line per tape row.
+
+    The file is flushed every ``flush_every`` rows and on ``close``, so a
+    crashed run keeps everything up to the last flush. With ``index`` a
+    ``TapeIndex`` sidecar is kept alongside the tape and saved on ``close``.
+    """
+
+    def __init__(
+        self, path: Path, flush_every: int = TAPE_FLUSH_EVERY, index: bool = False
+    ) -> None:
+        if flush_every < 1:
+            raise ValueError("flush_every must be at least 1.")
+        self.path = path
+        self.flush_every = flush_every
+        self.rows_written = 0
+        self.index: Optional[TapeIndex] = TapeIndex() if index else None
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._handle: Optional[BinaryIO] = path.open("wb")
+        self._offset = 0
+
+    def write(self, row: TapeRow) -> None:
+        if self._handle is None:
+            raise ValueError("JsonlTapeWriter is closed.")
+        payload = row.to_dict()
+        line = (json.dumps(payload, separators=(",", ":")) + "\n").encode("utf-8")
+        self._handle.write(line)
+        if self.index is not None:
+            self.index.add(self._offset, len(line), payload)
+        self._offset += len(line)
+        self.rows_written += 1
+        if self.rows_written % self.flush_every == 0:
+            self._handle.flush()
+
+    def flush(self) -> None:
+        if self._handle is not None:
+            self._handle.flush()
+
+    def close(self) -> None:
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
+            if self.index is not None:
+                self.index.stamp(self.path)
+                self.index.save(tape_index_path(self.path))
+
+    def __enter__(self) -> "JsonlTapeWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, traceback) -> None:
+        self.close()
+
+
+def iter_tape(path: Path, max_steps: Optional[int] = None) -> Iterator[Dict[str, object]]:
+    """Yield tape rows as dicts from a JSONL tape or a ``tape.json`` array.
+
+    Both layouts are read incrementally; at most ``max_steps`` rows are
+    parsed.
+    """
+    if max_steps is not None and max_steps <= 0:
+        return
+    with path.open("r", encoding="utf-8") as handle:
+        first = handle.read(1)
+        while first.isspace():
+            first = handle.read(1)
+        if not first:
+            return
+        rows = _iter_json_array(handle) if first == "[" else _iter_jsonl(first, handle)
+        for count, row in enumerate(rows, start=1):
+            yield row
+            if max_steps is not None and count >= max_steps:
+                return
+
+
+def _iter_jsonl(first: str, handle: TextIO) -> Iterator[Dict[str, object]]:
+    line = first + handle.readline()
+    while line:
+        if line.strip():
+            yield json.loads(line)
+        line = handle.readline()
+
+
+def _iter_json_array(handle: TextIO) -> Iterator[Dict[str, object]]:
+    decoder = json.JSONDecoder()
+    buffer = ""
+    position = 0
+    exhausted = False
+    while True:
+        while position < len(buffer) and (buffer[position].isspace() or buffer[position] == ","):
+            position += 1
+        if position < len(buffer) and buffer[position] == "]":
+            return
+        try:
+            row, end = decoder.raw_decode(buffer, position)
+        except json.JSONDecodeError:
+            if exhausted:
+                raise
+            chunk = handle.read(_READ_CHUNK)
+            exhausted = not chunk
+            buffer = buffer[position:] + chunk
+            position = 0
+            continue
+        yield row
+        position = end
+
+
 def write_tape_csv(path: Path, rows: List[TapeRow]) -> None:
     fieldnames = [
         "step_index",
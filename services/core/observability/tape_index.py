@@ -0,0 +1,218 @@
+from __future__ import annotations
+
+import hashlib
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Mapping, Optional, Set
+
+TAPE_INDEX_VERSION = 2
+TAPE_INDEX_SUFFIX = ".idx.json"
+_EDGE_BYTES = 4096
+
+
+def tape_index_path(tape_path: Path) -> Path:
+    return tape_path.with_name(tape_path.name + TAPE_INDEX_SUFFIX)
+
+
+def row_symbols(row: Mapping[str, object]) -> Set[str]:
+    """Symbols a row acts on: its actions plus its non-HOLD signals."""
+    symbols = {action["symbol"] for action in row.get("actions") or () if "symbol" in action}
+    for symbol, signal in (row.get("signals") or {}).items():
+        if signal != "HOLD":
+            symbols.add(symbol)
+    return symbols
+
+
+def row_matches(
+    row: Mapping[str, object],
+    step: Optional[int] = None,
+    run_id: Optional[str] = None,
+    decision: Optional[str] = None,
+    symbol: Optional[str] = None,
+) -> bool:
+    """The filter ``TapeIndex.select`` answers, for rows read without an index."""
+    return (
+        (step is None or row.get("step_index") == step)
+        and (run_id is None or row.get("run_id") == run_id)
+        and (decision is None or row.get("decision") == decision)
+        and (symbol is None or symbol in row_symbols(row))
+    )
+
+
+@dataclass
+class TapeIndex:
+    """Byte offsets and posting lists for a JSONL tape.
+
+    Row ``i`` of the tape starts at ``offsets[i]`` and has step
+    ``steps[i]``. ``run_ids``, ``decisions`` and ``symbols`` map a key to
+    the ascending row numbers carrying it (HOLD rows' ``"-"`` run id is
+    not indexed). ``tape_bytes`` is the tape size the index covers and
+    ``tape_digest`` hashes its first and last few KiB, so a stale index is
+    detected even when the tape was rewritten to the same size.
+    """
+
+    offsets: List[int] = field(default_factory=list)
+    steps: List[int] = field(default_factory=list)
+    run_ids: Dict[str, List[int]] = field(default_factory=dict)
+    decisions: Dict[str, List[int]] = field(default_factory=dict)
+    symbols: Dict[str, List[int]] = field(default_factory=dict)
+    tape_bytes: int = 0
+    tape_digest: str = ""
+    _step_rows: Optional[Dict[int, List[int]]] = field(default=None, repr=False, compare=False)
+
+    def __len__(self) -> int:
+        return len(self.offsets)
+
+    def add(self, offset: int, size: int, row: Mapping[str, object]) -> None:
+        """Record a row of ``size`` bytes written at ``offset``."""
+        position = len(self.offsets)
+        self.offsets.append(offset)
+        self.steps.append(row["step_index"])
+        run_id = row.get("run_id")
+        if run_id and run_id != "-":
+            self.run_ids.setdefault(run_id, []).append(position)
+        self.decisions.setdefault(row["decision"], []).append(position)
+        for symbol in sorted(row_symbols(row)):
+            self.symbols.setdefault(symbol, []).append(position)
+        self.tape_bytes = offset + size
+        self._step_rows = None
+
+    def select(
+        self,
+        step: Optional[int] = None,
+        run_id: Optional[str] = None,
+        decision: Optional[str] = None,
+        symbol: Optional[str] = None,
+    ) -> List[int]:
+        """Ascending row numbers matching every given filter."""
+        postings: List[Iterable[int]] = []
+        if step is not None:
+            postings.append(self._rows_for_step(step))
+        if run_id is not None:
+            postings.append(self.run_ids.get(run_id, ()))
+        if decision is not None:
+            postings.append(self.decisions.get(decision, ()))
+        if symbol is not None:
+            postings.append(self.symbols.get(symbol, ()))
+        if not postings:
+            return list(range(len(self)))
+        postings.sort(key=lambda rows: len(rows))
+        selected = set(postings[0])
+        for rows in postings[1:]:
+            selected.intersection_update(rows)
+        return sorted(selected)
+
+    def read_rows(self, tape_path: Path, rows: Iterable[int]) -> Iterator[Dict[str, object]]:
+        """Parse only ``rows`` of the tape, seeking straight to each."""
+        with tape_path.open("rb") as handle:
+            for row in rows:
+                handle.seek(self.offsets[row])
+                yield json.loads(handle.readline())
+
+    def stamp(self, tape_path: Path) -> None:
+        """Record the digest of the ``tape_bytes`` this index covers."""
+        self.tape_digest = _edge_digest(tape_path, self.tape_bytes)
+
+    def matches_tape(self, tape_path: Path) -> bool:
+        return (
+            tape_path.stat().st_size == self.tape_bytes
+            and _edge_digest(tape_path, self.tape_bytes) == self.tape_digest
+        )
+
+    def to_dict(self) -> Dict[str, object]:
+        return {
+            "version": TAPE_INDEX_VERSION,
+            "tape_bytes": self.tape_bytes,
+            "tape_digest": self.tape_digest,
+            "offsets": self.offsets,
+            "steps": self.steps,
+            "run_ids": self.run_ids,
+            "decisions": self.decisions,
+            "symbols": self.symbols,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, object]) -> "TapeIndex":
+        if data.get("version") != TAPE_INDEX_VERSION:
+            raise ValueError(f"Unsupported tape index version: {data.get('version')}")
+        return cls(
+            offsets=list(data["offsets"]),
+            steps=list(data["steps"]),
+            run_ids=dict(data["run_ids"]),
+            decisions=dict(data["decisions"]),
+            symbols=dict(data["symbols"]),
+            tape_bytes=data["tape_bytes"],
+            tape_digest=data["tape_digest"],
+        )
+
+    def save(self, path: Path) -> None:
+        path.write_text(json.dumps(self.to_dict(), separators=(",", ":")))
+
+    @classmethod
+    def load(cls, path: Path) -> "TapeIndex":
+        return cls.from_dict(json.loads(path.read_text()))
+
+    def _rows_for_step(self, step: int) -> List[int]:
+        if self._step_rows is None:
+            step_rows: Dict[int, List[int]] = {}
+            for position, step_index in enumerate(self.steps):
+                step_rows.setdefault(step_index, []).append(position)
+            self._step_rows = step_rows
+        return self._step_rows.get(step, [])
+
+
+def build_tape_index(tape_path: Path) -> TapeIndex:
+    """Index an existing JSONL tape with one sequential scan."""
+    index = TapeIndex()
+    offset = 0
+    with tape_path.open("rb") as handle:
+        for line in handle:
+            if line.strip():
+                index.add(offset, len(line), json.loads(line))
+            offset += len(line)
+    index.tape_bytes = offset
+    index.stamp(tape_path)
+    return index
+
+
+def load_tape_index(tape_path: Path, build: bool = True) -> Optional[TapeIndex]:
+    """The tape's sidecar index, rebuilt and rewritten when missing or stale.
+
+    Returns ``None`` for tapes that are not JSONL (e.g. a ``tape.json``
+    array), or when the sidecar is unusable and ``build`` is false.
+    """
+    if not _is_jsonl(tape_path):
+        return None
+    sidecar = tape_index_path(tape_path)
+    if sidecar.exists():
+        try:
+            index = TapeIndex.load(sidecar)
+        except (ValueError, KeyError):
+            index = None
+        if index is not None and index.matches_tape(tape_path):
+            return index
+    if not build:
+        return None
+    index = build_tape_index(tape_path)
+    try:
+        index.save(sidecar)
+    except OSError:
+        pass
+    return index
+
+
+def _edge_digest(tape_path: Path, size: int) -> str:
+    digest = hashlib.sha256()
+    with tape_path.open("rb") as handle:
+        digest.update(handle.read(min(size, _EDGE_BYTES)))
+        if size > _EDGE_BYTES:
+            handle.seek(max(size - _EDGE_BYTES, _EDGE_BYTES))
+            digest.update(handle.read(size - handle.tell()))
+    return digest.hexdigest()
+
+
+def _is_jsonl(tape_path: Path) -> bool:
+    with tape_path.open("rb") as handle:
+        head = handle.read(64).lstrip()
+    return not head.startswith(b"[")
@@ -1,3 +1,17 @@
+from .log_store import LogRunStore
+from .memory_stores import InMemoryPolicyStore, InMemoryRunStore, InMemoryStateStore
+from .sqlite_stores import SqlitePolicyStore, SqliteRunStore, SqliteStateStore
 from .stores import PolicyStore, RunStore, StateStore
 
-__all__ = ["PolicyStore", "RunStore", "StateStore"]
+__all__ = [
+    "InMemoryPolicyStore",
+    "InMemoryRunStore",
+    "InMemoryStateStore",
+    "LogRunStore",
+    "PolicyStore",
+    "RunStore",
+    "SqlitePolicyStore",
+    "SqliteRunStore",
+    "SqliteStateStore",
+    "StateStore",
+]
@@ -0,0 +1,240 @@
+from __future__ import annotations
+
+import json
+import os
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from services.core.simulator import SimulationResult
+from services.core.simulator.codec import decode_simulation, encode_simulation
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX platforms
+    fcntl = None
+
+
+@dataclass
+class LogRunStore:
+    """Append-only JSONL run log with an in-memory ``run_id -> offset`` index.
+
+    Each run is one compact JSON line written with a single append, so a
+    crash can only leave a torn final line; it is truncated the first time
+    the log is opened. Re-saved run ids supersede earlier lines, and the dead
+    bytes are reclaimed by ``compact`` (started in the background once they
+    pass ``compact_min_bytes`` and ``compact_dead_ratio`` of the file).
+
+    Several processes may share one log: appends and reads hold a shared
+    ``flock`` on a ``.lock`` sidecar, while torn-tail truncation and the
+    compaction rename hold it exclusively. Without ``fcntl`` the store
+    assumes a single writer process.
+    """
+
+    runs_path: Path
+    fsync: bool = False
+    compact_min_bytes: int = 1 << 20
+    compact_dead_ratio: float = 0.5
+    _lock: threading.RLock = field(default_factory=threading.RLock, init=False, repr=False)
+    _index: Dict[str, Tuple[int, int]] = field(default_factory=dict, init=False, repr=False)
+    _indexed_bytes: int = field(default=0, init=False, repr=False)
+    _dead_bytes: int = field(default=0, init=False, repr=False)
+    _file_id: Optional[Tuple[int, int]] = field(default=None, init=False, repr=False)
+    _recovered: bool = field(default=False, init=False, repr=False)
+    _compactor: Optional[threading.Thread] = field(default=None, init=False, repr=False)
+
+    def save_run(self, simulation_result: SimulationResult) -> None:
+        line = encode_simulation(simulation_result) + b"\n"
+        with self._lock:
+            self.runs_path.parent.mkdir(parents=True, exist_ok=True)
+            self._recover()
+            with self._file_lock(exclusive=False):
+                self._refresh()
+                with self.runs_path.open("ab") as handle:
+                    handle.write(line)
+                    handle.flush()
+                    if self.fsync:
+                        os.fsync(handle.fileno())
+                    end = handle.tell()
+                if self._indexed_bytes == end - len(line):
+                    self._index_line(simulation_result.run_id, end - len(line), len(line))
+                    self._indexed_bytes = end
+        self._maybe_compact()
+
+    def get_run(self, run_id: str) -> Optional[SimulationResult]:
+        with self._lock:
+            self._recover()
+            with self._file_lock(exclusive=False):
+                self._refresh()
+                location = self._index.get(run_id)
+                if location is None:
+                    return None
+                offset, length = location
+                with self.runs_path.open("rb") as handle:
+                    handle.seek(offset)
+                    payload = handle.read(length)
+        return decode_simulation(payload)
+
+    def run_ids(self) -> List[str]:
+        with self._lock:
+            self._recover()
+            with self._file_lock(exclusive=False):
+                self._refresh()
+                return list(self._index)
+
+    def compact(self) -> None:
+        """Rewrite the log without superseded lines.
+
+        Live lines are copied from a snapshot of the index without holding
+        any lock, so appends carry on meanwhile. Only copying the lines
+        appended since the snapshot and the rename hold the store lock and
+        the exclusive file lock.
+        """
+        with self._lock:
+            self._recover()
+            with self._file_lock(exclusive=False):
+                self._refresh()
+                if self._file_id is None:
+                    return
+                file_id = self._file_id
+                snapshot_end = self._indexed_bytes
+                live = sorted(self._index.values())
+                source = self.runs_path.open("rb")
+
+        temp_path = self.runs_path.with_suffix(self.runs_path.suffix + ".compact")
+        moved: Dict[int, int] = {}
+        offset = 0
+        with source, temp_path.open("wb") as target:
+            for start, length in live:
+                source.seek(start)
+                target.write(source.read(length))
+                moved[start] = offset
+                offset += length
+
+            with self._lock, self._file_lock(exclusive=True):
+                if self._stat_id() != file_id:
+                    # Another process compacted or replaced the log meanwhile.
+                    target.close()
+                    temp_path.unlink(missing_ok=True)
+                    return
+                source.seek(snapshot_end)
+                tail = source.read()
+                tail = tail[: tail.rfind(b"\n") + 1]
+                target.write(tail)
+                target.flush()
+                os.fsync(target.fileno())
+                os.replace(temp_path, self.runs_path)
+
+                shift = offset - snapshot_end
+                index: Dict[str, Tuple[int, int]] = {}
+                for run_id, (start, length) in sorted(
+                    self._index.items(), key=lambda item: item[1][0]
+                ):
+                    new_start = moved[start] if start < snapshot_end else start + shift
+                    index[run_id] = (new_start, length)
+                self._index = index
+                self._indexed_bytes += shift
+                self._dead_bytes = self._indexed_bytes - sum(
+                    length for _, length in self._index.values()
+                )
+                self._file_id = self._stat_id()
+
+    def wait_for_compaction(self) -> None:
+        compactor = self._compactor
+        if compactor is not None:
+            compactor.join()
+
+    def _maybe_compact(self) -> None:
+        with self._lock:
+            if self._compactor is not None and self._compactor.is_alive():
+                return
+            if self._dead_bytes < self.compact_min_bytes:
+                return
+            if self._dead_bytes < self.compact_dead_ratio * self._indexed_bytes:
+                return
+            self._compactor = threading.Thread(target=self.compact, daemon=True)
+            self._compactor.start()
+
+    @contextmanager
+    def _file_lock(self, exclusive: bool) -> Iterator[None]:
+        if fcntl is None or not self.runs_path.parent.exists():
+            yield
+            return
+        lock_path = self.runs_path.with_suffix(self.runs_path.suffix + ".lock")
+        with lock_path.open("ab") as handle:
+            fcntl.flock(handle.fileno(), fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+            yield
+
+    def _stat_id(self) -> Optional[Tuple[int, int]]:
+        try:
+            stat = self.runs_path.stat()
+        except FileNotFoundError:
+            return None
+        return (stat.st_dev, stat.st_ino)
+
+    def _index_line(self, run_id: str, offset: int, length: int) -> None:
+        previous = self._index.get(run_id)
+        if previous is not None:
+            self._dead_bytes += previous[1]
+        self._index[run_id] = (offset, length)
+
+    def _refresh(self) -> None:
+        file_id = self._stat_id()
+        if file_id != self._file_id:
+            # New, replaced or removed log: index it from scratch.
+            self._index = {}
+            self._indexed_bytes = 0
+            self._dead_bytes = 0
+            self._file_id = file_id
+        if file_id is None:
+            return
+        size = self.runs_path.stat().st_size
+        if size <= self._indexed_bytes:
+            return
+        with self.runs_path.open("rb") as handle:
+            handle.seek(self._indexed_bytes)
+            chunk = handle.read(size - self._indexed_bytes)
+        offset = self._indexed_bytes
+        for line in chunk.splitlines(keepends=True):
+            if not line.endswith(b"\n"):
+                break
+            try:
+                run_id = json.loads(line)["run_id"]
+            except (ValueError, KeyError, TypeError):
+                self._dead_bytes += len(line)
+            else:
+                self._index_line(run_id, offset, len(line))
+            offset += len(line)
+        self._indexed_bytes = offset
+
+    def _recover(self) -> None:
+        if self._recovered:
+            return
+        with self._file_lock(exclusive=True):
+            self._recovered = True
+            if self.runs_path.exists():
+                # Appends hold the shared lock, so an unterminated line seen
+                # under the exclusive lock was left by a crashed writer.
+                self._recover_torn_tail()
+
+    def _recover_torn_tail(self) -> None:
+        with self.runs_path.open("rb+") as handle:
+            size = handle.seek(0, os.SEEK_END)
+            if size == 0:
+                return
+            handle.seek(size - 1)
+            if handle.read(1) == b"\n":
+                return
+            position = size
+            while position > 0:
+                step = min(4096, position)
+                handle.seek(position - step)
+                block = handle.read(step)
+                newline = block.rfind(b"\n")
+                if newline != -1:
+                    position = position - step + newline + 1
+                    break
+                position -= step
+            handle.truncate(position)
@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import copy
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+from services.core.simulator import SimulationResult
+from services.core.state import State
+
+
+@dataclass
+class InMemoryStateStore:
+    _state: Optional[State] = field(default=None, init=False, repr=False)
+
+    def get_current_state(self) -> Optional[State]:
+        return self._state
+
+    def init_state(self, state: State) -> None:
+        self._state = state
+
+    def update_state(self, state: State) -> None:
+        self.init_state(state)
+
+
+@dataclass
+class InMemoryRunStore:
+    """Keeps runs in save order; results are frozen, so they are stored as is."""
+
+    _runs: Dict[str, SimulationResult] = field(default_factory=dict, init=False, repr=False)
+
+    def save_run(self, simulation_result: SimulationResult) -> None:
+        self._runs.pop(simulation_result.run_id, None)
+        self._runs[simulation_result.run_id] = simulation_result
+
+    def get_run(self, run_id: str) -> Optional[SimulationResult]:
+        return self._runs.get(run_id)
+
+    def run_ids(self) -> List[str]:
+        return list(self._runs)
+
+    def runs(self) -> List[SimulationResult]:
+        return list(self._runs.values())
+
+
+@dataclass
+class InMemoryPolicyStore:
+    _policies: Dict[str, dict] = field(default_factory=dict, init=False, repr=False)
+
+    def save_policy(self, policy: dict) -> None:
+        self._policies[policy["policy_id"]] = copy.deepcopy(policy)
+
+    def get_policy(self, policy_id: str) -> Optional[dict]:
+        policy = self._policies.get(policy_id)
+        return copy.deepcopy(policy) if policy is not None else None
@@ -0,0 +1,259 @@
+from __future__ import annotations
+
+import json
+import sqlite3
+import threading
+import time
+import weakref
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+from services.core.simulator import SimulationResult
+from services.core.simulator.codec import (
+    CODEC_FORMATS,
+    decode_simulation,
+    encode_simulation,
+    state_from_dict,
+)
+from services.core.state import State
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS state (
+    state_id TEXT PRIMARY KEY,
+    payload TEXT NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS runs (
+    run_id TEXT PRIMARY KEY,
+    approved INTEGER NOT NULL,
+    rejected_step_index INTEGER,
+    policy_id TEXT,
+    policy_version TEXT,
+    policy_hash TEXT,
+    planner_name TEXT,
+    created_at REAL NOT NULL,
+    payload TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS runs_policy_hash_approved ON runs (policy_hash, approved);
+CREATE INDEX IF NOT EXISTS runs_approved ON runs (approved);
+CREATE INDEX IF NOT EXISTS runs_planner_name ON runs (planner_name);
+CREATE INDEX IF NOT EXISTS runs_created_at ON runs (created_at);
+CREATE TABLE IF NOT EXISTS policies (
+    policy_id TEXT PRIMARY KEY,
+    payload TEXT NOT NULL,
+    updated_at REAL NOT NULL
+);
+"""
+
+BUSY_TIMEOUT_SECONDS = 30.0
+
+_INSERT_RUN = (
+    "INSERT OR REPLACE INTO runs (run_id, approved, rejected_step_index, "
+    "policy_id, policy_version, policy_hash, planner_name, created_at, payload) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)"
+)
+
+
+def connect(db_path: Path) -> sqlite3.Connection:
+    """Open a WAL-mode connection that other local processes can share."""
+    db_path = Path(db_path)
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    connection = sqlite3.connect(
+        db_path,
+        timeout=BUSY_TIMEOUT_SECONDS,
+        check_same_thread=False,
+        isolation_level=None,
+    )
+    connection.execute("PRAGMA journal_mode=WAL")
+    connection.execute("PRAGMA synchronous=NORMAL")
+    connection.executescript(SCHEMA)
+    return connection
+
+
+def _dumps(payload: object) -> str:
+    return json.dumps(payload, separators=(",", ":"))
+
+
+def _commit_runs(connection: sqlite3.Connection, rows: List[Tuple]) -> None:
+    if not rows:
+        return
+    connection.execute("BEGIN IMMEDIATE")
+    try:
+        connection.executemany(_INSERT_RUN, rows)
+    except BaseException:
+        connection.execute("ROLLBACK")
+        raise
+    connection.execute("COMMIT")
+    rows.clear()
+
+
+@dataclass
+class _SqliteStore:
+    db_path: Path
+    _connection: sqlite3.Connection = field(init=False, repr=False)
+    _lock: threading.RLock = field(default_factory=threading.RLock, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._connection = connect(self.db_path)
+
+    def _write(self, sql: str, parameters: tuple) -> None:
+        with self._lock:
+            self._connection.execute(sql, parameters)
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, traceback) -> None:
+        self.close()
+
+
+@dataclass
+class SqliteStateStore(_SqliteStore):
+    state_id: str = "current"
+
+    def get_current_state(self) -> Optional[State]:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT payload FROM state WHERE state_id = ?", (self.state_id,)
+            ).fetchone()
+        if row is None:
+            return None
+        return state_from_dict(json.loads(row[0]))
+
+    def init_state(self, state: State) -> None:
+        self._write(
+            "INSERT OR REPLACE INTO state (state_id, payload, updated_at) VALUES (?, ?, ?)",
+            (self.state_id, _dumps(state.to_dict()), time.time()),
+        )
+
+    def update_state(self, state: State) -> None:
+        self.init_state(state)
+
+
+@dataclass
+class SqliteRunStore(_SqliteStore):
+    """Runs table indexed by policy hash, approval, planner and creation time.
+
+    Saves are buffered and committed in one short ``BEGIN IMMEDIATE``
+    transaction once ``batch_size`` runs are pending or the oldest pending
+    run is ``max_batch_seconds`` old (checked on save), so the write lock is
+    never held between calls. ``get_run`` on the same store sees pending
+    runs; other connections see them once committed. ``flush``, ``close``,
+    leaving a ``with`` block and interpreter exit commit the rest.
+    ``codec="binary"`` stores payloads in the compact binary encoding;
+    either encoding is read back.
+    """
+
+    batch_size: int = 1
+    codec: str = "json"
+    max_batch_seconds: float = 1.0
+    _pending: List[Tuple] = field(default_factory=list, init=False, repr=False)
+    _batch_started: float = field(default=0.0, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        if self.codec not in CODEC_FORMATS:
+            raise ValueError(f"Unsupported codec format: {self.codec}")
+        super().__post_init__()
+        weakref.finalize(self, _commit_runs, self._connection, self._pending)
+
+    def _encode(self, result: SimulationResult) -> object:
+        payload = encode_simulation(result, self.codec)
+        return payload.decode("utf-8") if self.codec == "json" else payload
+
+    def save_run(self, simulation_result: SimulationResult) -> None:
+        result = simulation_result
+        row = (
+            result.run_id,
+            int(result.approved),
+            result.rejected_step_index,
+            result.policy_id,
+            result.policy_version,
+            result.policy_hash,
+            result.planner_name,
+            time.time(),
+            self._encode(result),
+        )
+        with self._lock:
+            if not self._pending:
+                self._batch_started = time.monotonic()
+            self._pending.append(row)
+            if (
+                len(self._pending) >= self.batch_size
+                or time.monotonic() - self._batch_started >= self.max_batch_seconds
+            ):
+                self.flush()
+
+    def flush(self) -> None:
+        with self._lock:
+            _commit_runs(self._connection, self._pending)
+
+    def close(self) -> None:
+        self.flush()
+        super().close()
+
+    def get_run(self, run_id: str) -> Optional[SimulationResult]:
+        with self._lock:
+            pending = [row[-1] for row in self._pending if row[0] == run_id]
+            if pending:
+                return decode_simulation(pending[-1])
+            row = self._connection.execute(
+                "SELECT payload FROM runs WHERE run_id = ?", (run_id,)
+            ).fetchone()
+        if row is None:
+            return None
+        return decode_simulation(row[0])
+
+    def query_runs(
+        self,
+        policy_hash: Optional[str] = None,
+        approved: Optional[bool] = None,
+        planner_name: Optional[str] = None,
+        created_after: Optional[float] = None,
+        limit: Optional[int] = None,
+    ) -> List[str]:
+        """Run ids matching every given filter, oldest first; commits pending runs."""
+        clauses: List[str] = []
+        parameters: List[object] = []
+        for column, value in (
+            ("policy_hash", policy_hash),
+            ("approved", None if approved is None else int(approved)),
+            ("planner_name", planner_name),
+        ):
+            if value is not None:
+                clauses.append(f"{column} = ?")
+                parameters.append(value)
+        if created_after is not None:
+            clauses.append("created_at > ?")
+            parameters.append(created_after)
+        sql = "SELECT run_id FROM runs"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY created_at, rowid"
+        if limit is not None:
+            sql += " LIMIT ?"
+            parameters.append(limit)
+        with self._lock:
+            self.flush()
+            rows = self._connection.execute(sql, parameters).fetchall()
+        return [row[0] for row in rows]
+
+
+@dataclass
+class SqlitePolicyStore(_SqliteStore):
+    def save_policy(self, policy: dict) -> None:
+        self._write(
+            "INSERT OR REPLACE INTO policies (policy_id, payload, updated_at) VALUES (?, ?, ?)",
+            (policy["policy_id"], _dumps(policy), time.time()),
+        )
+
+    def get_policy(self, policy_id: str) -> Optional[dict]:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT payload FROM policies WHERE policy_id = ?", (policy_id,)
+            ).fetchone()
+        return json.loads(row[0]) if row is not None else None
@@ -1,3 +1,28 @@
-from .simulate import SimulationResult, StepResult, simulate_plan
+from .batch import batch_run_id, best_approved, simulate_many
+from .cache import SimulationCache, SimulationCacheStats, simulation_cache_key
+from .codec import decode_simulation, encode_simulation
+from .simulate import (
+    SimulationResult,
+    SimulationVerdict,
+    StepResult,
+    simulate_plan,
+    simulate_plan_lean,
+)
+from .trajectory import DeltaTrajectory
 
-__all__ = ["SimulationResult", "StepResult", "simulate_plan"]
+__all__ = [
+    "DeltaTrajectory",
+    "SimulationCache",
+    "SimulationCacheStats",
+    "SimulationResult",
+    "SimulationVerdict",
+    "StepResult",
+    "batch_run_id",
+    "decode_simulation",
+    "encode_simulation",
+    "best_approved",
+    "simulate_many",
+    "simulate_plan",
+    "simulate_plan_lean",
+    "simulation_cache_key",
+]
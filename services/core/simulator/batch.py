@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import hashlib
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, Union
+from uuid import NAMESPACE_URL, uuid5
+
+from services.core.market import MarketPath
+from services.core.simulator.simulate import (
+    SimulationResult,
+    SimulationVerdict,
+    simulate_plan,
+    simulate_plan_lean,
+)
+from services.core.state import State
+from services.core.transitions import Action
+
+EXECUTORS = ("thread", "process", "serial")
+
+BatchResult = Union[SimulationResult, SimulationVerdict]
+
+_RUN_ID_NAMESPACE = uuid5(NAMESPACE_URL, "executable-world-models/simulate_many")
+
+_WORKER_INPUTS: Optional[Tuple[State, MarketPath, bool, Dict[str, object]]] = None
+
+
+def batch_run_id(batch_id: str, index: int) -> str:
+    return str(uuid5(_RUN_ID_NAMESPACE, f"{batch_id}:{index}"))
+
+
+def _default_batch_id(initial_state: State, plans: Sequence[List[Action]]) -> str:
+    digest = hashlib.sha256(repr(initial_state).encode("utf-8"))
+    for plan in plans:
+        digest.update(repr(plan).encode("utf-8"))
+    return digest.hexdigest()[:16]
+
+
+def _simulate_one(
+    initial_state: State,
+    market_path: MarketPath,
+    lean: bool,
+    metadata: Dict[str, object],
+    plan: List[Action],
+    run_id: str,
+) -> BatchResult:
+    if lean:
+        return simulate_plan_lean(initial_state, plan, market_path)
+    return simulate_plan(initial_state, plan, market_path, run_id=run_id, **metadata)
+
+
+def _init_worker(
+    initial_state: State,
+    market_path: MarketPath,
+    lean: bool,
+    metadata: Dict[str, object],
+) -> None:
+    global _WORKER_INPUTS
+    _WORKER_INPUTS = (initial_state, market_path, lean, metadata)
+
+
+def _simulate_in_worker(task: Tuple[List[Action], str]) -> BatchResult:
+    return _simulate_one(*_WORKER_INPUTS, *task)
+
+
+def simulate_many(
+    initial_state: State,
+    plans: Sequence[List[Action]],
+    market_path: MarketPath,
+    executor: str = "process",
+    max_workers: Optional[int] = None,
+    batch_id: Optional[str] = None,
+    lean: bool = False,
+    policy_id: Optional[str] = None,
+    policy_version: Optional[str] = None,
+    policy_hash: Optional[str] = None,
+    planner_name: Optional[str] = None,
+    planner_metadata: Optional[Dict[str, object]] = None,
+) -> List[BatchResult]:
+    """Simulate candidate plans against one state and path, in input order.
+
+    Run ids are ``uuid5`` values of ``batch_id`` and the plan index, so the
+    same batch always yields the same ids. ``batch_id`` defaults to a digest
+    of the initial state and plans. Process workers receive the state and
+    market path once, through the pool initializer. Simulation is pure Python
+    and holds the GIL, so ``executor="thread"`` only helps callers whose
+    plans spend their time waiting on I/O.
+    """
+    if executor not in EXECUTORS:
+        raise ValueError(f"Unsupported executor: {executor}")
+    batch_id = batch_id or _default_batch_id(initial_state, plans)
+    metadata: Dict[str, object] = {
+        "policy_id": policy_id,
+        "policy_version": policy_version,
+        "policy_hash": policy_hash,
+        "planner_name": planner_name,
+        "planner_metadata": planner_metadata,
+    }
+    tasks = [(list(plan), batch_run_id(batch_id, index)) for index, plan in enumerate(plans)]
+    workers = min(max_workers or os.cpu_count() or 1, max(len(tasks), 1))
+
+    if executor == "serial" or workers == 1 or len(tasks) <= 1:
+        return [
+            _simulate_one(initial_state, market_path, lean, metadata, plan, run_id)
+            for plan, run_id in tasks
+        ]
+
+    if executor == "process":
+        chunksize = max(1, len(tasks) // (workers * 4))
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(initial_state, market_path, lean, metadata),
+        ) as pool:
+            return list(pool.map(_simulate_in_worker, tasks, chunksize=chunksize))
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return list(
+            pool.map(
+                lambda task: _simulate_one(initial_state, market_path, lean, metadata, *task),
+                tasks,
+            )
+        )
+
+
+def best_approved(
+    results: Sequence[BatchResult],
+    score: Callable[[BatchResult], float],
+) -> Optional[int]:
+    """Index of the highest-scoring approved result, or ``None``."""
+    approved = [index for index, result in enumerate(results) if result.approved]
+    if not approved:
+        return None
+    return max(approved, key=lambda index: (score(results[index]), -index))
@@ -0,0 +1,236 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import struct
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import Dict, List, Optional
+from uuid import uuid4
+
+from services.core.market import MarketPath
+from services.core.simulator.codec import decode_simulation, encode_simulation
+from services.core.simulator.simulate import (
+    SimulationResult,
+    StepResult,
+    simulate_plan,
+)
+from services.core.simulator.trajectory import DeltaTrajectory
+from services.core.state import State
+from services.core.transitions import Action
+
+CACHE_KEY_VERSION = 1
+
+
+@dataclass(frozen=True)
+class SimulationCacheStats:
+    hits: int
+    misses: int
+    memory_hits: int
+    disk_hits: int
+    entries: int
+    max_entries: int
+
+
+def simulation_cache_key(
+    initial_state: State,
+    plan: List[Action],
+    market_path: MarketPath,
+    policy_hash: Optional[str] = None,
+) -> str:
+    """Stable hash of everything ``simulate_plan`` reads for a plan.
+
+    Action ``i`` is priced from step ``i`` of the path, so only that slice
+    of the path contributes to the key. Actions past the end of the path,
+    or whose symbol a step lacks, keep their own price: ``simulate_plan``
+    only reaches them if it raises.
+    """
+    n_priced = min(len(plan), len(market_path.steps))
+    price_contexts = [market_path.price_context(index) for index in range(n_priced)]
+    payload = {
+        "version": CACHE_KEY_VERSION,
+        "state": initial_state.to_dict(),
+        "plan": [
+            {
+                "type": action.__class__.__name__,
+                "symbol": action.symbol,
+                "quantity": action.quantity,
+                "price": (
+                    price_contexts[index].get(action.symbol, action.price)
+                    if index < n_priced
+                    else action.price
+                ),
+            }
+            for index, action in enumerate(plan)
+        ],
+        "prices": price_contexts,
+        "policy_hash": policy_hash,
+    }
+    encoded = json.dumps(payload, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def _copy_tree(value):
+    if isinstance(value, dict):
+        return {key: _copy_tree(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_copy_tree(item) for item in value]
+    return value
+
+
+def _copy_step(step: StepResult) -> StepResult:
+    return replace(
+        step,
+        errors=list(step.errors),
+        price_context=dict(step.price_context),
+        state_delta=_copy_tree(step.state_delta),
+    )
+
+
+def _detached(result: SimulationResult) -> SimulationResult:
+    # Cached results are shared; callers get their own steps, errors, deltas
+    # and trajectory. States and actions are frozen and stay shared.
+    trajectory = result.trajectory
+    return replace(
+        result,
+        steps=[_copy_step(step) for step in result.steps],
+        trajectory=(
+            trajectory.copy() if isinstance(trajectory, DeltaTrajectory) else list(trajectory)
+        ),
+    )
+
+
+class SimulationCache:
+    """Memoizes ``simulate_plan`` results by content hash.
+
+    Results live in an in-memory LRU and, when ``cache_dir`` is set, as one
+    JSON file per key on disk. A hit returns a copy of the stored result
+    under a fresh run id with the caller's policy and planner metadata;
+    unreadable disk entries are misses and are removed.
+    """
+
+    def __init__(self, max_entries: int = 256, cache_dir: Path | None = None) -> None:
+        self.max_entries = max_entries
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        self.hits = 0
+        self.misses = 0
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self._entries: OrderedDict[str, SimulationResult] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def simulate(
+        self,
+        initial_state: State,
+        plan: List[Action],
+        market_path: MarketPath,
+        policy_id: Optional[str] = None,
+        policy_version: Optional[str] = None,
+        policy_hash: Optional[str] = None,
+        planner_name: Optional[str] = None,
+        planner_metadata: Optional[Dict[str, object]] = None,
+        run_id: Optional[str] = None,
+    ) -> SimulationResult:
+        key = simulation_cache_key(initial_state, plan, market_path, policy_hash)
+        cached = self.get(key)
+        if cached is None:
+            result = simulate_plan(
+                initial_state,
+                plan,
+                market_path,
+                policy_id=policy_id,
+                policy_version=policy_version,
+                policy_hash=policy_hash,
+                planner_name=planner_name,
+                planner_metadata=planner_metadata,
+                run_id=run_id,
+            )
+            self.put(key, result)
+            return result
+        return replace(
+            cached,
+            run_id=run_id or str(uuid4()),
+            policy_id=policy_id,
+            policy_version=policy_version,
+            planner_name=planner_name,
+            planner_metadata=planner_metadata,
+        )
+
+    def get(self, key: str) -> Optional[SimulationResult]:
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                self.memory_hits += 1
+                return _detached(cached)
+
+        cached = self._read_disk(key)
+        with self._lock:
+            if cached is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self.disk_hits += 1
+            self._remember(key, cached)
+        return _detached(cached)
+
+    def put(self, key: str, result: SimulationResult) -> None:
+        with self._lock:
+            self._remember(key, _detached(result))
+        self._write_disk(key, result)
+
+    def stats(self) -> SimulationCacheStats:
+        with self._lock:
+            return SimulationCacheStats(
+                hits=self.hits,
+                misses=self.misses,
+                memory_hits=self.memory_hits,
+                disk_hits=self.disk_hits,
+                entries=len(self._entries),
+                max_entries=self.max_entries,
+            )
+
+    def clear(self, disk: bool = False) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.memory_hits = self.disk_hits = 0
+        if disk and self.cache_dir is not None and self.cache_dir.exists():
+            for path in self.cache_dir.glob("*.json"):
+                path.unlink(missing_ok=True)
+
+    def _remember(self, key: str, result: SimulationResult) -> None:
+        self._entries[key] = result
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _disk_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def _read_disk(self, key: str) -> Optional[SimulationResult]:
+        if self.cache_dir is None:
+            return None
+        path = self._disk_path(key)
+        try:
+            payload = path.read_bytes()
+        except FileNotFoundError:
+            return None
+        try:
+            return decode_simulation(payload)
+        except (ValueError, IndexError, KeyError, TypeError, struct.error):
+            # Truncated, corrupt or wrong-version entry; the next put rewrites it.
+            path.unlink(missing_ok=True)
+            return None
+
+    def _write_disk(self, key: str, result: SimulationResult) -> None:
+        if self.cache_dir is None:
+            return
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        path = self._disk_path(key)
+        temp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        temp_path.write_bytes(encode_simulation(result))
+        os.replace(temp_path, path)
@@ -0,0 +1,306 @@
+from __future__ import annotations
+
+import json
+import struct
+from typing import Dict, Sequence
+
+from services.core.actions import PlaceBuy, PlaceSell
+from services.core.simulator.simulate import SimulationResult, StepResult
+from services.core.simulator.trajectory import DeltaTrajectory
+from services.core.state import RiskLimits, State
+from services.core.verifier import VerificationError
+
+CODEC_VERSION = 2
+CODEC_FORMATS = ("json", "binary")
+
+# Binary payloads start with MAGIC and a version byte; JSON payloads start with "{".
+MAGIC = b"EWMS"
+
+_NONE, _FALSE, _TRUE, _INT, _FLOAT, _STR, _LIST, _DICT = range(8)
+_DOUBLE = struct.Struct("<d")
+
+
+def step_to_dict(step: StepResult) -> Dict[str, object]:
+    return {
+        "step_index": step.step_index,
+        "action": {
+            "type": step.action.__class__.__name__,
+            "symbol": step.action.symbol,
+            "quantity": step.action.quantity,
+            "price": step.action.price,
+        },
+        "accepted": step.accepted,
+        "errors": [{"code": error.code, "message": error.message} for error in step.errors],
+        "price_context": step.price_context,
+        "explanation": step.explanation,
+        "state_delta": step.state_delta,
+    }
+
+
+def simulation_to_dict(result: SimulationResult) -> Dict[str, object]:
+    """The JSON document stored for a run by every run store."""
+    return {
+        "run_id": result.run_id,
+        "approved": result.approved,
+        "rejected_step_index": result.rejected_step_index,
+        "planner": {
+            "planner_name": result.planner_name,
+            "planner_metadata": result.planner_metadata,
+        },
+        "policy": {
+            "policy_id": result.policy_id,
+            "policy_version": result.policy_version,
+            "policy_hash": result.policy_hash,
+        },
+        "trajectory": trajectory_to_payload(result.trajectory),
+        "steps": [step_to_dict(step) for step in result.steps],
+    }
+
+
+def trajectory_to_payload(trajectory: Sequence[State]) -> object:
+    """Delta-encoded trajectory document; see ``DeltaTrajectory.to_dict``."""
+    if isinstance(trajectory, DeltaTrajectory):
+        return trajectory.to_dict()
+    if not trajectory:
+        return []
+    return DeltaTrajectory.from_states(trajectory).to_dict()
+
+
+def trajectory_from_payload(payload: object) -> Sequence[State]:
+    """Reads delta documents as well as the older list-of-states layout."""
+    if isinstance(payload, list):
+        states = [state_from_dict(state) for state in payload]
+        return DeltaTrajectory.from_states(states) if states else []
+    if payload.get("encoding") != "delta":
+        raise ValueError("Unsupported trajectory payload")
+    return DeltaTrajectory.from_dict(payload)
+
+
+def state_from_dict(data: dict) -> State:
+    risk_limits = data["risk_limits"]
+    return State(
+        cash_balance=data["cash_balance"],
+        positions=data.get("positions", {}),
+        exposure=data.get("exposure", 0.0),
+        risk_limits=RiskLimits(
+            max_leverage=risk_limits["max_leverage"],
+            max_position_pct=risk_limits["max_position_pct"],
+            max_position_value=risk_limits["max_position_value"],
+        ),
+    )
+
+
+def _action_from_dict(payload: dict):
+    if payload["type"] == "PlaceBuy":
+        return PlaceBuy(payload["symbol"], payload["quantity"], payload["price"])
+    return PlaceSell(payload["symbol"], payload["quantity"], payload["price"])
+
+
+def _step_from_dict(step: dict) -> StepResult:
+    return StepResult(
+        step_index=step["step_index"],
+        action=_action_from_dict(step["action"]),
+        accepted=step["accepted"],
+        errors=[
+            VerificationError(code=error["code"], message=error["message"])
+            for error in step["errors"]
+        ],
+        price_context=step["price_context"],
+        explanation=step.get("explanation", ""),
+        state_delta=step.get("state_delta", {}),
+    )
+
+
+def simulation_from_dict(data: dict) -> SimulationResult:
+    policy = data.get("policy", {})
+    planner = data.get("planner", {})
+    return SimulationResult(
+        run_id=data["run_id"],
+        trajectory=trajectory_from_payload(data["trajectory"]),
+        steps=[_step_from_dict(step) for step in data["steps"]],
+        approved=data["approved"],
+        rejected_step_index=data.get("rejected_step_index"),
+        policy_id=policy.get("policy_id"),
+        policy_version=policy.get("policy_version"),
+        policy_hash=policy.get("policy_hash"),
+        planner_name=planner.get("planner_name"),
+        planner_metadata=planner.get("planner_metadata"),
+    )
+
+
+def trajectory_payload(result: SimulationResult) -> Dict[str, object]:
+    return {
+        "run_id": result.run_id,
+        "trajectory": trajectory_to_payload(result.trajectory),
+        "steps": [step_to_dict(step) for step in result.steps],
+    }
+
+
+def decision_payload(result: SimulationResult) -> Dict[str, object]:
+    return {
+        "run_id": result.run_id,
+        "approved": result.approved,
+        "rejected_step_index": result.rejected_step_index,
+        "errors": [
+            {
+                "step_index": step.step_index,
+                "errors": [
+                    {"code": error.code, "message": error.message} for error in step.errors
+                ],
+            }
+            for step in result.steps
+            if step.errors
+        ],
+        "planner": {
+            "planner_name": result.planner_name,
+            "planner_metadata": result.planner_metadata,
+        },
+        "policy": {
+            "policy_id": result.policy_id,
+            "policy_version": result.policy_version,
+            "policy_hash": result.policy_hash,
+        },
+    }
+
+
+def deltas_payload(result: SimulationResult) -> Dict[str, object]:
+    return {
+        "run_id": result.run_id,
+        "deltas": [step.state_delta for step in result.steps],
+    }
+
+
+def encode_simulation(result: SimulationResult, format: str = "json") -> bytes:
+    """Serialize a run as compact JSON or as the interned binary format."""
+    if format == "json":
+        return json.dumps(simulation_to_dict(result), separators=(",", ":")).encode("utf-8")
+    if format == "binary":
+        return _BinaryEncoder().encode(simulation_to_dict(result))
+    raise ValueError(f"Unsupported codec format: {format}")
+
+
+def decode_simulation(payload: bytes) -> SimulationResult:
+    """Inverse of ``encode_simulation``; the format is detected from the header."""
+    if isinstance(payload, str):
+        payload = payload.encode("utf-8")
+    if payload[: len(MAGIC)] == MAGIC:
+        return simulation_from_dict(_BinaryDecoder(payload).decode())
+    return simulation_from_dict(json.loads(payload))
+
+
+def _write_varint(out: bytearray, value: int) -> None:
+    while value > 0x7F:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+class _BinaryEncoder:
+    """Tagged, length-prefixed values with every string stored once up front."""
+
+    def __init__(self) -> None:
+        self._strings: Dict[str, int] = {}
+        self._body = bytearray()
+
+    def encode(self, value: object) -> bytes:
+        self._value(value)
+        out = bytearray(MAGIC)
+        out.append(CODEC_VERSION)
+        _write_varint(out, len(self._strings))
+        for text in self._strings:
+            raw = text.encode("utf-8")
+            _write_varint(out, len(raw))
+            out += raw
+        out += self._body
+        return bytes(out)
+
+    def _string(self, text: str) -> None:
+        index = self._strings.get(text)
+        if index is None:
+            index = self._strings[text] = len(self._strings)
+        _write_varint(self._body, index)
+
+    def _value(self, value: object) -> None:
+        body = self._body
+        if value is None:
+            body.append(_NONE)
+        elif value is True:
+            body.append(_TRUE)
+        elif value is False:
+            body.append(_FALSE)
+        elif isinstance(value, float):
+            body.append(_FLOAT)
+            body += _DOUBLE.pack(value)
+        elif isinstance(value, int):
+            body.append(_INT)
+            _write_varint(body, value << 1 if value >= 0 else (-value << 1) - 1)
+        elif isinstance(value, str):
+            body.append(_STR)
+            self._string(value)
+        elif isinstance(value, (list, tuple)):
+            body.append(_LIST)
+            _write_varint(body, len(value))
+            for item in value:
+                self._value(item)
+        elif isinstance(value, dict):
+            body.append(_DICT)
+            _write_varint(body, len(value))
+            for key, item in value.items():
+                self._string(str(key))
+                self._value(item)
+        else:
+            raise ValueError(f"Cannot encode value of type {type(value).__name__}")
+
+
+class _BinaryDecoder:
+    def __init__(self, payload: bytes) -> None:
+        if payload[len(MAGIC)] != CODEC_VERSION:
+            raise ValueError(f"Unsupported codec version: {payload[len(MAGIC)]}")
+        self._payload = payload
+        self._offset = len(MAGIC) + 1
+        count = self._varint()
+        strings = []
+        for _ in range(count):
+            length = self._varint()
+            end = self._offset + length
+            strings.append(payload[self._offset : end].decode("utf-8"))
+            self._offset = end
+        self._strings = strings
+
+    def decode(self) -> object:
+        return self._value()
+
+    def _varint(self) -> int:
+        payload = self._payload
+        result = shift = 0
+        while True:
+            byte = payload[self._offset]
+            self._offset += 1
+            result |= (byte & 0x7F) << shift
+            if byte < 0x80:
+                return result
+            shift += 7
+
+    def _value(self) -> object:
+        tag = self._payload[self._offset]
+        self._offset += 1
+        if tag == _FLOAT:
+            (value,) = _DOUBLE.unpack_from(self._payload, self._offset)
+            self._offset += 8
+            return value
+        if tag == _STR:
+            return self._strings[self._varint()]
+        if tag == _INT:
+            raw = self._varint()
+            return raw >> 1 if not raw & 1 else -((raw + 1) >> 1)
+        if tag == _DICT:
+            return {self._strings[self._varint()]: self._value() for _ in range(self._varint())}
+        if tag == _LIST:
+            return [self._value() for _ in range(self._varint())]
+        if tag == _NONE:
+            return None
+        if tag == _TRUE:
+            return True
+        if tag == _FALSE:
+            return False
+        raise ValueError(f"Unknown codec tag: {tag}")
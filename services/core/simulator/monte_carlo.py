@@ -0,0 +1,205 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, replace
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+from services.core.actions import PlaceBuy, PlaceSell
+from services.core.market.generator import GENERATOR_MODES, generate_market_path
+from services.core.state import State
+from services.core.transitions import Action
+
+EQUITY_QUANTILES = (0.05, 0.25, 0.5, 0.75, 0.95)
+
+
+@dataclass(frozen=True)
+class MonteCarloResult:
+    """Outcome of one plan simulated over many market paths.
+
+    ``rejected_step_index`` is -1 for approved paths. ``final_equity`` values
+    each path's last accepted state at the prices of the plan's last step.
+    ``rejection_reasons`` counts rejected paths per verifier error code.
+    """
+
+    symbols: List[str]
+    seeds: List[int]
+    approved: np.ndarray
+    rejected_step_index: np.ndarray
+    final_equity: np.ndarray
+    rejection_reasons: Dict[str, int]
+
+    @property
+    def n_paths(self) -> int:
+        return int(self.approved.shape[0])
+
+    @property
+    def approval_rate(self) -> float:
+        return float(self.approved.mean()) if self.n_paths else 0.0
+
+    def rejection_step_counts(self) -> Dict[int, int]:
+        steps, counts = np.unique(
+            self.rejected_step_index[~self.approved], return_counts=True
+        )
+        return {int(step): int(count) for step, count in zip(steps, counts)}
+
+    def equity_quantiles(self) -> Dict[str, float]:
+        values = np.quantile(self.final_equity, EQUITY_QUANTILES)
+        return {f"p{round(q * 100)}": float(value) for q, value in zip(EQUITY_QUANTILES, values)}
+
+    def to_dict(self) -> Dict[str, object]:
+        return {
+            "n_paths": self.n_paths,
+            "approval_rate": self.approval_rate,
+            "rejection_steps": self.rejection_step_counts(),
+            "rejection_reasons": dict(self.rejection_reasons),
+            "equity": {
+                "mean": float(self.final_equity.mean()),
+                "std": float(self.final_equity.std()),
+                "min": float(self.final_equity.min()),
+                "max": float(self.final_equity.max()),
+                **self.equity_quantiles(),
+            },
+        }
+
+
+def generate_price_paths(
+    tickers: List[str],
+    n_paths: int,
+    n_steps: int,
+    seed: int = 0,
+    baselines: Optional[Dict[str, float]] = None,
+    mode: str = "vectorized",
+) -> np.ndarray:
+    """Stack ``generate_market_path`` outputs for seeds ``seed .. seed + n_paths - 1``.
+
+    Returns a ``(paths, steps, symbols)`` price array in ticker order.
+    """
+    if n_paths <= 0:
+        raise ValueError("n_paths must be positive.")
+    if mode not in GENERATOR_MODES:
+        raise ValueError(f"Unknown generator mode: {mode}")
+    prices = None
+    for index in range(n_paths):
+        path = generate_market_path(
+            tickers, n_steps=n_steps, seed=seed + index, baselines=baselines, mode=mode
+        )
+        columnar = path if mode == "vectorized" else path.to_columnar()
+        if prices is None:
+            prices = np.empty((n_paths,) + columnar.prices.shape, dtype=np.float64)
+        prices[index] = columnar.prices
+    return prices
+
+
+def simulate_plan_paths(
+    initial_state: State,
+    plan: Sequence[Action],
+    symbols: List[str],
+    prices: np.ndarray,
+) -> MonteCarloResult:
+    """Run ``plan`` on every path of a ``(paths, steps, symbols)`` price array.
+
+    Cash and positions are ``paths``-long and ``paths x symbols`` arrays, and
+    each verifier check is a boolean mask. Action ``i`` is priced at step
+    ``i`` as in ``simulate_plan``, and the arithmetic matches it operation
+    for operation, so each path's approval and rejection step agree with a
+    single-path run. Initial positions in symbols outside ``symbols`` are
+    never priced and are left out.
+    """
+    if prices.ndim != 3 or prices.shape[2] != len(symbols):
+        raise ValueError("prices must be shaped (paths, steps, symbols).")
+    n_paths, n_steps, _ = prices.shape
+    if len(plan) > n_steps:
+        raise ValueError("Plan is longer than the market paths.")
+    columns = {symbol: column for column, symbol in enumerate(symbols)}
+    for action in plan:
+        if action.symbol not in columns:
+            raise ValueError(f"Plan symbol {action.symbol!r} is not on the market paths.")
+
+    limits = initial_state.risk_limits
+    cash = np.full(n_paths, initial_state.cash_balance, dtype=np.float64)
+    positions = np.zeros((n_paths, len(symbols)), dtype=np.float64)
+    for symbol, quantity in initial_state.positions.items():
+        if symbol in columns:
+            positions[:, columns[symbol]] = quantity
+    alive = np.ones(n_paths, dtype=bool)
+    rejected_step = np.full(n_paths, -1, dtype=np.int64)
+    reasons: Dict[str, int] = {}
+
+    for step_index, action in enumerate(plan):
+        if not alive.any():
+            break
+        column = columns[action.symbol]
+        price = prices[:, step_index, column]
+        current = positions[:, column]
+        equity = cash + current * price
+        failures: Dict[str, np.ndarray] = {}
+
+        invalid = price <= 0
+        if action.quantity <= 0:
+            invalid = np.ones(n_paths, dtype=bool)
+        failures["invalid_action"] = invalid
+        notional = action.quantity * price
+        if isinstance(action, PlaceBuy):
+            failures["insufficient_cash"] = notional > cash
+            projected = current + action.quantity
+        elif isinstance(action, PlaceSell):
+            failures["insufficient_position"] = action.quantity > current
+            projected = current - action.quantity
+        else:
+            raise TypeError("Unsupported action type")
+
+        position_value = np.abs(projected * price)
+        solvent = equity > 0
+        with np.errstate(divide="ignore", invalid="ignore"):
+            weight = position_value / equity
+        failures["invalid_equity"] = ~solvent
+        failures["leverage_limit"] = solvent & (weight > limits.max_leverage)
+        failures["position_value_limit"] = solvent & (position_value > limits.max_position_value)
+        failures["position_concentration"] = solvent & (weight > limits.max_position_pct)
+
+        rejected = np.zeros(n_paths, dtype=bool)
+        for mask in failures.values():
+            rejected |= mask
+        rejected &= alive
+        for code, mask in failures.items():
+            count = int(np.count_nonzero(mask & rejected))
+            if count:
+                reasons[code] = reasons.get(code, 0) + count
+        rejected_step[rejected] = step_index
+        alive &= ~rejected
+
+        if isinstance(action, PlaceBuy):
+            np.subtract(cash, notional, out=cash, where=alive)
+        else:
+            np.add(cash, notional, out=cash, where=alive)
+        positions[:, column] = np.where(alive, projected, current)
+
+    valuation = prices[:, max(len(plan) - 1, 0), :]
+    final_equity = cash + (positions * valuation).sum(axis=1)
+    return MonteCarloResult(
+        symbols=list(symbols),
+        seeds=[],
+        approved=rejected_step < 0,
+        rejected_step_index=rejected_step,
+        final_equity=final_equity,
+        rejection_reasons=reasons,
+    )
+
+
+def simulate_monte_carlo(
+    initial_state: State,
+    plan: Sequence[Action],
+    tickers: List[str],
+    n_paths: int,
+    n_steps: Optional[int] = None,
+    seed: int = 0,
+    baselines: Optional[Dict[str, float]] = None,
+    mode: str = "vectorized",
+) -> MonteCarloResult:
+    """Simulate ``plan`` on ``n_paths`` generated paths, one seed per path."""
+    n_steps = n_steps or max(len(plan), 1)
+    prices = generate_price_paths(tickers, n_paths, n_steps, seed, baselines, mode)
+    symbols = [ticker.strip().upper() for ticker in tickers if ticker]
+    result = simulate_plan_paths(initial_state, plan, symbols, prices)
+    return replace(result, seeds=list(range(seed, seed + n_paths)))
@@ -1,11 +1,14 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, replace
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Sequence
 from uuid import uuid4
 
 from services.core.actions import PlaceBuy, PlaceSell
+from services.core.deltas.compute import compute_state_delta
+from services.core.explain.explain import explain_transition
 from services.core.market import MarketPath
+from services.core.simulator.trajectory import DeltaTrajectory
 from services.core.state import State
 from services.core.transitions import Action, TransitionResult, apply_action
 from services.core.verifier import VerificationError, VerificationResult, verify_transition
@@ -25,7 +28,7 @@ class StepResult:
 @dataclass(frozen=True)
 class SimulationResult:
     run_id: str
-    trajectory: List[State]
+    trajectory: Sequence[State]
     steps: List[StepResult]
     approved: bool
     rejected_step_index: Optional[int]
@@ -36,6 +39,15 @@ class SimulationResult:
     planner_metadata: Optional[Dict[str, object]] = None
 
 
+@dataclass(frozen=True)
+class SimulationVerdict:
+    approved: bool
+    rejected_step_index: Optional[int]
+    final_state: State
+    steps_evaluated: int
+    errors: List[VerificationError]
+
+
 def _apply_market_price(action: Action, price_context: dict) -> Action:
     price = price_context[action.symbol]
     if isinstance(action, PlaceBuy):
@@ -54,8 +66,9 @@ def simulate_plan(
     policy_hash: Optional[str] = None,
     planner_name: Optional[str] = None,
     planner_metadata: Optional[Dict[str, object]] = None,
+    run_id: Optional[str] = None,
 ) -> SimulationResult:
-    trajectory: List[State] = [initial_state]
+    trajectory = DeltaTrajectory(initial_state)
     step_results: List[StepResult] = []
     rejected_index: Optional[int] = None
 
@@ -76,9 +89,6 @@ def simulate_plan(
             )
             next_state = trajectory[-1]
 
-        from services.core.deltas.compute import compute_state_delta
-        from services.core.explain.explain import explain_transition
-
         state_delta = compute_state_delta(transition.prior, next_state, price_context)
         explanation = explain_transition(
             transition.prior,
@@ -104,12 +114,12 @@ def simulate_plan(
             rejected_index = step_index
             break
 
-        trajectory.append(next_state)
+        trajectory.append(next_state, changed_symbols=(priced_action.symbol,))
 
     approved = rejected_index is None
 
     return SimulationResult(
-        run_id=str(uuid4()),
+        run_id=run_id or str(uuid4()),
         trajectory=trajectory,
         steps=step_results,
         approved=approved,
@@ -120,3 +130,40 @@ def simulate_plan(
         planner_name=planner_name,
         planner_metadata=planner_metadata,
     )
+
+
+def simulate_plan_lean(
+    initial_state: State,
+    plan: List[Action],
+    market_path: MarketPath,
+) -> SimulationVerdict:
+    """Verify a plan without explanations, deltas or a retained trajectory.
+
+    Accepts and rejects exactly like ``simulate_plan``; ``final_state`` is the
+    last accepted state and ``errors`` are those of the rejected step.
+    """
+    steps = market_path.steps
+    state = initial_state
+
+    for step_index, action in enumerate(plan):
+        if step_index >= len(steps):
+            raise IndexError("Step index out of range")
+        priced_action = _apply_market_price(action, steps[step_index])
+        verification = verify_transition(state, priced_action)
+        if not verification.accepted:
+            return SimulationVerdict(
+                approved=False,
+                rejected_step_index=step_index,
+                final_state=state,
+                steps_evaluated=step_index + 1,
+                errors=verification.errors,
+            )
+        state = apply_action(state, priced_action).next_state
+
+    return SimulationVerdict(
+        approved=True,
+        rejected_step_index=None,
+        final_state=state,
+        steps_evaluated=len(plan),
+        errors=[],
+    )
@@ -0,0 +1,186 @@
+from __future__ import annotations
+
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union, overload
+
+from services.core.state import RiskLimits, State
+
+SNAPSHOT_INTERVAL = 256
+
+# (cash_balance, exposure, changed positions, risk limits if changed); a
+# position of ``None`` means the symbol was dropped.
+_Delta = Tuple[float, float, Dict[str, Optional[float]], Optional[RiskLimits]]
+
+
+class DeltaTrajectory(Sequence[State]):
+    """Append-only sequence of states stored as sparse per-step deltas.
+
+    Each appended state keeps its cash, exposure and only the positions that
+    changed; a full snapshot is kept every ``snapshot_interval`` states so any
+    index is rebuilt by replaying at most that many deltas. The last state
+    is kept as is.
+    """
+
+    def __init__(self, initial_state: State, snapshot_interval: int = SNAPSHOT_INTERVAL) -> None:
+        if snapshot_interval < 1:
+            raise ValueError("snapshot_interval must be positive")
+        self.snapshot_interval = snapshot_interval
+        self._deltas: List[Optional[_Delta]] = [None]
+        self._snapshots: List[State] = [initial_state]
+        self._last = initial_state
+        self._cursor: Tuple[int, State] = (0, initial_state)
+
+    @classmethod
+    def from_states(
+        cls, states: Iterable[State], snapshot_interval: int = SNAPSHOT_INTERVAL
+    ) -> "DeltaTrajectory":
+        iterator = iter(states)
+        trajectory = cls(next(iterator), snapshot_interval)
+        for state in iterator:
+            trajectory.append(state)
+        return trajectory
+
+    def append(self, state: State, changed_symbols: Optional[Iterable[str]] = None) -> None:
+        """Record ``state`` after the current last state.
+
+        ``changed_symbols`` limits the position diff to those symbols; callers
+        passing it guarantee no other position changed.
+        """
+        previous = self._last
+        before, after = previous.positions, state.positions
+        changes: Dict[str, Optional[float]] = {}
+        if changed_symbols is None:
+            for symbol, quantity in after.items():
+                if symbol not in before or before[symbol] != quantity:
+                    changes[symbol] = quantity
+            for symbol in before:
+                if symbol not in after:
+                    changes[symbol] = None
+        else:
+            for symbol in changed_symbols:
+                quantity = after.get(symbol)
+                if quantity != before.get(symbol) or (symbol in before) != (symbol in after):
+                    changes[symbol] = quantity
+        risk_limits = state.risk_limits if state.risk_limits != previous.risk_limits else None
+        self._deltas.append((state.cash_balance, state.exposure, changes, risk_limits))
+        if (len(self._deltas) - 1) % self.snapshot_interval == 0:
+            self._snapshots.append(state)
+        self._last = state
+
+    def copy(self) -> "DeltaTrajectory":
+        """Trajectory that can be appended to without affecting this one."""
+        clone = DeltaTrajectory(self._snapshots[0], self.snapshot_interval)
+        clone._deltas = list(self._deltas)
+        clone._snapshots = list(self._snapshots)
+        clone._last = self._last
+        return clone
+
+    def __len__(self) -> int:
+        return len(self._deltas)
+
+    @overload
+    def __getitem__(self, index: int) -> State: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[State]: ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[State, List[State]]:
+        if isinstance(index, slice):
+            return [self._state_at(position) for position in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("Trajectory index out of range")
+        return self._state_at(index)
+
+    def __iter__(self) -> Iterator[State]:
+        state = self._snapshots[0]
+        yield state
+        for delta in self._deltas[1:]:
+            state = _apply_delta(state, delta)
+            yield state
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Sequence) or isinstance(other, (str, bytes)):
+            return NotImplemented
+        return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"DeltaTrajectory(len={len(self)}, last={self._last!r})"
+
+    def to_dict(self) -> Dict[str, object]:
+        deltas = []
+        for cash_balance, exposure, changes, risk_limits in self._deltas[1:]:
+            payload: Dict[str, object] = {
+                "cash_balance": cash_balance,
+                "exposure": exposure,
+                "positions": changes,
+            }
+            if risk_limits is not None:
+                payload["risk_limits"] = _risk_limits_dict(risk_limits)
+            deltas.append(payload)
+        return {"encoding": "delta", "initial": self._snapshots[0].to_dict(), "deltas": deltas}
+
+    @classmethod
+    def from_dict(
+        cls, data: Dict[str, object], snapshot_interval: int = SNAPSHOT_INTERVAL
+    ) -> "DeltaTrajectory":
+        from services.core.simulator.codec import state_from_dict
+
+        trajectory = cls(state_from_dict(data["initial"]), snapshot_interval)
+        for payload in data["deltas"]:
+            limits = payload.get("risk_limits")
+            delta: _Delta = (
+                payload["cash_balance"],
+                payload["exposure"],
+                payload["positions"],
+                RiskLimits(**limits) if limits is not None else None,
+            )
+            trajectory._append_delta(delta)
+        return trajectory
+
+    def _append_delta(self, delta: _Delta) -> None:
+        self._last = _apply_delta(self._last, delta)
+        self._deltas.append(delta)
+        if (len(self._deltas) - 1) % self.snapshot_interval == 0:
+            self._snapshots.append(self._last)
+
+    def _state_at(self, index: int) -> State:
+        if index == len(self) - 1:
+            return self._last
+        cursor_index, cursor_state = self._cursor
+        snapshot_index = index - index % self.snapshot_interval
+        if snapshot_index <= cursor_index <= index:
+            start, state = cursor_index, cursor_state
+        else:
+            start, state = snapshot_index, self._snapshots[snapshot_index // self.snapshot_interval]
+        for position in range(start + 1, index + 1):
+            state = _apply_delta(state, self._deltas[position])
+        self._cursor = (index, state)
+        return state
+
+
+def _apply_delta(state: State, delta: _Delta) -> State:
+    cash_balance, exposure, changes, risk_limits = delta
+    positions = dict(state.positions)
+    for symbol, quantity in changes.items():
+        if quantity is None:
+            positions.pop(symbol, None)
+        else:
+            positions[symbol] = quantity
+    # type(state) keeps a CompactState trajectory compact when rebuilt.
+    return type(state)(
+        cash_balance=cash_balance,
+        positions=positions,
+        exposure=exposure,
+        risk_limits=risk_limits if risk_limits is not None else state.risk_limits,
+    )
+
+
+def _risk_limits_dict(risk_limits: RiskLimits) -> Dict[str, float]:
+    return {
+        "max_leverage": risk_limits.max_leverage,
+        "max_position_pct": risk_limits.max_position_pct,
+        "max_position_value": risk_limits.max_position_value,
+    }
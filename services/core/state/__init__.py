@@ -1,3 +1,4 @@
+from .compact import CompactState
 from .models import RiskLimits, State
 
-__all__ = ["RiskLimits", "State"]
+__all__ = ["CompactState", "RiskLimits", "State"]
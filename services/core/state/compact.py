@@ -0,0 +1,205 @@
+from __future__ import annotations
+
+import sys
+import weakref
+from array import array
+from typing import Dict, Iterator, Mapping, Optional, Tuple
+
+from services.core.state.models import RiskLimits, State
+
+
+class _PositionsView(Mapping[str, float]):
+    __slots__ = ("_slots", "_quantities")
+
+    def __init__(self, slots: Dict[str, int], quantities: array) -> None:
+        self._slots = slots
+        self._quantities = quantities
+
+    def __getitem__(self, symbol: str) -> float:
+        return self._quantities[self._slots[symbol]]
+
+    def __contains__(self, symbol: object) -> bool:
+        return symbol in self._slots
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._slots)
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def __repr__(self) -> str:
+        return repr(dict(self))
+
+
+class CompactState(State):
+    """``State`` subclass for wide portfolios.
+
+    Positions live in a float array indexed through a ``symbol -> slot``
+    table of interned symbols. ``with_position`` copies the array (one
+    memcpy, still O(P)) and shares the table unless a new symbol is added,
+    and records which symbol changed so deltas and trajectories skip the
+    full position diff. ``equity`` and ``exposure_value`` are not cached:
+    they sum every priced position in ``State``'s order so results match
+    exactly. Quantities are stored as floats.
+    """
+
+    def __init__(
+        self,
+        cash_balance: float,
+        positions: Optional[Mapping[str, float]] = None,
+        exposure: float = 0.0,
+        risk_limits: Optional[RiskLimits] = None,
+    ) -> None:
+        positions = positions or {}
+        self._init(
+            cash_balance,
+            exposure,
+            risk_limits if risk_limits is not None else State(cash_balance=0.0).risk_limits,
+            {sys.intern(symbol): slot for slot, symbol in enumerate(positions)},
+            array("d", positions.values()),
+            None,
+            None,
+        )
+
+    def _init(
+        self,
+        cash_balance: float,
+        exposure: float,
+        risk_limits: RiskLimits,
+        slots: Dict[str, int],
+        quantities: array,
+        parent: Optional["weakref.ref[CompactState]"],
+        changed: Optional[str],
+    ) -> None:
+        setter = object.__setattr__
+        setter(self, "cash_balance", cash_balance)
+        setter(self, "exposure", exposure)
+        setter(self, "risk_limits", risk_limits)
+        setter(self, "_slots", slots)
+        setter(self, "_quantities", quantities)
+        setter(self, "_view", _PositionsView(slots, quantities))
+        setter(self, "_parent", parent)
+        setter(self, "_changed", changed)
+
+    def __setattr__(self, name: str, value: object) -> None:
+        raise AttributeError(f"cannot assign to field '{name}'")
+
+    def __reduce__(self):
+        return (
+            CompactState,
+            (self.cash_balance, dict(self._view), self.exposure, self.risk_limits),
+        )
+
+    @classmethod
+    def from_state(cls, state: State) -> "CompactState":
+        return cls(
+            cash_balance=state.cash_balance,
+            positions=state.positions,
+            exposure=state.exposure,
+            risk_limits=state.risk_limits,
+        )
+
+    def to_state(self) -> State:
+        return State(
+            cash_balance=self.cash_balance,
+            positions=dict(self._view),
+            exposure=self.exposure,
+            risk_limits=self.risk_limits,
+        )
+
+    @property
+    def positions(self) -> Mapping[str, float]:  # type: ignore[override]
+        return self._view
+
+    def with_position(
+        self,
+        symbol: str,
+        quantity: float,
+        cash_balance: float,
+        exposure: float,
+    ) -> "CompactState":
+        quantities = self._quantities[:]
+        slot = self._slots.get(symbol)
+        if slot is None:
+            slots = dict(self._slots)
+            slots[sys.intern(symbol)] = len(quantities)
+            quantities.append(quantity)
+        else:
+            slots = self._slots
+            quantities[slot] = quantity
+        state = CompactState.__new__(CompactState)
+        state._init(
+            cash_balance,
+            exposure,
+            self.risk_limits,
+            slots,
+            quantities,
+            weakref.ref(self),
+            symbol,
+        )
+        return state
+
+    def changed_symbols(self, prior: State) -> Optional[Tuple[str, ...]]:
+        if self._parent is not None and self._parent() is prior:
+            return (self._changed,)
+        if prior is self:
+            return ()
+        return None
+
+    def with_positions(
+        self, positions: Dict[str, float], prices: Dict[str, float]
+    ) -> "CompactState":
+        exposure = sum(abs(qty * prices.get(symbol, 0.0)) for symbol, qty in positions.items())
+        return CompactState(
+            cash_balance=self.cash_balance,
+            positions=positions,
+            exposure=exposure,
+            risk_limits=self.risk_limits,
+        )
+
+    def equity(self, prices: Dict[str, float]) -> float:
+        return self.cash_balance + sum(self._priced_values(prices))
+
+    def exposure_value(self, prices: Dict[str, float]) -> float:
+        return sum(abs(value) for value in self._priced_values(prices))
+
+    def _priced_values(self, prices: Dict[str, float]) -> list:
+        # Unpriced positions contribute 0.0, so summing only the priced ones
+        # in position order matches State's full sum exactly.
+        slots, quantities = self._slots, self._quantities
+        if len(prices) >= len(slots):
+            return [quantities[slot] * prices.get(symbol, 0.0) for symbol, slot in slots.items()]
+        terms = sorted(
+            (slots[symbol], price) for symbol, price in prices.items() if symbol in slots
+        )
+        return [quantities[slot] * price for slot, price in terms]
+
+    def to_dict(self) -> Dict[str, object]:
+        return {
+            "cash_balance": self.cash_balance,
+            "positions": dict(self._view),
+            "exposure": self.exposure,
+            "risk_limits": {
+                "max_leverage": self.risk_limits.max_leverage,
+                "max_position_pct": self.risk_limits.max_position_pct,
+                "max_position_value": self.risk_limits.max_position_value,
+            },
+        }
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, State):
+            return NotImplemented
+        return (
+            self.cash_balance == other.cash_balance
+            and self.exposure == other.exposure
+            and self.risk_limits == other.risk_limits
+            and dict(self._view) == dict(other.positions)
+        )
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return (
+            f"CompactState(cash_balance={self.cash_balance!r}, positions={self._view!r}, "
+            f"exposure={self.exposure!r}, risk_limits={self.risk_limits!r})"
+        )
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Dict
+from typing import Dict, Optional, Tuple
 
 
 @dataclass(frozen=True)
@@ -31,6 +31,27 @@ class State:
             risk_limits=self.risk_limits,
         )
 
+    def with_position(
+        self,
+        symbol: str,
+        quantity: float,
+        cash_balance: float,
+        exposure: float,
+    ) -> "State":
+        """Copy of this state with one position, the cash and the exposure replaced."""
+        positions = dict(self.positions)
+        positions[symbol] = quantity
+        return State(
+            cash_balance=cash_balance,
+            positions=positions,
+            exposure=exposure,
+            risk_limits=self.risk_limits,
+        )
+
+    def changed_symbols(self, prior: "State") -> Optional[Tuple[str, ...]]:
+        """Symbols whose position differs from ``prior`` when known without a diff, else None."""
+        return None
+
     def equity(self, prices: Dict[str, float]) -> float:
         return self.cash_balance + sum(
             qty * prices.get(symbol, 0.0) for symbol, qty in self.positions.items()
@@ -4,15 +4,22 @@ from services.core.strategy.evaluate import (
     evaluate_signals_with_rationale,
     signals_to_actions,
 )
-from services.core.strategy.load import load_strategy
+from services.core.strategy.indicators import IndicatorEngine
+from services.core.strategy.load import clear_strategy_cache, load_strategy, strategy_cache_info
+from services.core.strategy.plan import StrategyPlan, compile_strategy
 from services.core.strategy.types import Signal, StrategySpec
 
 __all__ = [
+    "IndicatorEngine",
     "Signal",
     "StrategyEvaluation",
+    "StrategyPlan",
     "StrategySpec",
+    "compile_strategy",
     "evaluate_signals",
     "evaluate_signals_with_rationale",
     "signals_to_actions",
     "load_strategy",
+    "clear_strategy_cache",
+    "strategy_cache_info",
 ]
\ No newline at end of file
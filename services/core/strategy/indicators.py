@@ -0,0 +1,175 @@
+from __future__ import annotations
+
+import math
+import sys
+from collections import deque
+from statistics import mean, pstdev
+from typing import Deque, Dict, List, Tuple
+
+from services.core.market import MarketPath
+
+# Round-to-odd needs two extra guard bits beyond 2p for a correctly rounded result.
+_SQRT_BIT_WIDTH = 2 * sys.float_info.mant_dig + 3
+
+
+def _isqrt_round_to_odd(numerator: int, denominator: int) -> int:
+    root = math.isqrt(numerator // denominator)
+    return root | (root * root * denominator != numerator)
+
+
+def _sqrt_of_fraction(numerator: int, denominator: int) -> float:
+    # Correctly rounded, so results match statistics.pstdev bit for bit.
+    shift = (numerator.bit_length() - denominator.bit_length() - _SQRT_BIT_WIDTH) // 2
+    if shift >= 0:
+        return float(_isqrt_round_to_odd(numerator, denominator << 2 * shift) << shift)
+    return _isqrt_round_to_odd(numerator << -2 * shift, denominator) / (1 << -shift)
+
+
+class RollingWindow:
+    """Last ``size`` prices of one symbol with exact running sums.
+
+    Every finite float is an integer over a power of two, so the sums are
+    kept exactly as integers scaled by ``2**_shift``. ``mean`` and ``pstdev``
+    therefore equal ``statistics.mean``/``statistics.pstdev`` over the same
+    window while each push costs O(1) regardless of the window size.
+    """
+
+    __slots__ = (
+        "size",
+        "count",
+        "_values",
+        "_sum",
+        "_sum_sq",
+        "_shift",
+        "_non_finite",
+        "_mean",
+        "_pstdev",
+    )
+
+    def __init__(self, size: int) -> None:
+        self.size = size
+        self.count = 0
+        self._values: Deque[float] = deque()
+        self._sum = 0
+        self._sum_sq = 0
+        self._shift = 0
+        self._non_finite = 0
+        # Memoized until the next push, so rules sharing a window pay once per step.
+        self._mean: float | None = None
+        self._pstdev: float | None = None
+
+    @property
+    def ready(self) -> bool:
+        return self.count >= self.size
+
+    def values(self) -> List[float]:
+        return list(self._values)
+
+    def push(self, value: float) -> None:
+        if len(self._values) == self.size:
+            self._update(self._values.popleft(), -1)
+        self._values.append(value)
+        self._update(value, 1)
+        self.count += 1
+        self._mean = None
+        self._pstdev = None
+
+    def _update(self, value: float, sign: int) -> None:
+        if not math.isfinite(value):
+            self._non_finite += sign
+            return
+        numerator, denominator = value.as_integer_ratio()
+        shift = denominator.bit_length() - 1
+        if shift > self._shift:
+            grow = shift - self._shift
+            self._sum <<= grow
+            self._sum_sq <<= 2 * grow
+            self._shift = shift
+        scaled = numerator << (self._shift - shift)
+        self._sum += sign * scaled
+        self._sum_sq += sign * scaled * scaled
+
+    def mean(self) -> float:
+        if self._mean is None:
+            if self._non_finite:
+                self._mean = mean(self._values)
+            else:
+                self._mean = self._sum / (len(self._values) << self._shift)
+        return self._mean
+
+    def pstdev(self) -> float:
+        if self._pstdev is None:
+            if self._non_finite:
+                self._pstdev = pstdev(self._values)
+            else:
+                n = len(self._values)
+                self._pstdev = _sqrt_of_fraction(
+                    n * self._sum_sq - self._sum * self._sum,
+                    (n * n) << 2 * self._shift,
+                )
+        return self._pstdev
+
+
+class IndicatorEngine:
+    """Per-symbol rolling windows advanced once per market step.
+
+    Windows are registered lazily with ``window(symbol, size)`` and shared by
+    every rule asking for the same symbol and size. ``advance`` consumes only
+    the steps not seen yet; a different path or a step going backwards
+    replays the path from the start.
+    """
+
+    def __init__(self) -> None:
+        self._market_path: MarketPath | None = None
+        self._step_index = -1
+        self._windows: Dict[str, Dict[int, RollingWindow]] = {}
+
+    @property
+    def step_index(self) -> int:
+        return self._step_index
+
+    def window(self, symbol: str, size: int) -> RollingWindow:
+        by_size = self._windows.setdefault(symbol, {})
+        window = by_size.get(size)
+        if window is None:
+            window = RollingWindow(size)
+            for price in self._replay(symbol):
+                window.push(price)
+            by_size[size] = window
+        return window
+
+    def advance(self, market_path: MarketPath, step_index: int) -> None:
+        if market_path is not self._market_path or step_index < self._step_index:
+            self._market_path = market_path
+            self._step_index = step_index
+            self._rebuild()
+            return
+
+        steps = market_path.steps
+        tracked: List[Tuple[str, List[RollingWindow]]] = [
+            (symbol, list(by_size.values())) for symbol, by_size in self._windows.items()
+        ]
+        for index in range(self._step_index + 1, min(step_index + 1, len(steps))):
+            step = steps[index]
+            for symbol, windows in tracked:
+                if symbol in step:
+                    price = step[symbol]
+                    for window in windows:
+                        window.push(price)
+        self._step_index = step_index
+
+    def _replay(self, symbol: str) -> List[float]:
+        if self._market_path is None or self._step_index < 0:
+            return []
+        return [
+            step[symbol]
+            for step in self._market_path.steps[: self._step_index + 1]
+            if symbol in step
+        ]
+
+    def _rebuild(self) -> None:
+        registered = [(symbol, list(by_size)) for symbol, by_size in self._windows.items()]
+        self._windows = {}
+        for symbol, sizes in registered:
+            for size in sizes:
+                self.window(symbol, size)
@@ -1,12 +1,125 @@
 from __future__ import annotations
 
+import hashlib
 import json
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
 from pathlib import Path
 
 from services.core.strategy.types import StrategySpec
 
+STRATEGY_CACHE_SIZE = 64
 
-def load_strategy(path: str) -> StrategySpec:
-    strategy_path = Path(path)
-    payload = json.loads(strategy_path.read_text())
-    return StrategySpec.model_validate(payload)
\ No newline at end of file
+
+@dataclass(frozen=True)
+class StrategyCacheInfo:
+    hits: int
+    misses: int
+    size: int
+    max_size: int
+
+
+@dataclass(frozen=True)
+class _CacheEntry:
+    mtime_ns: int
+    size: int
+    digest: str
+    strategy: StrategySpec
+
+
+class _StrategyCache:
+    """Process-wide LRU of validated strategy files keyed by absolute path.
+
+    An unchanged mtime and size is a hit without reading the file; otherwise
+    the file is re-read and still counts as a hit if its sha256 is unchanged.
+    Hits return a shallow ``model_copy`` of the cached spec: replacing a
+    top-level field stays private to the caller, but nested models are
+    shared and must be treated as read-only.
+    """
+
+    def __init__(self, max_size: int) -> None:
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[str, _CacheEntry] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def load(self, path: str) -> StrategySpec:
+        # abspath rather than resolve(): it makes no syscalls, and the stat
+        # below still follows symlinks.
+        key = os.path.abspath(path)
+        stat = os.stat(key)
+        with self._lock:
+            entry = self._entries.get(key)
+            unchanged = entry is not None and (entry.mtime_ns, entry.size) == (
+                stat.st_mtime_ns,
+                stat.st_size,
+            )
+            if unchanged:
+                self._hit(key)
+        if unchanged:
+            return entry.strategy.model_copy()
+
+        content = Path(key).read_bytes()
+        digest = hashlib.sha256(content).hexdigest()
+        with self._lock:
+            entry = self._entries.get(key)
+            unchanged = entry is not None and entry.digest == digest
+            if unchanged:
+                entry = _CacheEntry(stat.st_mtime_ns, stat.st_size, digest, entry.strategy)
+                self._entries[key] = entry
+                self._hit(key)
+        if unchanged:
+            return entry.strategy.model_copy()
+
+        strategy = _parse_strategy(content)
+        with self._lock:
+            self.misses += 1
+            self._entries[key] = _CacheEntry(stat.st_mtime_ns, len(content), digest, strategy)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+        return strategy.model_copy()
+
+    def _hit(self, key: str) -> None:
+        self.hits += 1
+        self._entries.move_to_end(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def info(self) -> StrategyCacheInfo:
+        with self._lock:
+            return StrategyCacheInfo(
+                hits=self.hits,
+                misses=self.misses,
+                size=len(self._entries),
+                max_size=self.max_size,
+            )
+
+
+_CACHE = _StrategyCache(STRATEGY_CACHE_SIZE)
+
+
+def _parse_strategy(content: bytes) -> StrategySpec:
+    payload = json.loads(content)
+    return StrategySpec.model_validate(payload)
+
+
+def load_strategy(path: str, use_cache: bool = True) -> StrategySpec:
+    if not use_cache:
+        return _parse_strategy(Path(path).read_bytes())
+    return _CACHE.load(path)
+
+
+def clear_strategy_cache() -> None:
+    _CACHE.clear()
+
+
+def strategy_cache_info() -> StrategyCacheInfo:
+    return _CACHE.info()
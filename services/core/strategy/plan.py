@@ -0,0 +1,187 @@
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, List, Tuple
+
+from services.core.market import MarketPath
+from services.core.strategy.indicators import IndicatorEngine
+from services.core.strategy.rules import (
+    StrategyEvaluation,
+    _prices_for_symbol,
+    _sma_signal,
+    _sma_signal_incremental,
+    _threshold_signal,
+    _zscore_signal,
+    _zscore_signal_incremental,
+)
+from services.core.strategy.types import (
+    MeanReversionRule,
+    Signal,
+    SmaCrossoverRule,
+    StrategySpec,
+    ThresholdPriceRule,
+)
+
+
+class RuleInputs:
+    """Inputs shared by every rule of one symbol at one step.
+
+    Without an ``IndicatorEngine`` the symbol history is collected at most
+    once per step, however many rules read it.
+    """
+
+    __slots__ = ("symbol", "step_index", "market_path", "indicators", "_history")
+
+    def __init__(
+        self,
+        symbol: str,
+        step_index: int,
+        market_path: MarketPath | None,
+        indicators: IndicatorEngine | None,
+    ) -> None:
+        self.symbol = symbol
+        self.step_index = step_index
+        self.market_path = market_path
+        self.indicators = indicators
+        self._history: List[float] | None = None
+
+    def history(self) -> List[float]:
+        if self._history is None:
+            self._history = (
+                _prices_for_symbol(self.market_path, self.symbol, self.step_index)
+                if self.market_path is not None
+                else []
+            )
+        return self._history
+
+
+RuleEvaluator = Callable[[float, RuleInputs], Tuple[Signal, str]]
+
+
+def _compile_threshold(rule: ThresholdPriceRule) -> RuleEvaluator:
+    def evaluate(price: float, inputs: RuleInputs) -> Tuple[Signal, str]:
+        return _threshold_signal(rule, price)
+
+    return evaluate
+
+
+def _compile_sma(rule: SmaCrossoverRule) -> RuleEvaluator:
+    def evaluate(price: float, inputs: RuleInputs) -> Tuple[Signal, str]:
+        if inputs.indicators is not None:
+            return _sma_signal_incremental(rule, inputs.indicators)
+        return _sma_signal(rule, inputs.history())
+
+    return evaluate
+
+
+def _compile_zscore(rule: MeanReversionRule) -> RuleEvaluator:
+    def evaluate(price: float, inputs: RuleInputs) -> Tuple[Signal, str]:
+        if inputs.indicators is not None:
+            return _zscore_signal_incremental(rule, inputs.indicators, price)
+        return _zscore_signal(rule, inputs.history(), price)
+
+    return evaluate
+
+
+def _no_matching_rule(price: float, inputs: RuleInputs) -> Tuple[Signal, str]:
+    return Signal.HOLD, "no matching rule"
+
+
+_COMPILERS = (
+    (ThresholdPriceRule, _compile_threshold),
+    (SmaCrossoverRule, _compile_sma),
+    (MeanReversionRule, _compile_zscore),
+)
+
+
+def _compile_rule(rule) -> RuleEvaluator:
+    for rule_type, compiler in _COMPILERS:
+        if isinstance(rule, rule_type):
+            return compiler(rule)
+    return _no_matching_rule
+
+
+class StrategyPlan:
+    """A ``StrategySpec`` compiled for repeated evaluation.
+
+    Rules are grouped by symbol and dispatched once at compile time. For each
+    symbol the last non-HOLD rule wins, so groups are walked backwards and
+    stop at the first non-HOLD result; the first rule's rationale is kept
+    when every rule holds, as in the rule-by-rule evaluator.
+    """
+
+    def __init__(self, strategy: StrategySpec) -> None:
+        self.universe: List[str] = list(strategy.universe.symbols)
+        groups: Dict[str, List[RuleEvaluator]] = {}
+        for rule in strategy.rules:
+            # Plans are shared by every spec with the same content, so they
+            # must not see later in-place edits of the spec's own rules.
+            groups.setdefault(rule.symbol, []).append(_compile_rule(rule.model_copy()))
+        self.groups: List[Tuple[str, Tuple[RuleEvaluator, ...]]] = [
+            (symbol, tuple(reversed(evaluators))) for symbol, evaluators in groups.items()
+        ]
+        self._hold_signals = {symbol: Signal.HOLD for symbol in self.universe}
+        self._empty_rationales = {symbol: "" for symbol in self.universe}
+
+    def evaluate(
+        self,
+        price_ctx: Dict[str, float],
+        step_index: int,
+        market_path: MarketPath | None = None,
+        indicators: IndicatorEngine | None = None,
+    ) -> StrategyEvaluation:
+        signals = dict(self._hold_signals)
+        rationales = dict(self._empty_rationales)
+        if market_path is None:
+            indicators = None
+        elif indicators is not None:
+            indicators.advance(market_path, step_index)
+
+        for symbol, evaluators in self.groups:
+            price = price_ctx.get(symbol)
+            if price is None:
+                continue
+            inputs = RuleInputs(symbol, step_index, market_path, indicators)
+            for evaluator in evaluators:
+                signal, rationale = evaluator(price, inputs)
+                if signal != Signal.HOLD:
+                    signals[symbol] = signal
+                    rationales[symbol] = rationale
+                    break
+                hold_rationale = rationale
+            else:
+                if not rationales.get(symbol):
+                    rationales[symbol] = hold_rationale
+
+        return StrategyEvaluation(signals=signals, rationales=rationales)
+
+
+PLAN_CACHE_SIZE = 128
+
+_PLANS: OrderedDict[Tuple, StrategyPlan] = OrderedDict()
+_PLANS_LOCK = threading.Lock()
+
+
+def _plan_key(strategy: StrategySpec) -> Tuple:
+    # Specs are mutable, so plans are keyed on the fields they are compiled
+    # from rather than on the spec object.
+    return (
+        tuple(strategy.universe.symbols),
+        tuple((type(rule), tuple(rule.__dict__.values())) for rule in strategy.rules),
+    )
+
+
+def compile_strategy(strategy: StrategySpec) -> StrategyPlan:
+    key = _plan_key(strategy)
+    with _PLANS_LOCK:
+        plan = _PLANS.get(key)
+        if plan is not None:
+            _PLANS.move_to_end(key)
+            return plan
+    plan = StrategyPlan(strategy)
+    with _PLANS_LOCK:
+        _PLANS[key] = plan
+        while len(_PLANS) > PLAN_CACHE_SIZE:
+            _PLANS.popitem(last=False)
+    return plan
@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from statistics import mean, pstdev
+from typing import Dict, List
+
+from services.core.market import MarketPath
+from services.core.strategy.indicators import IndicatorEngine
+from services.core.strategy.types import (
+    MeanReversionRule,
+    Signal,
+    SmaCrossoverRule,
+    ThresholdPriceRule,
+)
+
+
+@dataclass(frozen=True)
+class StrategyEvaluation:
+    signals: Dict[str, Signal]
+    rationales: Dict[str, str]
+
+
+def _prices_for_symbol(path: MarketPath, symbol: str, step_index: int) -> List[float]:
+    if step_index < 0:
+        return []
+    return [step.get(symbol) for step in path.steps[: step_index + 1] if symbol in step]
+
+
+def _threshold_signal(rule: ThresholdPriceRule, price: float) -> tuple[Signal, str]:
+    if rule.buy_below is not None and price <= rule.buy_below:
+        return (
+            Signal.BUY,
+            f"price < buy_below ({price:.2f} < {rule.buy_below:.2f})",
+        )
+    if rule.sell_above is not None and price >= rule.sell_above:
+        return (
+            Signal.SELL,
+            f"price > sell_above ({price:.2f} > {rule.sell_above:.2f})",
+        )
+    return Signal.HOLD, "price within thresholds"
+
+
+def _sma_signal(rule: SmaCrossoverRule, history: List[float]) -> tuple[Signal, str]:
+    if len(history) < rule.long_window:
+        return Signal.HOLD, "insufficient history for SMA"
+    short_window = history[-rule.short_window :]
+    long_window = history[-rule.long_window :]
+    return _sma_crossover(mean(short_window), mean(long_window))
+
+
+def _sma_signal_incremental(
+    rule: SmaCrossoverRule,
+    indicators: IndicatorEngine,
+) -> tuple[Signal, str]:
+    short_window = indicators.window(rule.symbol, rule.short_window)
+    long_window = indicators.window(rule.symbol, rule.long_window)
+    if not long_window.ready:
+        return Signal.HOLD, "insufficient history for SMA"
+    return _sma_crossover(short_window.mean(), long_window.mean())
+
+
+def _sma_crossover(short_sma: float, long_sma: float) -> tuple[Signal, str]:
+    if short_sma > long_sma:
+        return (
+            Signal.BUY,
+            f"SMA(short)={short_sma:.2f} > SMA(long)={long_sma:.2f}",
+        )
+    if short_sma < long_sma:
+        return (
+            Signal.SELL,
+            f"SMA(short)={short_sma:.2f} < SMA(long)={long_sma:.2f}",
+        )
+    return Signal.HOLD, f"SMA(short)={short_sma:.2f} == SMA(long)={long_sma:.2f}"
+
+
+def _zscore_signal(
+    rule: MeanReversionRule,
+    history: List[float],
+    price: float,
+) -> tuple[Signal, str]:
+    if len(history) < rule.window:
+        return Signal.HOLD, "insufficient history for z-score"
+    window = history[-rule.window :]
+    return _zscore_bands(rule, price, mean(window), pstdev(window))
+
+
+def _zscore_signal_incremental(
+    rule: MeanReversionRule,
+    indicators: IndicatorEngine,
+    price: float,
+) -> tuple[Signal, str]:
+    window = indicators.window(rule.symbol, rule.window)
+    if not window.ready:
+        return Signal.HOLD, "insufficient history for z-score"
+    return _zscore_bands(rule, price, window.mean(), window.pstdev())
+
+
+def _zscore_bands(
+    rule: MeanReversionRule,
+    price: float,
+    window_mean: float,
+    window_std: float,
+) -> tuple[Signal, str]:
+    if window_std == 0:
+        return Signal.HOLD, "z-score undefined (std=0)"
+    zscore = (price - window_mean) / window_std
+    if zscore <= rule.z_buy_below:
+        return (
+            Signal.BUY,
+            f"z-score={zscore:.2f} < {rule.z_buy_below:.2f}",
+        )
+    if zscore >= rule.z_sell_above:
+        return (
+            Signal.SELL,
+            f"z-score={zscore:.2f} > {rule.z_sell_above:.2f}",
+        )
+    return Signal.HOLD, f"z-score={zscore:.2f} within bands"
@@ -0,0 +1,351 @@
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from services.core.market import MarketPath
+from services.core.market.columnar import ColumnarMarketPath
+from services.core.strategy.rules import (
+    StrategyEvaluation,
+    _sma_crossover,
+    _sma_signal,
+    _threshold_signal,
+    _zscore_bands,
+    _zscore_signal,
+)
+from services.core.strategy.types import (
+    MeanReversionRule,
+    Signal,
+    SmaCrossoverRule,
+    StrategySpec,
+    ThresholdPriceRule,
+)
+
+SIGNAL_CODES: Dict[Signal, int] = {Signal.HOLD: 0, Signal.BUY: 1, Signal.SELL: -1}
+CODE_SIGNALS: Dict[int, Signal] = {code: signal for signal, code in SIGNAL_CODES.items()}
+
+_HOLD, _BUY, _SELL = 0, 1, -1
+_EPS = float(np.finfo(np.float64).eps)
+_STD_BLOCK_ELEMENTS = 1 << 22
+
+
+def _tolerance(window: int) -> float:
+    # Generous bound on the relative error of a window sum of `window` terms.
+    return 64 * max(window, 1) * _EPS
+
+
+def _rolling_mean(values: np.ndarray, window: int) -> np.ndarray:
+    return np.convolve(values, np.ones(window), mode="valid") / window
+
+
+def _rolling_pstdev(values: np.ndarray, window: int, means: np.ndarray) -> np.ndarray:
+    windows = sliding_window_view(values, window)
+    out = np.empty(len(windows))
+    block = max(1, _STD_BLOCK_ELEMENTS // window)
+    for start in range(0, len(windows), block):
+        deviations = windows[start : start + block] - means[start : start + block, None]
+        out[start : start + block] = np.einsum("ij,ij->i", deviations, deviations)
+    return np.sqrt(out / window)
+
+
+def _near_rounding_edge(values: np.ndarray, error: np.ndarray) -> np.ndarray:
+    # Rationales print values with :.2f; flag values within `error` of a
+    # rounding boundary, including the sign of zero ("-0.00" vs "0.00").
+    scaled = np.abs(values) * 100.0
+    fraction = scaled - np.floor(scaled)
+    return (np.abs(fraction - 0.5) <= error * 100.0) | (np.abs(values) <= error)
+
+
+class _RuleColumn(ABC):
+    """Signal codes of one rule over every step of the path.
+
+    ``codes`` is only meaningful where ``present`` is set; rules are skipped
+    on steps where their symbol has no price, as in the step-wise evaluator.
+    With an ``evaluated`` step mask, fragile values are only resolved
+    exactly on those steps.
+    """
+
+    def __init__(self, rule, prices: np.ndarray, evaluated: Optional[np.ndarray] = None) -> None:
+        self.rule = rule
+        self.present = ~np.isnan(prices)
+        self.history = prices[self.present]
+        self.history_index = np.cumsum(self.present) - 1
+        self.codes = np.zeros(len(prices), dtype=np.int8)
+        self._evaluated = evaluated[self.present] if evaluated is not None else None
+        self._overrides: Dict[int, Tuple[Signal, str]] = {}
+
+    def _store(self, codes: np.ndarray, fragile: np.ndarray) -> None:
+        if self._evaluated is not None and fragile.size:
+            fragile = fragile & self._evaluated
+        for index in np.flatnonzero(fragile).tolist():
+            signal, rationale = self._exact(index)
+            codes[index] = SIGNAL_CODES[signal]
+            self._overrides[index] = (signal, rationale)
+        self.codes[self.present] = codes
+
+    @abstractmethod
+    def _exact(self, index: int) -> Tuple[Signal, str]:
+        """Signal and rationale from the scalar rule function at ``index``."""
+
+    @abstractmethod
+    def _render(self, index: int) -> str:
+        """Rationale for a non-fragile ``index``, formatted from the arrays."""
+
+    def rationale(self, step_index: int) -> str:
+        index = int(self.history_index[step_index])
+        override = self._overrides.get(index)
+        if override is not None:
+            return override[1]
+        return self._render(index)
+
+
+class _NoMatchColumn(_RuleColumn):
+    def __init__(
+        self, rule, prices: np.ndarray, evaluated: Optional[np.ndarray] = None
+    ) -> None:
+        super().__init__(rule, prices, evaluated)
+        self._store(np.zeros(len(self.history), dtype=np.int8), np.zeros(0, dtype=bool))
+
+    def _exact(self, index: int) -> Tuple[Signal, str]:
+        return Signal.HOLD, self._render(index)
+
+    def _render(self, index: int) -> str:
+        return "no matching rule"
+
+
+class _ThresholdColumn(_RuleColumn):
+    def __init__(
+        self, rule: ThresholdPriceRule, prices: np.ndarray, evaluated: Optional[np.ndarray] = None
+    ) -> None:
+        super().__init__(rule, prices, evaluated)
+        history = self.history
+        codes = np.zeros(len(history), dtype=np.int8)
+        sell = history >= rule.sell_above if rule.sell_above is not None else None
+        buy = history <= rule.buy_below if rule.buy_below is not None else None
+        if sell is not None:
+            codes[sell] = _SELL
+        if buy is not None:
+            codes[buy] = _BUY
+        self._store(codes, np.zeros(0, dtype=bool))
+
+    def _exact(self, index: int) -> Tuple[Signal, str]:
+        return _threshold_signal(self.rule, float(self.history[index]))
+
+    def _render(self, index: int) -> str:
+        return self._exact(index)[1]
+
+
+class _SmaColumn(_RuleColumn):
+    def __init__(
+        self, rule: SmaCrossoverRule, prices: np.ndarray, evaluated: Optional[np.ndarray] = None
+    ) -> None:
+        super().__init__(rule, prices, evaluated)
+        history = self.history
+        size = len(history)
+        self.ready = np.arange(size) >= rule.long_window - 1
+        self.short_sma = self._means(rule.short_window)
+        self.long_sma = self._means(rule.long_window)
+
+        codes = np.zeros(size, dtype=np.int8)
+        codes[self.ready & (self.short_sma > self.long_sma)] = _BUY
+        codes[self.ready & (self.short_sma < self.long_sma)] = _SELL
+
+        tolerance = _tolerance(max(rule.short_window, rule.long_window))
+        with np.errstate(invalid="ignore"):
+            error = tolerance * np.maximum(np.abs(self.short_sma), np.abs(self.long_sma))
+            fragile = self.ready & (
+                ~np.isfinite(error)
+                | (np.abs(self.short_sma - self.long_sma) <= error)
+                | _near_rounding_edge(self.short_sma, error)
+                | _near_rounding_edge(self.long_sma, error)
+            )
+        self._store(codes, fragile)
+
+    def _means(self, window: int) -> np.ndarray:
+        history = self.history
+        means = np.full(len(history), np.nan)
+        if len(history) >= window:
+            means[window - 1 :] = _rolling_mean(history, window)
+        # A window longer than the history averages everything seen so far.
+        prefix = history[: window - 1]
+        means[: len(prefix)] = np.cumsum(prefix) / np.arange(1, len(prefix) + 1)
+        return means
+
+    def _exact(self, index: int) -> Tuple[Signal, str]:
+        width = max(self.rule.short_window, self.rule.long_window)
+        window = self.history[max(0, index + 1 - width) : index + 1].tolist()
+        return _sma_signal(self.rule, window)
+
+    def _render(self, index: int) -> str:
+        if not self.ready[index]:
+            return "insufficient history for SMA"
+        return _sma_crossover(float(self.short_sma[index]), float(self.long_sma[index]))[1]
+
+
+class _ZScoreColumn(_RuleColumn):
+    def __init__(
+        self, rule: MeanReversionRule, prices: np.ndarray, evaluated: Optional[np.ndarray] = None
+    ) -> None:
+        super().__init__(rule, prices, evaluated)
+        history = self.history
+        size = len(history)
+        window = rule.window
+        self.ready = np.arange(size) >= window - 1
+        self.means = np.full(size, np.nan)
+        self.stds = np.full(size, np.nan)
+        if size >= window:
+            means = _rolling_mean(history, window)
+            self.means[window - 1 :] = means
+            self.stds[window - 1 :] = _rolling_pstdev(history, window, means)
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            zscores = (history - self.means) / self.stds
+            codes = np.zeros(size, dtype=np.int8)
+            codes[self.ready & (zscores >= rule.z_sell_above)] = _SELL
+            codes[self.ready & (zscores <= rule.z_buy_below)] = _BUY
+
+            tolerance = _tolerance(window)
+            error = tolerance * (1.0 + np.abs(zscores)) * (1.0 + np.abs(self.means) / self.stds)
+            fragile = self.ready & (
+                ~np.isfinite(self.stds)
+                | ~np.isfinite(zscores)
+                | (self.stds <= tolerance * np.abs(self.means))
+                | (np.abs(zscores - rule.z_buy_below) <= error)
+                | (np.abs(zscores - rule.z_sell_above) <= error)
+                | _near_rounding_edge(zscores, error)
+            )
+        codes[self.ready & (self.stds == 0)] = _HOLD
+        self._store(codes, fragile)
+
+    def _exact(self, index: int) -> Tuple[Signal, str]:
+        window = self.history[max(0, index + 1 - self.rule.window) : index + 1].tolist()
+        return _zscore_signal(self.rule, window, window[-1])
+
+    def _render(self, index: int) -> str:
+        if not self.ready[index]:
+            return "insufficient history for z-score"
+        return _zscore_bands(
+            self.rule,
+            float(self.history[index]),
+            float(self.means[index]),
+            float(self.stds[index]),
+        )[1]
+
+
+_COLUMN_TYPES = (
+    (ThresholdPriceRule, _ThresholdColumn),
+    (SmaCrossoverRule, _SmaColumn),
+    (MeanReversionRule, _ZScoreColumn),
+)
+
+
+def _rule_column(rule, prices: np.ndarray, evaluated: Optional[np.ndarray]) -> _RuleColumn:
+    for rule_type, column_type in _COLUMN_TYPES:
+        if isinstance(rule, rule_type):
+            return column_type(rule, prices, evaluated)
+    return _NoMatchColumn(rule, prices, evaluated)
+
+
+@dataclass(frozen=True)
+class SignalMatrix:
+    """Signals of every rule of a strategy over a whole market path.
+
+    ``codes`` is a ``steps x symbols`` int8 matrix (BUY=1, SELL=-1, HOLD=0)
+    combining rules the same way ``evaluate_signals_with_rationale`` does:
+    the last non-HOLD rule for a symbol wins. ``evaluation(step)`` returns
+    the exact ``StrategyEvaluation`` the step-wise evaluator would.
+    """
+
+    symbols: List[str]
+    universe: List[str]
+    codes: np.ndarray
+    rationale_rules: np.ndarray
+    columns: List[_RuleColumn]
+
+    @property
+    def n_steps(self) -> int:
+        return self.codes.shape[0]
+
+    def signals_at(self, step_index: int) -> Dict[str, Signal]:
+        return self.evaluation(step_index).signals
+
+    def evaluation(self, step_index: int) -> StrategyEvaluation:
+        if step_index < 0 or step_index >= self.n_steps:
+            raise IndexError("Step index out of range")
+        codes = self.codes[step_index].tolist()
+        rule_indexes = self.rationale_rules[step_index].tolist()
+        signals: Dict[str, Signal] = {}
+        rationales: Dict[str, str] = {}
+        for position, symbol in enumerate(self.symbols):
+            code = codes[position]
+            rule_index = rule_indexes[position]
+            in_universe = position < len(self.universe)
+            if in_universe or code != _HOLD:
+                signals[symbol] = CODE_SIGNALS[code]
+            if rule_index >= 0:
+                rationales[symbol] = self.columns[rule_index].rationale(step_index)
+            elif in_universe:
+                rationales[symbol] = ""
+        return StrategyEvaluation(signals=signals, rationales=rationales)
+
+
+def precompute_signals(
+    strategy: StrategySpec,
+    market_path: MarketPath | ColumnarMarketPath,
+    n_steps: int | None = None,
+    evaluation_steps: Optional[Iterable[int]] = None,
+) -> SignalMatrix:
+    """Signals of ``strategy`` over the first ``n_steps`` steps of the path.
+
+    When ``evaluation_steps`` is given, ``evaluation`` is only exact on those
+    steps; the rest of the matrix may differ in float-edge cases.
+    """
+    if not isinstance(market_path, ColumnarMarketPath):
+        market_path = market_path.to_columnar()
+    prices = market_path.prices[:n_steps]
+    total_steps = prices.shape[0]
+    evaluated = None
+    if evaluation_steps is not None:
+        evaluated = np.zeros(total_steps, dtype=bool)
+        indexes = np.fromiter(evaluation_steps, dtype=np.int64)
+        evaluated[indexes[(indexes >= 0) & (indexes < total_steps)]] = True
+
+    universe = list(strategy.universe.symbols)
+    symbols = list(universe)
+    for rule in strategy.rules:
+        if rule.symbol not in symbols:
+            symbols.append(rule.symbol)
+
+    missing = np.full(total_steps, np.nan)
+    columns: List[_RuleColumn] = []
+    for rule in strategy.rules:
+        column = market_path.columns.get(rule.symbol)
+        rule_prices = prices[:, column] if column is not None else missing
+        columns.append(_rule_column(rule, rule_prices, evaluated))
+
+    codes = np.zeros((total_steps, len(symbols)), dtype=np.int8)
+    rationale_rules = np.full((total_steps, len(symbols)), -1, dtype=np.int32)
+    for position, symbol in enumerate(symbols):
+        deciding = np.full(total_steps, -1, dtype=np.int32)
+        first_seen = np.full(total_steps, -1, dtype=np.int32)
+        for rule_index, rule in enumerate(strategy.rules):
+            if rule.symbol != symbol:
+                continue
+            column = columns[rule_index]
+            active = column.present & (column.codes != _HOLD)
+            codes[active, position] = column.codes[active]
+            deciding[active] = rule_index
+            first_seen[column.present & (first_seen < 0)] = rule_index
+        rationale_rules[:, position] = np.where(deciding >= 0, deciding, first_seen)
+
+    return SignalMatrix(
+        symbols=symbols,
+        universe=universe,
+        codes=codes,
+        rationale_rules=rationale_rules,
+        columns=columns,
+    )
@@ -0,0 +1,12 @@
+from .engine import SweepResult, format_sweep_table, rank_results, run_sweep
+from .space import apply_overrides, parameter_grid, random_search
+
+__all__ = [
+    "SweepResult",
+    "apply_overrides",
+    "format_sweep_table",
+    "parameter_grid",
+    "random_search",
+    "rank_results",
+    "run_sweep",
+]
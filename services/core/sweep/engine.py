@@ -0,0 +1,190 @@
+from __future__ import annotations
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, List, Sequence, Tuple, Union
+
+from pydantic import ValidationError
+
+from services.core.loop.run import INITIAL_CASH, run_loop
+from services.core.loop.types import LoopResult
+from services.core.market import MarketPath
+from services.core.strategy.types import StrategySpec
+from services.core.sweep.space import apply_overrides
+
+if TYPE_CHECKING:
+    from services.core.market.columnar import ColumnarMarketPath
+
+MarketSource = Union[MarketPath, "ColumnarMarketPath", str, Path]
+
+RANK_METRICS = ("total_return", "final_equity", "trades")
+
+# Ephemeral loops write nothing under data_dir; it only names tape artifact paths.
+_EPHEMERAL_DATA_DIR = Path("sweep-ephemeral")
+
+
+@dataclass(frozen=True)
+class SweepResult:
+    index: int
+    params: Dict[str, object]
+    final_equity: float = 0.0
+    total_return: float = 0.0
+    trades: int = 0
+    approved_steps: int = 0
+    rejected_steps: int = 0
+    error: str | None = None
+
+    def to_dict(self) -> Dict[str, object]:
+        return {
+            "index": self.index,
+            "params": dict(self.params),
+            "final_equity": self.final_equity,
+            "total_return": self.total_return,
+            "trades": self.trades,
+            "approved_steps": self.approved_steps,
+            "rejected_steps": self.rejected_steps,
+            "error": self.error,
+        }
+
+
+@dataclass(frozen=True)
+class _SweepContext:
+    market_path: object
+    base_strategy: StrategySpec
+    steps: int
+
+
+_WORKER_CONTEXT: _SweepContext | None = None
+
+
+def _load_market_path(source: MarketSource):
+    if isinstance(source, (str, Path)):
+        # Binary fixtures are memory-mapped, so workers share the page cache.
+        return MarketPath.from_fixture(Path(source))
+    return source
+
+
+def _build_context(
+    market_source: MarketSource,
+    base_payload: Dict[str, object],
+    steps: int | None,
+) -> _SweepContext:
+    market_path = _load_market_path(market_source)
+    n_steps = len(market_path.steps)
+    return _SweepContext(
+        market_path=market_path,
+        base_strategy=StrategySpec.model_validate(base_payload),
+        steps=n_steps if steps is None else min(steps, n_steps),
+    )
+
+
+def _init_worker(
+    market_source: MarketSource,
+    base_payload: Dict[str, object],
+    steps: int | None,
+) -> None:
+    global _WORKER_CONTEXT
+    _WORKER_CONTEXT = _build_context(market_source, base_payload, steps)
+
+
+def _summarize(
+    context: _SweepContext, index: int, params: Dict[str, object], result: LoopResult
+) -> SweepResult:
+    # Every candidate is valued at the last step of the sweep, not at its own
+    # last tape row, which a cadence above 1 leaves on an earlier step.
+    final_prices = context.market_path.price_context(context.steps - 1) if context.steps else {}
+    final_equity = result.final_state.equity(final_prices)
+    decisions = [row.decision for row in result.tape_rows]
+    return SweepResult(
+        index=index,
+        params=params,
+        final_equity=final_equity,
+        total_return=final_equity / INITIAL_CASH - 1.0,
+        trades=len(result.execution_rows),
+        approved_steps=decisions.count("APPROVED"),
+        rejected_steps=decisions.count("REJECTED"),
+    )
+
+
+def _evaluate(context: _SweepContext, index: int, params: Dict[str, object]) -> SweepResult:
+    try:
+        strategy = apply_overrides(context.base_strategy, params)
+    except ValidationError as exc:
+        errors = "; ".join(
+            f"{'.'.join(str(part) for part in error['loc'])}: {error['msg']}"
+            for error in exc.errors()
+        )
+        return SweepResult(index=index, params=params, error=errors)
+    except ValueError as exc:
+        return SweepResult(index=index, params=params, error=str(exc))
+    result = run_loop(
+        market_path=context.market_path,
+        strategy=strategy,
+        steps=context.steps,
+        data_dir=_EPHEMERAL_DATA_DIR,
+        ephemeral=True,
+    )
+    return _summarize(context, index, params, result)
+
+
+def _evaluate_in_worker(task: Tuple[int, Dict[str, object]]) -> SweepResult:
+    return _evaluate(_WORKER_CONTEXT, *task)
+
+
+def rank_results(results: Sequence[SweepResult], metric: str = "total_return") -> List[SweepResult]:
+    if metric not in RANK_METRICS:
+        raise ValueError(f"Unsupported rank metric: {metric}")
+    return sorted(
+        results,
+        key=lambda result: (result.error is not None, -getattr(result, metric), result.index),
+    )
+
+
+def run_sweep(
+    base_strategy: StrategySpec,
+    market_path: MarketSource,
+    candidates: Sequence[Dict[str, object]],
+    steps: int | None = None,
+    max_workers: int | None = None,
+    metric: str = "total_return",
+) -> List[SweepResult]:
+    """Run the full loop for every candidate and rank the outcomes.
+
+    Each worker process loads the market path once through its initializer;
+    pass a fixture path rather than a path object to let workers memory-map
+    a binary fixture instead of receiving a pickled copy.
+    """
+    base_payload = base_strategy.model_dump()
+    tasks = [(index, dict(params)) for index, params in enumerate(candidates)]
+    workers = max_workers or os.cpu_count() or 1
+
+    if workers == 1 or len(tasks) <= 1:
+        context = _build_context(market_path, base_payload, steps)
+        results = [_evaluate(context, index, params) for index, params in tasks]
+    else:
+        workers = min(workers, len(tasks))
+        chunksize = max(1, len(tasks) // (workers * 4))
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(market_path, base_payload, steps),
+        ) as executor:
+            results = list(executor.map(_evaluate_in_worker, tasks, chunksize=chunksize))
+    return rank_results(results, metric)
+
+
+def format_sweep_table(results: Sequence[SweepResult], top: int | None = None) -> str:
+    lines = ["rank | total_return | final_equity | trades | approved | rejected | params"]
+    lines.append("-" * 96)
+    for rank, result in enumerate(results[:top], start=1):
+        params = ", ".join(f"{key}={value}" for key, value in result.params.items())
+        if result.error is not None:
+            lines.append(f"{rank} | error: {result.error} | {params}")
+            continue
+        lines.append(
+            f"{rank} | {result.total_return:+.2%} | {result.final_equity:.2f} | "
+            f"{result.trades} | {result.approved_steps} | {result.rejected_steps} | {params}"
+        )
+    return "\n".join(lines)
@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import itertools
+import random
+from typing import Dict, Iterator, List, Sequence, Tuple, Union
+
+from services.core.strategy.types import StrategySpec
+
+# A random-search dimension: a list of choices, or an inclusive (low, high)
+# range drawn as an int when both bounds are ints and as a float otherwise.
+SearchDimension = Union[Sequence[object], Tuple[float, float]]
+
+
+def parameter_grid(grid: Dict[str, Sequence[object]]) -> List[Dict[str, object]]:
+    keys = list(grid)
+    for key in keys:
+        if not grid[key]:
+            raise ValueError(f"Grid dimension '{key}' has no values.")
+    return [dict(zip(keys, values)) for values in itertools.product(*grid.values())]
+
+
+def random_search(
+    space: Dict[str, SearchDimension],
+    n_samples: int,
+    seed: int = 42,
+) -> List[Dict[str, object]]:
+    rng = random.Random(seed)
+    return [
+        {key: _sample(rng, key, dimension) for key, dimension in space.items()}
+        for _ in range(n_samples)
+    ]
+
+
+def _sample(rng: random.Random, key: str, dimension: SearchDimension) -> object:
+    if isinstance(dimension, tuple):
+        if len(dimension) != 2:
+            raise ValueError(f"Range for '{key}' must be (low, high).")
+        low, high = dimension
+        if isinstance(low, int) and isinstance(high, int):
+            return rng.randint(low, high)
+        return rng.uniform(float(low), float(high))
+    if not dimension:
+        raise ValueError(f"Search dimension '{key}' has no values.")
+    return rng.choice(list(dimension))
+
+
+def _split_path(path: str) -> Iterator[Union[str, int]]:
+    for part in path.split("."):
+        yield int(part) if part.isdigit() else part
+
+
+def apply_overrides(base: StrategySpec, overrides: Dict[str, object]) -> StrategySpec:
+    """Return a validated copy of ``base`` with dotted-path overrides applied.
+
+    Paths follow the strategy JSON, e.g. ``rules.0.short_window`` or
+    ``sizing.order_qty``.
+    """
+    payload = base.model_dump()
+    for path, value in overrides.items():
+        parts = list(_split_path(path))
+        target = payload
+        try:
+            for part in parts[:-1]:
+                target = target[part]
+            key = parts[-1]
+            if isinstance(target, dict) and key not in target:
+                raise KeyError(key)
+            target[key] = value
+        except (KeyError, IndexError, TypeError) as exc:
+            raise ValueError(f"Unknown strategy parameter: {path}") from exc
+    return StrategySpec.model_validate(payload)
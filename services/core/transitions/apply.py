@@ -19,25 +19,23 @@ class TransitionResult:
 
 def apply_action(state: State, action: Action) -> TransitionResult:
     prices = {action.symbol: action.price}
-    positions = dict(state.positions)
     cash_balance = state.cash_balance
 
     if isinstance(action, PlaceBuy):
-        cost = action.quantity * action.price
-        positions[action.symbol] = positions.get(action.symbol, 0.0) + action.quantity
-        cash_balance -= cost
+        quantity = state.positions.get(action.symbol, 0.0) + action.quantity
+        cash_balance -= action.quantity * action.price
     elif isinstance(action, PlaceSell):
-        proceeds = action.quantity * action.price
-        positions[action.symbol] = positions.get(action.symbol, 0.0) - action.quantity
-        cash_balance += proceeds
+        quantity = state.positions.get(action.symbol, 0.0) - action.quantity
+        cash_balance += action.quantity * action.price
     else:
         raise TypeError("Unsupported action type")
 
-    next_state = State(
-        cash_balance=cash_balance,
-        positions=positions,
-        exposure=sum(abs(qty * prices.get(symbol, 0.0)) for symbol, qty in positions.items()),
-        risk_limits=state.risk_limits,
+    # Only the traded symbol is priced, so it is the only exposure term.
+    next_state = state.with_position(
+        action.symbol,
+        quantity,
+        cash_balance,
+        exposure=abs(quantity * action.price),
     )
 
     return TransitionResult(prior=state, action=action, next_state=next_state, prices=prices)
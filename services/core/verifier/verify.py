@@ -22,6 +22,103 @@ class VerificationResult:
 
 
 def verify_transition(state: State, action: Action) -> VerificationResult:
+    """Check one action against ``state`` in O(1) of the portfolio size.
+
+    Only the traded symbol is priced, so every other position has a value of
+    zero and can only fail a negative limit; those limits take the full scan
+    in ``verify_transition_full``. Errors match it exactly, in the same order.
+    """
+    limits = state.risk_limits
+    if limits.max_position_value < 0 or limits.max_position_pct < 0:
+        return verify_transition_full(state, action)
+
+    errors: List[VerificationError] = []
+
+    if action.quantity <= 0 or action.price <= 0:
+        errors.append(
+            VerificationError(
+                code="invalid_action",
+                message="Quantity and price must be positive.",
+            )
+        )
+
+    if not action.symbol:
+        errors.append(
+            VerificationError(code="invalid_action", message="Symbol is required.")
+        )
+
+    positions = state.positions
+    held = action.symbol in positions
+    current_qty = positions.get(action.symbol, 0.0)
+    equity = state.cash_balance + (current_qty * action.price if held else 0.0)
+    touched = True
+
+    if isinstance(action, PlaceBuy):
+        cost = action.quantity * action.price
+        if cost > state.cash_balance:
+            errors.append(
+                VerificationError(
+                    code="insufficient_cash",
+                    message="Cash balance is insufficient.",
+                )
+            )
+        projected_qty = current_qty + action.quantity
+    elif isinstance(action, PlaceSell):
+        if action.quantity > current_qty:
+            errors.append(
+                VerificationError(
+                    code="insufficient_position",
+                    message="Cannot sell more than current position.",
+                )
+            )
+        projected_qty = current_qty - action.quantity
+    else:
+        errors.append(
+            VerificationError(
+                code="invalid_action",
+                message="Unsupported action type.",
+            )
+        )
+        projected_qty = current_qty
+        touched = held
+
+    position_value = abs(projected_qty * action.price) if touched else 0.0
+
+    if equity <= 0:
+        errors.append(
+            VerificationError(
+                code="invalid_equity",
+                message="Equity must remain positive.",
+            )
+        )
+    else:
+        if position_value / equity > limits.max_leverage:
+            errors.append(
+                VerificationError(
+                    code="leverage_limit",
+                    message="Projected leverage exceeds limit.",
+                )
+            )
+        if touched and position_value > limits.max_position_value:
+            errors.append(
+                VerificationError(
+                    code="position_value_limit",
+                    message=f"Position value for {action.symbol} exceeds limit.",
+                )
+            )
+        if touched and position_value / equity > limits.max_position_pct:
+            errors.append(
+                VerificationError(
+                    code="position_concentration",
+                    message=f"Position concentration for {action.symbol} exceeds limit.",
+                )
+            )
+
+    return VerificationResult(accepted=not errors, errors=errors)
+
+
+def verify_transition_full(state: State, action: Action) -> VerificationResult:
+    """Reference check that projects and scans every position."""
     errors: List[VerificationError] = []
 
     if action.quantity <= 0 or action.price <= 0:
@@ -0,0 +1,73 @@
+from pathlib import Path
+
+import pytest
+
+from services.core.actions import PlaceBuy
+from services.core.artifacts import ArtifactWriter, AsyncArtifactWriter
+from services.core.loop import run_loop
+from services.core.market import MarketPath
+from services.core.simulator import simulate_plan
+from services.core.state import RiskLimits, State
+from services.core.strategy import load_strategy
+
+FIXTURE_PATH = Path("examples/fixtures/trading_path.json")
+STRATEGY_PATH = Path("examples/strategies/threshold_demo.json")
+
+
+def _simulations(count: int):
+    market_path = MarketPath.from_fixture(FIXTURE_PATH)
+    state = State(cash_balance=1_000.0, risk_limits=RiskLimits(2.0, 0.8, 5_000.0))
+    return [
+        simulate_plan(state, [PlaceBuy(symbol="AAPL", quantity=1, price=0.0)], market_path)
+        for _ in range(count)
+    ]
+
+
+def _files(root: Path):
+    return {path.relative_to(root): path.read_bytes() for path in root.rglob("*.json")}
+
+
+def test_async_writer_matches_sync_writer_under_backpressure(tmp_path):
+    results = _simulations(12)
+    sync_writer = ArtifactWriter(tmp_path / "sync")
+    expected = [sync_writer.write(result) for result in results]
+
+    with AsyncArtifactWriter(tmp_path / "async", max_workers=3, max_pending=2) as writer:
+        paths = [writer.write(result) for result in results]
+
+    assert [path["decision"].name for path in paths] == [
+        path["decision"].name for path in expected
+    ]
+    assert _files(tmp_path / "async") == _files(tmp_path / "sync")
+    assert len(_files(tmp_path / "async")) == 36
+
+
+def test_async_writer_raises_write_errors(tmp_path):
+    blocked = tmp_path / "blocked"
+    blocked.write_text("not a directory")
+    writer = AsyncArtifactWriter(blocked)
+    writer.write(_simulations(1)[0])
+
+    with pytest.raises(OSError):
+        writer.close()
+    with pytest.raises(ValueError):
+        writer.write(_simulations(1)[0])
+
+
+def test_loop_artifacts_are_written_before_return(tmp_path):
+    market_path = MarketPath.from_fixture(FIXTURE_PATH)
+    strategy = load_strategy(STRATEGY_PATH)
+    for name, workers in (("inline", 0), ("pool", 4)):
+        run_loop(
+            market_path=market_path,
+            strategy=strategy,
+            steps=len(market_path.steps),
+            data_dir=tmp_path / name,
+            artifact_workers=workers,
+        )
+
+    inline = _files(tmp_path / "inline" / "artifacts")
+    pool = _files(tmp_path / "pool" / "artifacts")
+    assert inline
+    assert sorted(path.name for path in pool) == sorted(path.name for path in inline)
+    assert len(pool) == len(inline)
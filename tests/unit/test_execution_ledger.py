@@ -45,13 +45,6 @@ def test_execution_rows_are_sequential() -> None:
         PlaceBuy(symbol="AAPL", quantity=1.0, price=100.0),
         PlaceBuy(symbol="MSFT", quantity=1.0, price=200.0),
     ]
-    next_state = State(
-        cash_balance=700.0,
-        positions={"AAPL": 1.0, "MSFT": 1.0},
-        exposure=300.0,
-        risk_limits=prior_state.risk_limits,
-    )
-
     rows = _execution_rows_for_actions(
         step_index=1,
         run_id="run-1",
@@ -59,7 +52,6 @@ def test_execution_rows_are_sequential() -> None:
         actions=actions,
         prices={"AAPL": 100.0, "MSFT": 200.0},
         prior_state=prior_state,
-        next_state=next_state,
         reason="AAPL: price < buy_below; MSFT: price < buy_below",
         verification="verified OK",
     )
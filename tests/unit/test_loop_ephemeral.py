@@ -0,0 +1,43 @@
+from pathlib import Path
+
+from services.core.loop import run_loop
+from services.core.market import MarketPath
+from services.core.strategy import load_strategy
+
+FIXTURE_PATH = Path("examples/fixtures/trading_path.json")
+STRATEGY_PATH = Path("examples/strategies/threshold_demo.json")
+
+
+def _loop(data_dir: Path, **options):
+    market_path = MarketPath.from_fixture(FIXTURE_PATH)
+    return run_loop(
+        market_path=market_path,
+        strategy=load_strategy(STRATEGY_PATH),
+        steps=len(market_path.steps),
+        data_dir=data_dir,
+        **options,
+    )
+
+
+def _decisions(result):
+    return [(row.step_index, row.decision, row.why, row.state_delta) for row in result.tape_rows]
+
+
+def test_ephemeral_loop_matches_disk_loop_without_writing(tmp_path):
+    on_disk = _loop(tmp_path / "disk")
+    ephemeral = _loop(tmp_path / "memory", ephemeral=True)
+
+    assert _decisions(ephemeral) == _decisions(on_disk)
+    assert ephemeral.final_state == on_disk.final_state
+    assert any(row.decision != "HOLD" for row in ephemeral.tape_rows)
+    assert not (tmp_path / "memory").exists()
+
+
+def test_ephemeral_loop_materializes_artifacts_on_request(tmp_path):
+    result = _loop(tmp_path, ephemeral=True, materialize_artifacts=True)
+
+    run_dirs = {row.artifact_dir for row in result.tape_rows if row.decision != "HOLD"}
+    assert run_dirs
+    for run_dir in run_dirs:
+        assert (Path(run_dir) / "decision.json").exists()
+    assert not (tmp_path / "state.json").exists()
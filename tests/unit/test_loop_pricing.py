@@ -0,0 +1,49 @@
+from pathlib import Path
+
+from services.core.loop import run_loop
+from services.core.loop.run import INITIAL_CASH
+from services.core.market import MarketPath
+from services.core.strategy import load_strategy
+
+STRATEGY_PATH = Path("examples/strategies/threshold_demo.json")
+
+
+def test_multi_action_step_trades_at_its_own_prices(tmp_path):
+    market_path = MarketPath(
+        symbols=["AAPL", "MSFT"],
+        steps=[{"AAPL": 101.0, "MSFT": 200.0}, {"AAPL": 99.0, "MSFT": 196.0}],
+    )
+    result = run_loop(
+        market_path=market_path,
+        strategy=load_strategy(STRATEGY_PATH),
+        steps=2,
+        data_dir=tmp_path,
+        ephemeral=True,
+    )
+
+    rows = result.execution_rows
+    assert [(row.step_index, row.symbol, row.price) for row in rows] == [
+        (1, "AAPL", 99.0),
+        (1, "MSFT", 196.0),
+    ]
+    assert rows[1].cash_before == rows[0].cash_after
+    assert result.final_state.cash_balance == rows[-1].cash_after == INITIAL_CASH - 99.0 - 196.0
+
+
+def test_single_trade_is_priced_at_its_own_step(tmp_path):
+    market_path = MarketPath(
+        symbols=["AAPL", "MSFT"],
+        steps=[{"AAPL": 101.0 + step, "MSFT": 200.0} for step in range(3)]
+        + [{"AAPL": 99.5, "MSFT": 200.0}],
+    )
+    result = run_loop(
+        market_path=market_path,
+        strategy=load_strategy(STRATEGY_PATH),
+        steps=4,
+        data_dir=tmp_path,
+        ephemeral=True,
+    )
+
+    assert [(row.step_index, row.price) for row in result.execution_rows] == [(3, 99.5)]
+    assert result.tape_rows[3].state_delta["cash"]["delta"] == -99.5
+    assert result.final_state.cash_balance == INITIAL_CASH - 99.5
@@ -0,0 +1,145 @@
+from pathlib import Path
+
+import pytest
+
+from services.core.loop import run_loop
+from services.core.loop.schedule import CadenceScheduler
+from services.core.market import MarketPath
+from services.core.market.generator import generate_market_path
+from services.core.strategy import load_strategy
+from services.core.strategy.types import (
+    StrategyMetadata,
+    StrategySizing,
+    StrategySpec,
+    StrategyTiming,
+    StrategyUniverse,
+    ThresholdPriceRule,
+)
+from services.core.strategy.vectorized import precompute_signals
+
+FIXTURE_PATH = Path("examples/fixtures/trading_path.json")
+STRATEGY_PATH = Path("examples/strategies/threshold_demo.json")
+
+
+def _with_cadence(strategy, frequency: int):
+    return strategy.model_copy(
+        update={"timing": StrategyTiming(evaluation_frequency_steps=frequency)}
+    )
+
+
+def test_scheduler_interleaves_cadences():
+    scheduler = CadenceScheduler([2, 3], n_steps=10)
+
+    assert list(scheduler) == [
+        (0, [0, 1]),
+        (2, [0]),
+        (3, [1]),
+        (4, [0]),
+        (6, [0, 1]),
+        (8, [0]),
+        (9, [1]),
+    ]
+    assert scheduler.evaluation_count == 7
+    assert list(CadenceScheduler([4], n_steps=10)) == [(0, [0]), (4, [0]), (8, [0])]
+    first, second = (due for _, due in CadenceScheduler([1, 1], n_steps=2))
+    first.append(9)
+    assert second == [0, 1]
+    with pytest.raises(ValueError):
+        CadenceScheduler([0], n_steps=10)
+
+
+def test_loop_only_evaluates_on_cadence(tmp_path):
+    market_path = MarketPath.from_fixture(FIXTURE_PATH)
+    strategy = load_strategy(STRATEGY_PATH)
+    steps = len(market_path.steps)
+
+    every_step = run_loop(
+        market_path=market_path, strategy=strategy, steps=steps, data_dir=tmp_path / "a"
+    )
+    as_list = run_loop(
+        market_path=market_path, strategy=[strategy], steps=steps, data_dir=tmp_path / "b"
+    )
+    sparse = run_loop(
+        market_path=market_path,
+        strategy=_with_cadence(strategy, 3),
+        steps=steps,
+        data_dir=tmp_path / "c",
+    )
+
+    assert [row.step_index for row in every_step.tape_rows] == list(range(steps))
+    assert [row.decision for row in as_list.tape_rows] == [
+        row.decision for row in every_step.tape_rows
+    ]
+    assert [row.step_index for row in sparse.tape_rows] == list(range(0, steps, 3))
+
+
+def test_loop_interleaves_strategies(tmp_path):
+    market_path = MarketPath.from_fixture(FIXTURE_PATH)
+    strategy = load_strategy(STRATEGY_PATH)
+    steps = len(market_path.steps)
+
+    result = run_loop(
+        market_path=market_path,
+        strategy=[_with_cadence(strategy, 2), _with_cadence(strategy, 3)],
+        steps=steps,
+        data_dir=tmp_path,
+    )
+
+    expected = [step for step in range(steps) if step % 2 == 0 or step % 3 == 0]
+    assert [row.step_index for row in result.tape_rows] == expected
+    for bundle in result.execution_bundles:
+        assert bundle.step_index in expected
+
+
+def test_strategies_due_on_one_step_size_against_each_other(tmp_path):
+    market_path = MarketPath(symbols=["AAPL", "MSFT"], steps=[{"AAPL": 100.0, "MSFT": 50.0}])
+    strategies = [
+        StrategySpec(
+            metadata=StrategyMetadata(name=name, version="1", description=""),
+            universe=StrategyUniverse(symbols=symbols),
+            sizing=StrategySizing(max_position_qty_per_symbol=1, order_qty=1),
+            rules=[ThresholdPriceRule(symbol=symbol, buy_below=1_000.0) for symbol in symbols],
+        )
+        for name, symbols in (("first", ["AAPL"]), ("second", ["AAPL", "MSFT"]))
+    ]
+
+    result = run_loop(market_path=market_path, strategy=strategies, steps=1, data_dir=tmp_path)
+
+    assert [(row.symbol, row.side) for row in result.execution_rows] == [
+        ("AAPL", "BUY"),
+        ("MSFT", "BUY"),
+    ]
+    assert result.final_state.positions == {"AAPL": 1.0, "MSFT": 1.0}
+
+
+def test_multi_strategy_tape_shows_the_signal_behind_each_order(tmp_path):
+    market_path = MarketPath(symbols=["AAPL", "MSFT"], steps=[{"AAPL": 100.0, "MSFT": 50.0}])
+    strategies = [
+        StrategySpec(
+            metadata=StrategyMetadata(name=name, version="1", description=""),
+            universe=StrategyUniverse(symbols=[symbol]),
+            sizing=StrategySizing(max_position_qty_per_symbol=1, order_qty=1),
+            rules=[rule],
+        )
+        for name, symbol, rule in (
+            ("buyer", "AAPL", ThresholdPriceRule(symbol="AAPL", buy_below=1_000.0)),
+            ("watcher", "MSFT", ThresholdPriceRule(symbol="AAPL", sell_above=50.0)),
+        )
+    ]
+
+    result = run_loop(market_path=market_path, strategy=strategies, steps=1, data_dir=tmp_path)
+
+    row = result.tape_rows[0]
+    assert [action["type"] for action in row.actions] == ["PlaceBuy"]
+    assert row.signals["AAPL"] == "BUY"
+    assert result.execution_rows[0].reason.startswith("AAPL: price < buy_below")
+
+
+def test_precompute_is_exact_on_evaluation_steps():
+    market_path = generate_market_path(["AAPL", "MSFT"], n_steps=600, seed=3)
+    strategy = load_strategy("examples/strategies/sma_crossover_demo.json")
+    full = precompute_signals(strategy, market_path)
+    sparse = precompute_signals(strategy, market_path, evaluation_steps=range(0, 600, 7))
+
+    for step_index in range(0, 600, 7):
+        assert sparse.evaluation(step_index) == full.evaluation(step_index)
@@ -0,0 +1,65 @@
+from pathlib import Path
+
+from services.core.loop import run_loop
+from services.core.loop.run import _execution_rows_for_actions
+from services.core.market import MarketPath
+from services.core.simulator import simulate_plan
+from services.core.state import RiskLimits, State
+from services.core.strategy import load_strategy, signals_to_actions
+from services.core.strategy.vectorized import precompute_signals
+
+FIXTURE_PATH = Path("examples/fixtures/trading_path.json")
+STRATEGY_PATH = Path("examples/strategies/threshold_demo.json")
+
+
+def test_ledger_and_events_follow_executed_states(tmp_path):
+    market_path = MarketPath.from_fixture(FIXTURE_PATH)
+    result = run_loop(
+        market_path=market_path,
+        strategy=load_strategy(STRATEGY_PATH),
+        steps=len(market_path.steps),
+        data_dir=tmp_path,
+        ephemeral=True,
+    )
+
+    rows = result.execution_rows
+    assert rows
+    for previous, current in zip(rows, rows[1:]):
+        assert current.cash_before == previous.cash_after
+    assert rows[-1].cash_after == result.final_state.cash_balance
+
+    for bundle in result.execution_bundles:
+        prices = market_path.price_context(bundle.step_index)
+        for event, row in zip(bundle.events, bundle.ledger_rows):
+            assert event.price == row.price == prices[row.symbol]
+            assert (event.cash_before, event.cash_after) == (row.cash_before, row.cash_after)
+            assert (event.exposure_before, event.exposure_after) == (
+                row.exposure_before,
+                row.exposure_after,
+            )
+
+
+def test_trajectory_rows_match_reapplied_actions():
+    market_path = MarketPath.from_fixture(FIXTURE_PATH)
+    strategy = load_strategy(STRATEGY_PATH)
+    state = State(cash_balance=1_000.0, risk_limits=RiskLimits(2.0, 0.8, 5_000.0))
+    signals = precompute_signals(strategy, market_path, n_steps=1).evaluation(0).signals
+    prices = market_path.price_context(0)
+    actions = signals_to_actions(strategy, state, prices, signals)
+    assert actions
+    step_path = MarketPath(symbols=market_path.symbols, steps=[prices] * len(actions))
+    simulation = simulate_plan(state, actions, step_path)
+    common = dict(
+        step_index=0,
+        run_id=simulation.run_id,
+        decision="APPROVED",
+        actions=actions,
+        prices=prices,
+        reason="",
+        verification="verified OK",
+    )
+
+    reapplied = _execution_rows_for_actions(prior_state=state, **common)
+    single_pass = _execution_rows_for_actions(states=list(simulation.trajectory), **common)
+
+    assert single_pass == reapplied
@@ -0,0 +1,57 @@
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from services.core.market import MarketPath, generate_market_path
+from services.core.market.binary import (
+    is_binary_fixture,
+    open_binary_fixture,
+    read_binary_header,
+    write_binary_fixture,
+)
+
+FIXTURE_PATH = Path("examples/fixtures/trading_path.json")
+
+
+def test_binary_fixture_round_trip(tmp_path) -> None:
+    source = MarketPath.from_fixture(FIXTURE_PATH)
+    out_path = write_binary_fixture(tmp_path / "path.bin", source, provenance={"seed": 42})
+
+    assert is_binary_fixture(out_path)
+    assert not is_binary_fixture(FIXTURE_PATH)
+
+    header = read_binary_header(out_path)
+    assert header["symbols"] == ["AAPL", "MSFT"]
+    assert header["n_steps"] == len(source.steps)
+    assert header["dtype"] == "<f8"
+    assert header["provenance"] == {"seed": 42}
+    assert header["data_offset"] % 64 == 0
+
+    loaded = MarketPath.from_fixture(out_path)
+    assert loaded.metadata == {"seed": 42}
+    assert loaded.to_market_path() == source
+    for step_index in range(len(source.steps)):
+        assert loaded.price_context(step_index) == source.price_context(step_index)
+
+
+def test_binary_fixture_is_memory_mapped_read_only(tmp_path) -> None:
+    path = generate_market_path(["AAPL", "MSFT", "SPY"], n_steps=1_000, seed=7, mode="vectorized")
+    out_path = write_binary_fixture(tmp_path / "path.bin", path)
+
+    loaded = open_binary_fixture(out_path)
+
+    assert loaded.metadata == {"generator": "vectorized", "seed": 7}
+    assert np.array_equal(loaded.prices, path.prices)
+    assert not loaded.prices.flags.writeable
+    assert not loaded.prices.flags.owndata
+    with pytest.raises(ValueError):
+        loaded.history("SPY")[0] = 1.0
+
+
+def test_binary_fixture_rejects_truncated_matrix(tmp_path) -> None:
+    out_path = write_binary_fixture(tmp_path / "path.bin", MarketPath.from_fixture(FIXTURE_PATH))
+    out_path.write_bytes(out_path.read_bytes()[:-8])
+
+    with pytest.raises(ValueError):
+        open_binary_fixture(out_path)
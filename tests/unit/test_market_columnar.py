@@ -0,0 +1,87 @@
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from services.core.market import MarketPath
+from services.core.market.columnar import ColumnarMarketPath
+from services.core.state import RiskLimits, State
+from services.core.strategy.evaluate import evaluate_signals_with_rationale
+from services.core.strategy.types import (
+    MeanReversionRule,
+    SmaCrossoverRule,
+    StrategyMetadata,
+    StrategySizing,
+    StrategySpec,
+    StrategyUniverse,
+)
+
+FIXTURE_PATH = Path("examples/fixtures/trading_path.json")
+
+
+def test_columnar_round_trip_matches_dict_path() -> None:
+    path = MarketPath.from_fixture(FIXTURE_PATH)
+    columnar = path.to_columnar()
+
+    assert columnar.symbols == path.symbols
+    assert columnar.prices.shape == (len(path.steps), len(path.symbols))
+    assert columnar.steps == path.steps
+    for step_index in range(len(path.steps)):
+        assert columnar.price_context(step_index) == path.price_context(step_index)
+    assert columnar.to_market_path() == path
+
+
+def test_columnar_views_are_read_only_and_zero_copy() -> None:
+    prices = np.array([[100.0, 200.0], [101.0, 199.0], [102.0, 198.0]])
+    columnar = ColumnarMarketPath(symbols=["AAPL", "MSFT"], prices=prices)
+
+    view = columnar.step_view(1)
+    history = columnar.history("MSFT", end=2)
+
+    assert dict(view) == {"AAPL": 101.0, "MSFT": 199.0}
+    assert history.tolist() == [200.0, 199.0]
+    assert np.shares_memory(history, prices)
+    with pytest.raises(ValueError):
+        history[0] = 0.0
+    with pytest.raises(IndexError):
+        columnar.price_context(3)
+
+
+def test_columnar_missing_prices_behave_like_missing_keys() -> None:
+    path = MarketPath(
+        symbols=["AAPL", "MSFT"],
+        steps=[{"AAPL": 100.0}, {"AAPL": 101.0, "MSFT": 200.0}],
+    )
+    columnar = ColumnarMarketPath.from_market_path(path)
+
+    assert "MSFT" not in columnar.step_view(0)
+    assert columnar.step_view(0).get("MSFT") is None
+    assert columnar.price_context(0) == {"AAPL": 100.0}
+    assert columnar.steps == path.steps
+
+
+def test_strategy_evaluation_accepts_columnar_path() -> None:
+    path = MarketPath(
+        symbols=["AAPL"],
+        steps=[{"AAPL": price} for price in [100.0, 99.0, 101.0, 98.0, 97.5, 103.0]],
+    )
+    columnar = path.to_columnar()
+    spec = StrategySpec(
+        metadata=StrategyMetadata(name="Test", version="1", description=""),
+        universe=StrategyUniverse(symbols=["AAPL"]),
+        sizing=StrategySizing(max_position_qty_per_symbol=5, order_qty=1),
+        rules=[
+            SmaCrossoverRule(symbol="AAPL", short_window=2, long_window=3),
+            MeanReversionRule(symbol="AAPL", window=3, z_buy_below=-0.5, z_sell_above=0.5),
+        ],
+    )
+    state = State(cash_balance=1000.0, risk_limits=RiskLimits(2.0, 0.8, 5000.0))
+
+    for step_index in range(len(path.steps)):
+        expected = evaluate_signals_with_rationale(
+            spec, state, path.price_context(step_index), step_index, path
+        )
+        actual = evaluate_signals_with_rationale(
+            spec, state, columnar.price_context(step_index), step_index, columnar
+        )
+        assert actual == expected
@@ -1,3 +1,5 @@
+import pytest
+
 from services.core.market import generate_market_path
 
 
@@ -27,4 +29,31 @@ def test_market_generator_magnitude_sanity() -> None:
     msft_final = path.steps[-1]["MSFT"]
 
     assert 70 <= aapl_final <= 130
-    assert 140 <= msft_final <= 260
\ No newline at end of file
+    assert 140 <= msft_final <= 260
+
+
+def test_market_generator_vectorized_is_seed_stable() -> None:
+    path_one = generate_market_path(["AAPL", "MSFT"], n_steps=500, seed=42, mode="vectorized")
+    path_two = generate_market_path(["AAPL", "MSFT"], n_steps=500, seed=42, mode="vectorized")
+    path_other = generate_market_path(["AAPL", "MSFT"], n_steps=500, seed=43, mode="vectorized")
+
+    assert path_one.symbols == ["AAPL", "MSFT"]
+    assert path_one.prices.shape == (500, 2)
+    assert (path_one.prices == path_two.prices).all()
+    assert not (path_one.prices == path_other.prices).all()
+    assert (path_one.prices >= 0.01).all()
+
+
+def test_market_generator_vectorized_magnitude_sanity() -> None:
+    path = generate_market_path(["AAPL", "MSFT"], n_steps=20, seed=42, mode="vectorized")
+
+    assert 70 <= path.price_context(19)["AAPL"] <= 130
+    assert 140 <= path.price_context(19)["MSFT"] <= 260
+    assert path.price_context(0) == {
+        symbol: round(value, 2) for symbol, value in path.price_context(0).items()
+    }
+
+
+def test_market_generator_rejects_unknown_mode() -> None:
+    with pytest.raises(ValueError):
+        generate_market_path(["AAPL"], n_steps=5, mode="gpu")
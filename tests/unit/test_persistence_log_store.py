@@ -0,0 +1,122 @@
+import multiprocessing
+from contextlib import contextmanager
+from dataclasses import replace
+from pathlib import Path
+
+from services.core.actions import PlaceBuy
+from services.core.market import MarketPath
+from services.core.persistence import LogRunStore
+from services.core.simulator import simulate_plan
+from services.core.state import RiskLimits, State
+
+FIXTURE_PATH = Path("examples/fixtures/trading_path.json")
+
+
+def _simulation(run_id: str, quantity: int = 1):
+    market_path = MarketPath.from_fixture(FIXTURE_PATH)
+    state = State(cash_balance=1_000.0, risk_limits=RiskLimits(2.0, 0.8, 5_000.0))
+    plan = [PlaceBuy(symbol="AAPL", quantity=quantity, price=0.0)]
+    return simulate_plan(state, plan, market_path, run_id=run_id)
+
+
+def test_log_run_store_appends_and_indexes_runs(tmp_path):
+    path = tmp_path / "runs.jsonl"
+    store = LogRunStore(path)
+    first, second = _simulation("run-1"), _simulation("run-2", quantity=2)
+
+    store.save_run(first)
+    store.save_run(second)
+
+    assert path.read_bytes().count(b"\n") == 2
+    assert store.get_run("run-1") == first
+    assert store.get_run("run-2") == second
+    assert store.get_run("missing") is None
+    reopened = LogRunStore(path)
+    assert reopened.run_ids() == ["run-1", "run-2"]
+    assert reopened.get_run("run-2") == second
+
+
+def test_log_run_store_recovers_from_torn_append(tmp_path):
+    path = tmp_path / "runs.jsonl"
+    LogRunStore(path).save_run(_simulation("run-1"))
+    with path.open("ab") as handle:
+        handle.write(b'{"run_id":"run-2","approved":tr')
+
+    store = LogRunStore(path)
+    assert store.run_ids() == ["run-1"]
+    store.save_run(_simulation("run-3"))
+
+    assert path.read_bytes().count(b"\n") == 2
+    assert LogRunStore(path).run_ids() == ["run-1", "run-3"]
+
+
+def test_log_run_store_compacts_superseded_runs(tmp_path):
+    path = tmp_path / "runs.jsonl"
+    store = LogRunStore(path, compact_min_bytes=1, compact_dead_ratio=0.3)
+    original = _simulation("run-1")
+    updated = replace(original, planner_name="retry")
+
+    store.save_run(original)
+    store.save_run(_simulation("run-2"))
+    store.save_run(updated)
+    store.wait_for_compaction()
+
+    assert path.read_bytes().count(b"\n") == 2
+    assert store.get_run("run-1") == updated
+    assert LogRunStore(path).get_run("run-1") == updated
+    assert store.run_ids() == ["run-2", "run-1"]
+
+
+def test_log_run_store_compaction_keeps_appends_made_meanwhile(tmp_path, monkeypatch):
+    path = tmp_path / "runs.jsonl"
+    store = LogRunStore(path)
+    other_process = LogRunStore(path)
+    for run_id in ("run-1", "run-2", "run-1"):
+        store.save_run(_simulation(run_id))
+    file_lock = store._file_lock
+
+    @contextmanager
+    def append_before_rename(exclusive):
+        if exclusive:
+            other_process.save_run(_simulation("run-3"))
+            store.save_run(_simulation("run-2", quantity=2))
+        with file_lock(exclusive):
+            yield
+
+    monkeypatch.setattr(store, "_file_lock", append_before_rename)
+    store.compact()
+
+    assert path.read_bytes().count(b"\n") == 4
+    assert store.run_ids() == ["run-1", "run-3", "run-2"]
+    for reader in (store, other_process, LogRunStore(path)):
+        assert reader.get_run("run-2") == _simulation("run-2", quantity=2)
+        assert reader.get_run("run-3") == _simulation("run-3")
+    monkeypatch.undo()
+    store.compact()
+    assert path.read_bytes().count(b"\n") == 3
+
+
+def _append_runs(path: Path, prefix: str) -> None:
+    store = LogRunStore(path)
+    for index in range(40):
+        store.save_run(_simulation(f"{prefix}-{index % 20}"))
+
+
+def test_log_run_store_shared_between_processes(tmp_path):
+    path = tmp_path / "runs.jsonl"
+    store = LogRunStore(path)
+    store.save_run(_simulation("seed"))
+    context = multiprocessing.get_context("fork")
+    workers = [context.Process(target=_append_runs, args=(path, name)) for name in "ab"]
+    for worker in workers:
+        worker.start()
+    while any(worker.is_alive() for worker in workers):
+        store.compact()
+    for worker in workers:
+        worker.join()
+        assert worker.exitcode == 0
+
+    expected = {"seed"} | {f"{name}-{index}" for name in "ab" for index in range(20)}
+    assert set(LogRunStore(path).run_ids()) == expected
+    store.compact()
+    assert path.read_bytes().count(b"\n") == len(expected)
@@ -0,0 +1,101 @@
+import gc
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import replace
+from pathlib import Path
+
+from services.core.actions import PlaceBuy
+from services.core.market import MarketPath
+from services.core.persistence import (
+    SqlitePolicyStore,
+    SqliteRunStore,
+    SqliteStateStore,
+    sqlite_stores,
+)
+from services.core.simulator import simulate_plan
+from services.core.state import RiskLimits, State
+
+FIXTURE_PATH = Path("examples/fixtures/trading_path.json")
+
+
+def _simulation(run_id: str, quantity: int = 1, **metadata):
+    market_path = MarketPath.from_fixture(FIXTURE_PATH)
+    state = State(cash_balance=1_000.0, risk_limits=RiskLimits(2.0, 0.8, 5_000.0))
+    plan = [PlaceBuy(symbol="AAPL", quantity=quantity, price=0.0)]
+    return simulate_plan(state, plan, market_path, run_id=run_id, **metadata)
+
+
+def _save_runs(db_path: Path, worker: int) -> None:
+    store = SqliteRunStore(db_path, batch_size=5)
+    for index in range(10):
+        store.save_run(_simulation(f"worker-{worker}-{index}", policy_hash="shared"))
+    store.close()
+
+
+def test_sqlite_stores_round_trip_state_runs_and_policies(tmp_path):
+    db_path = tmp_path / "store.db"
+    state = State(cash_balance=500.0, risk_limits=RiskLimits(2.0, 0.8, 5_000.0))
+    state_store = SqliteStateStore(db_path)
+    run_store = SqliteRunStore(db_path)
+    policy_store = SqlitePolicyStore(db_path)
+
+    assert state_store.get_current_state() is None
+    state_store.init_state(state)
+    run = _simulation("run-1")
+    run_store.save_run(run)
+    policy_store.save_policy({"policy_id": "p1", "rules": []})
+
+    assert SqliteStateStore(db_path).get_current_state() == state
+    assert SqliteRunStore(db_path).get_run("run-1") == run
+    assert SqliteRunStore(db_path).get_run("missing") is None
+    assert SqlitePolicyStore(db_path).get_policy("p1") == {"policy_id": "p1", "rules": []}
+
+
+def test_sqlite_run_store_batches_commits_and_filters_runs(tmp_path):
+    db_path = tmp_path / "store.db"
+    store = SqliteRunStore(db_path, batch_size=3)
+    approved = _simulation("run-1", policy_hash="h1", planner_name="a")
+    rejected = _simulation("run-2", quantity=10_000, policy_hash="h1", planner_name="b")
+    store.save_run(approved)
+    store.save_run(rejected)
+
+    assert store.get_run("run-2") == rejected
+    assert SqliteRunStore(db_path).get_run("run-2") is None
+    store.flush()
+    store.save_run(replace(approved, run_id="run-3", policy_hash="h2"))
+    store.close()
+
+    reader = SqliteRunStore(db_path)
+    assert not rejected.approved
+    assert reader.query_runs(policy_hash="h1", approved=False) == ["run-2"]
+    assert reader.query_runs(policy_hash="h1") == ["run-1", "run-2"]
+    assert reader.query_runs(planner_name="a") == ["run-1", "run-3"]
+    assert reader.query_runs(limit=1) == ["run-1"]
+
+
+def test_sqlite_run_store_shared_by_worker_processes(tmp_path):
+    db_path = tmp_path / "store.db"
+    SqliteRunStore(db_path).close()
+    with ProcessPoolExecutor(max_workers=3) as pool:
+        list(pool.map(_save_runs, [db_path] * 3, range(3)))
+
+    assert len(SqliteRunStore(db_path).query_runs(policy_hash="shared")) == 30
+
+
+def test_sqlite_run_store_pending_batch_does_not_hold_the_write_lock(tmp_path, monkeypatch):
+    monkeypatch.setattr(sqlite_stores, "BUSY_TIMEOUT_SECONDS", 0.1)
+    db_path = tmp_path / "store.db"
+    batched = SqliteRunStore(db_path, batch_size=10)
+    batched.save_run(_simulation("pending"))
+
+    with SqliteRunStore(db_path) as other:
+        other.save_run(_simulation("other"))
+        assert other.query_runs() == ["other"]
+    assert batched.get_run("pending") == _simulation("pending")
+
+    with SqliteRunStore(db_path, batch_size=10, max_batch_seconds=0.0) as timed:
+        timed.save_run(_simulation("timed"))
+        assert SqliteRunStore(db_path).get_run("timed") is not None
+
+    del batched
+    gc.collect()
+    assert SqliteRunStore(db_path).query_runs() == ["pending", "other", "timed"]
@@ -2,7 +2,7 @@ from pathlib import Path
 
 from services.core.actions import PlaceBuy, PlaceSell
 from services.core.market import MarketPath
-from services.core.simulator import simulate_plan
+from services.core.simulator import simulate_plan, simulate_plan_lean
 from services.core.state import RiskLimits, State
 
 FIXTURE_PATH = Path("examples/fixtures/trading_path.json")
@@ -49,3 +49,41 @@ def test_simulator_uses_fixture_prices_deterministically():
     result = simulate_plan(state, plan, market_path)
 
     assert result.steps[0].price_context == market_path.price_context(0)
+
+
+def test_simulate_plan_lean_matches_full_simulation():
+    market_path = MarketPath.from_fixture(FIXTURE_PATH)
+    state = State(cash_balance=10_000.0, risk_limits=RiskLimits(2.0, 0.6, 50_000.0))
+    plan = [
+        PlaceBuy(symbol="AAPL", quantity=10, price=0.0),
+        PlaceBuy(symbol="MSFT", quantity=5, price=0.0),
+        PlaceSell(symbol="AAPL", quantity=4, price=0.0),
+    ]
+
+    full = simulate_plan(state, plan, market_path)
+    lean = simulate_plan_lean(state, plan, market_path)
+
+    assert lean.approved and full.approved
+    assert lean.rejected_step_index is None
+    assert lean.final_state == full.trajectory[-1]
+    assert lean.steps_evaluated == len(plan)
+    assert lean.errors == []
+
+
+def test_simulate_plan_lean_reports_rejected_step():
+    market_path = MarketPath.from_fixture(FIXTURE_PATH)
+    state = State(cash_balance=1_000.0, risk_limits=RiskLimits(2.0, 0.8, 5_000.0))
+    plan = [
+        PlaceBuy(symbol="AAPL", quantity=1, price=0.0),
+        PlaceBuy(symbol="AAPL", quantity=20, price=0.0),
+        PlaceBuy(symbol="AAPL", quantity=1, price=0.0),
+    ]
+
+    full = simulate_plan(state, plan, market_path)
+    lean = simulate_plan_lean(state, plan, market_path)
+
+    assert not lean.approved
+    assert lean.rejected_step_index == full.rejected_step_index == 1
+    assert lean.final_state == full.trajectory[-1]
+    assert lean.steps_evaluated == 2
+    assert lean.errors == full.steps[1].errors
@@ -0,0 +1,68 @@
+from pathlib import Path
+
+import pytest
+
+from services.core.actions import PlaceBuy, PlaceSell
+from services.core.market import MarketPath
+from services.core.simulator import (
+    batch_run_id,
+    best_approved,
+    simulate_many,
+    simulate_plan,
+)
+from services.core.state import RiskLimits, State
+
+FIXTURE_PATH = Path("examples/fixtures/trading_path.json")
+
+
+def _plans():
+    return [
+        [PlaceBuy(symbol="AAPL", quantity=quantity, price=0.0)] for quantity in (1, 2, 50, 3)
+    ] + [
+        [
+            PlaceBuy(symbol="MSFT", quantity=1, price=0.0),
+            PlaceSell(symbol="MSFT", quantity=1, price=0.0),
+        ]
+    ]
+
+
+def test_simulate_many_matches_simulate_plan_in_input_order():
+    market_path = MarketPath.from_fixture(FIXTURE_PATH)
+    state = State(cash_balance=1_000.0, risk_limits=RiskLimits(2.0, 0.8, 5_000.0))
+    plans = _plans()
+
+    results = simulate_many(state, plans, market_path, batch_id="batch-1", max_workers=3)
+
+    assert [result.run_id for result in results] == [
+        batch_run_id("batch-1", index) for index in range(len(plans))
+    ]
+    for index, (plan, result) in enumerate(zip(plans, results)):
+        expected = simulate_plan(state, plan, market_path, run_id=result.run_id)
+        assert result == expected, index
+    assert [result.approved for result in results] == [True, True, False, True, True]
+
+
+@pytest.mark.parametrize("executor", ["serial", "process"])
+def test_simulate_many_run_ids_are_deterministic(executor):
+    market_path = MarketPath.from_fixture(FIXTURE_PATH)
+    state = State(cash_balance=1_000.0, risk_limits=RiskLimits(2.0, 0.8, 5_000.0))
+
+    first = simulate_many(state, _plans(), market_path, executor=executor, max_workers=2)
+    second = simulate_many(state, _plans(), market_path, executor="thread", max_workers=2)
+
+    assert [result.run_id for result in first] == [result.run_id for result in second]
+    assert first == second
+
+
+def test_simulate_many_lean_verdicts_and_best_approved():
+    market_path = MarketPath.from_fixture(FIXTURE_PATH)
+    state = State(cash_balance=1_000.0, risk_limits=RiskLimits(2.0, 0.8, 5_000.0))
+
+    verdicts = simulate_many(state, _plans(), market_path, lean=True)
+    best = best_approved(verdicts, lambda verdict: -verdict.final_state.cash_balance)
+
+    assert [verdict.rejected_step_index for verdict in verdicts] == [None, None, 0, None, None]
+    assert best == 3
+    assert best_approved(verdicts[2:3], lambda verdict: 0.0) is None
+    with pytest.raises(ValueError):
+        simulate_many(state, _plans(), market_path, executor="gpu")
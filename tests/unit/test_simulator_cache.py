@@ -0,0 +1,118 @@
+from dataclasses import replace
+from pathlib import Path
+from unittest.mock import ANY
+
+from services.core.actions import PlaceBuy
+from services.core.market import MarketPath
+from services.core.simulator import SimulationCache, simulate_plan, simulation_cache_key
+from services.core.simulator.codec import MAGIC, encode_simulation
+from services.core.state import RiskLimits, State
+
+FIXTURE_PATH = Path("examples/fixtures/trading_path.json")
+
+
+def _inputs():
+    market_path = MarketPath.from_fixture(FIXTURE_PATH)
+    state = State(cash_balance=1_000.0, risk_limits=RiskLimits(2.0, 0.8, 5_000.0))
+    plan = [
+        PlaceBuy(symbol="AAPL", quantity=1, price=0.0),
+        PlaceBuy(symbol="MSFT", quantity=1, price=0.0),
+    ]
+    return state, plan, market_path
+
+
+def test_simulation_cache_key_tracks_inputs():
+    state, plan, market_path = _inputs()
+    key = simulation_cache_key(state, plan, market_path, policy_hash="abc")
+
+    repriced = [PlaceBuy(symbol="AAPL", quantity=1, price=123.0), plan[1]]
+    assert simulation_cache_key(state, repriced, market_path, policy_hash="abc") == key
+    assert simulation_cache_key(state, plan, market_path, policy_hash="def") != key
+    assert simulation_cache_key(state, plan[:1], market_path, policy_hash="abc") != key
+    richer = State(cash_balance=2_000.0, risk_limits=state.risk_limits)
+    assert simulation_cache_key(richer, plan, market_path, policy_hash="abc") != key
+
+
+def test_simulation_cache_handles_plans_that_outrun_the_path():
+    state, _, market_path = _inputs()
+    short_path = MarketPath(
+        symbols=market_path.symbols, steps=[market_path.steps[0], {"MSFT": 200.0}]
+    )
+    plan = [PlaceBuy(symbol="AAPL", quantity=1_000, price=0.0)] + [
+        PlaceBuy(symbol="AAPL", quantity=1, price=0.0)
+    ] * (len(short_path.steps) + 3)
+    cache = SimulationCache(max_entries=4)
+
+    expected = simulate_plan(state, plan, short_path, run_id="run-1")
+    first = cache.simulate(state, plan, short_path, run_id="run-1")
+    second = cache.simulate(state, plan, short_path, run_id="run-1")
+
+    assert (expected.approved, expected.rejected_step_index) == (False, 0)
+    assert first == expected and second == expected
+    assert cache.stats().hits == 1
+
+
+def test_simulation_cache_memory_hit_returns_fresh_run_id():
+    state, plan, market_path = _inputs()
+    cache = SimulationCache(max_entries=4)
+
+    first = cache.simulate(state, plan, market_path, policy_id="default", policy_hash="abc")
+    second = cache.simulate(state, plan, market_path, policy_id="other", policy_hash="abc")
+
+    assert second.run_id != first.run_id
+    assert second.policy_id == "other"
+    assert second.trajectory == first.trajectory
+    assert second.steps == first.steps
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.memory_hits, stats.entries) == (1, 1, 1, 1)
+
+
+def test_simulation_cache_disk_tier_survives_new_process(tmp_path):
+    state, plan, market_path = _inputs()
+    SimulationCache(cache_dir=tmp_path).simulate(state, plan, market_path)
+
+    cache = SimulationCache(cache_dir=tmp_path)
+    result = cache.simulate(state, plan, market_path, run_id="run-1")
+    expected = simulate_plan(state, plan, market_path, run_id="run-1")
+
+    assert result == expected
+    assert cache.stats().disk_hits == 1
+    assert cache.simulate(state, plan, market_path).approved
+    assert cache.stats().memory_hits == 1
+
+
+def test_simulation_cache_hits_do_not_share_mutable_results():
+    state, plan, market_path = _inputs()
+    cache = SimulationCache(max_entries=4)
+
+    first = cache.simulate(state, plan, market_path)
+    first.steps.clear()
+    second = cache.simulate(state, plan, market_path)
+    second.steps[0].state_delta["cash"]["after"] = 0.0
+    second.steps[0].errors.append("tampered")
+    second.trajectory.append(state)
+
+    assert cache.simulate(state, plan, market_path) == replace(
+        simulate_plan(state, plan, market_path), run_id=ANY
+    )
+
+
+def test_simulation_cache_drops_unreadable_disk_entries(tmp_path):
+    state, plan, market_path = _inputs()
+    key = simulation_cache_key(state, plan, market_path)
+    SimulationCache(cache_dir=tmp_path).simulate(state, plan, market_path)
+    entry = tmp_path / f"{key}.json"
+
+    binary = encode_simulation(simulate_plan(state, plan, market_path), "binary")
+    for payload in (
+        entry.read_bytes()[:40],
+        binary[:-7],
+        MAGIC + b"\x63",
+        b'{"run_id": "x"}',
+    ):
+        entry.write_bytes(payload)
+        cache = SimulationCache(cache_dir=tmp_path)
+        assert cache.get(key) is None
+        assert not entry.exists()
+        assert cache.simulate(state, plan, market_path).approved
+        assert entry.exists()
@@ -0,0 +1,73 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from services.core.actions import PlaceBuy, PlaceSell
+from services.core.market import MarketPath
+from services.core.persistence import SqliteRunStore
+from services.core.simulator import decode_simulation, encode_simulation, simulate_plan
+from services.core.simulator.codec import MAGIC
+from services.core.state import RiskLimits, State
+
+FIXTURE_PATH = Path("examples/fixtures/trading_path.json")
+
+
+def _simulation():
+    market_path = MarketPath.from_fixture(FIXTURE_PATH)
+    state = State(cash_balance=1_000.0, risk_limits=RiskLimits(2.0, 0.8, 5_000.0))
+    plan = [
+        PlaceBuy(symbol="AAPL", quantity=2, price=0.0),
+        PlaceSell(symbol="AAPL", quantity=1, price=0.0),
+        PlaceBuy(symbol="AAPL", quantity=10_000, price=0.0),
+    ]
+    return simulate_plan(
+        state,
+        plan,
+        market_path,
+        run_id="run-1",
+        policy_hash="abc",
+        planner_metadata={"seed": -3, "notes": ["a", None, 1.5]},
+    )
+
+
+def test_codec_round_trips_json_and_binary():
+    result = _simulation()
+
+    for codec_format in ("json", "binary"):
+        assert decode_simulation(encode_simulation(result, codec_format)) == result
+
+    document = json.loads(encode_simulation(result))
+    assert document["trajectory"]["initial"]["risk_limits"]["max_leverage"] == 2.0
+    assert set(document) == {
+        "run_id",
+        "approved",
+        "rejected_step_index",
+        "planner",
+        "policy",
+        "trajectory",
+        "steps",
+    }
+
+
+def test_binary_codec_interns_strings_and_risk_limits():
+    result = _simulation()
+    binary = encode_simulation(result, "binary")
+
+    assert binary.startswith(MAGIC)
+    assert len(binary) < len(encode_simulation(result))
+    assert binary.count(b"max_position_value") == 1
+    assert binary.count(b"\x04AAPL") == 1
+    with pytest.raises(ValueError):
+        decode_simulation(MAGIC + b"\x63")
+    with pytest.raises(ValueError):
+        encode_simulation(result, "xml")
+
+
+def test_sqlite_run_store_reads_both_encodings(tmp_path):
+    result = _simulation()
+    SqliteRunStore(tmp_path / "store.db", codec="binary").save_run(result)
+
+    assert SqliteRunStore(tmp_path / "store.db").get_run("run-1") == result
+    with pytest.raises(ValueError):
+        SqliteRunStore(tmp_path / "store.db", codec="xml")
@@ -0,0 +1,60 @@
+import math
+import random
+
+import pytest
+
+from services.core.actions import PlaceBuy, PlaceSell
+from services.core.market import generate_market_path
+from services.core.simulator import simulate_plan
+from services.core.simulator.monte_carlo import generate_price_paths, simulate_monte_carlo
+from services.core.state import RiskLimits, State
+
+TICKERS = ["AAPL", "MSFT"]
+
+
+def _plan(length: int, seed: int = 5):
+    rng = random.Random(seed)
+    return [
+        rng.choice([PlaceBuy, PlaceBuy, PlaceSell])(
+            symbol=rng.choice(TICKERS), quantity=rng.randint(1, 3), price=0.0
+        )
+        for _ in range(length)
+    ]
+
+
+def test_monte_carlo_matches_single_path_simulation():
+    state = State(
+        cash_balance=30_000.0,
+        positions={"AAPL": 4.0, "MSFT": 4.0},
+        risk_limits=RiskLimits(2.0, 0.5, 6_000.0),
+    )
+    plan = _plan(40)
+
+    result = simulate_monte_carlo(state, plan, TICKERS, n_paths=25, seed=100, mode="python")
+
+    assert result.seeds == list(range(100, 125))
+    assert 0 < result.approval_rate < 1
+    for index, seed in enumerate(result.seeds):
+        path = generate_market_path(TICKERS, n_steps=len(plan), seed=seed)
+        expected = simulate_plan(state, plan, path)
+        assert bool(result.approved[index]) == expected.approved
+        expected_step = expected.rejected_step_index
+        assert result.rejected_step_index[index] == (-1 if expected_step is None else expected_step)
+        equity = expected.trajectory[-1].equity(path.price_context(len(plan) - 1))
+        assert math.isclose(result.final_equity[index], equity, rel_tol=1e-12)
+
+
+def test_monte_carlo_summary_and_validation():
+    state = State(cash_balance=500.0, risk_limits=RiskLimits(2.0, 0.8, 5_000.0))
+    plan = [PlaceBuy(symbol="AAPL", quantity=1, price=0.0)] * 6
+
+    result = simulate_monte_carlo(state, plan, TICKERS, n_paths=200, seed=1)
+    summary = result.to_dict()
+
+    assert summary["n_paths"] == 200
+    assert sum(summary["rejection_steps"].values()) == 200 - int(result.approved.sum())
+    assert set(summary["rejection_reasons"]) <= {"insufficient_cash", "position_concentration"}
+    assert summary["equity"]["p5"] <= summary["equity"]["p50"] <= summary["equity"]["p95"]
+    assert generate_price_paths(TICKERS, 3, 4, seed=1).shape == (3, 4, 2)
+    with pytest.raises(ValueError):
+        simulate_monte_carlo(state, [PlaceBuy("NVDA", 1, 0.0)], TICKERS, n_paths=2)
@@ -0,0 +1,70 @@
+import json
+import random
+
+import pytest
+
+from services.core.simulator import DeltaTrajectory, decode_simulation
+from services.core.simulator.codec import trajectory_from_payload
+from services.core.state import RiskLimits, State
+
+
+def _states(count: int, seed: int = 3):
+    rng = random.Random(seed)
+    limits = RiskLimits(2.0, 0.8, 5_000.0)
+    state = State(cash_balance=1_000.0, positions={"AAPL": 1.0}, risk_limits=limits)
+    states = [state]
+    for _ in range(count - 1):
+        positions = dict(state.positions)
+        symbol = rng.choice(["AAPL", "MSFT", "NVDA"])
+        if symbol in positions and rng.random() < 0.2:
+            del positions[symbol]
+        else:
+            positions[symbol] = positions.get(symbol, 0.0) + rng.randint(-3, 5)
+        if rng.random() < 0.05:
+            limits = RiskLimits(rng.random(), 0.5, 1_000.0)
+        state = State(
+            cash_balance=state.cash_balance - rng.random(),
+            positions=positions,
+            exposure=rng.random() * 100,
+            risk_limits=limits,
+        )
+        states.append(state)
+    return states
+
+
+def test_delta_trajectory_rebuilds_every_state():
+    states = _states(50)
+    trajectory = DeltaTrajectory.from_states(states, snapshot_interval=8)
+
+    assert len(trajectory) == 50
+    assert list(trajectory) == states
+    assert trajectory == states
+    assert [trajectory[index] for index in (49, 3, 17, 16, 0, -1, -50)] == [
+        states[index] for index in (49, 3, 17, 16, 0, -1, -50)
+    ]
+    assert trajectory[10:14] == states[10:14]
+    with pytest.raises(IndexError):
+        trajectory[50]
+
+
+def test_delta_trajectory_round_trips_through_json():
+    states = _states(20)
+    trajectory = DeltaTrajectory.from_states(states)
+    payload = json.loads(json.dumps(trajectory.to_dict()))
+
+    assert payload["encoding"] == "delta"
+    assert all(len(delta["positions"]) <= 1 for delta in payload["deltas"])
+    assert DeltaTrajectory.from_dict(payload, snapshot_interval=4) == states
+
+
+def test_legacy_list_trajectory_is_still_readable():
+    states = _states(5)
+    legacy = {
+        "run_id": "run-1",
+        "approved": True,
+        "trajectory": [state.to_dict() for state in states],
+        "steps": [],
+    }
+
+    assert trajectory_from_payload(legacy["trajectory"]) == states
+    assert decode_simulation(json.dumps(legacy)).trajectory == states
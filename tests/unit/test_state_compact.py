@@ -0,0 +1,85 @@
+import copy
+import pickle
+import random
+from dataclasses import replace
+
+import pytest
+
+from services.core.actions import PlaceBuy, PlaceSell
+from services.core.deltas.compute import compute_state_delta
+from services.core.market import MarketPath
+from services.core.simulator import simulate_plan
+from services.core.state import CompactState, RiskLimits, State
+from services.core.transitions import apply_action
+
+
+def test_compact_state_matches_state_api():
+    state = State(
+        cash_balance=500.0,
+        positions={"AAPL": 3.0, "MSFT": -2.0, "NVDA": 0.5},
+        exposure=12.5,
+        risk_limits=RiskLimits(2.0, 0.8, 5_000.0),
+    )
+    compact = CompactState.from_state(state)
+
+    assert compact == state and state == compact
+    assert compact.to_dict() == state.to_dict()
+    assert compact.to_state() == state
+    price_sets = ({"MSFT": 10.0}, {"NVDA": 3.0, "AAPL": 7.5}, {"AAPL": 1.0, "MSFT": 2.0, "X": 3.0})
+    for prices in price_sets:
+        assert compact.equity(prices) == state.equity(prices)
+        assert compact.exposure_value(prices) == state.exposure_value(prices)
+    with pytest.raises(AttributeError):
+        compact.cash_balance = 1.0
+
+
+def test_compact_state_is_a_state():
+    compact = CompactState(cash_balance=100.0, positions={"AAPL": 2.0}, exposure=4.0)
+
+    assert isinstance(compact, State)
+    richer = replace(compact, cash_balance=150.0)
+    assert isinstance(richer, CompactState)
+    assert richer == State(cash_balance=150.0, positions={"AAPL": 2.0}, exposure=4.0)
+    for clone in (pickle.loads(pickle.dumps(compact)), copy.deepcopy(compact)):
+        assert isinstance(clone, CompactState) and clone == compact
+
+
+def test_compact_state_updates_are_copy_on_write():
+    compact = CompactState(cash_balance=1_000.0, positions={"AAPL": 1.0})
+    bought = apply_action(compact, PlaceBuy(symbol="MSFT", quantity=2, price=10.0)).next_state
+    sold = apply_action(bought, PlaceSell(symbol="AAPL", quantity=1, price=5.0)).next_state
+
+    assert dict(compact.positions) == {"AAPL": 1.0}
+    assert dict(bought.positions) == {"AAPL": 1.0, "MSFT": 2.0}
+    assert dict(sold.positions) == {"AAPL": 0.0, "MSFT": 2.0}
+    assert sold.cash_balance == 985.0 and sold.exposure == 0.0
+    assert sold.changed_symbols(bought) == ("AAPL",)
+    assert sold.changed_symbols(compact) is None
+    delta = compute_state_delta(bought, sold, {"AAPL": 5.0})
+    assert delta["positions"] == {"AAPL": {"before": 1.0, "after": 0.0, "delta": -1.0}}
+
+
+def test_simulate_plan_with_compact_state_matches_dict_state():
+    rng = random.Random(11)
+    symbols = [f"S{index}" for index in range(40)]
+    steps = [{symbol: rng.uniform(5, 50) for symbol in symbols} for _ in range(200)]
+    market_path = MarketPath(symbols=symbols, steps=steps)
+    state = State(
+        cash_balance=100_000.0,
+        positions={symbol: float(rng.randint(5, 20)) for symbol in symbols},
+        risk_limits=RiskLimits(3.0, 0.9, 20_000.0),
+    )
+    plan = [
+        rng.choice([PlaceBuy, PlaceSell])(symbol=rng.choice(symbols), quantity=1, price=0.0)
+        for _ in range(200)
+    ]
+
+    expected = simulate_plan(state, plan, market_path, run_id="run")
+    actual = simulate_plan(CompactState.from_state(state), plan, market_path, run_id="run")
+
+    assert len(expected.steps) > 50
+    assert actual.rejected_step_index == expected.rejected_step_index
+    assert list(actual.trajectory) == list(expected.trajectory)
+    assert all(isinstance(item, CompactState) for item in actual.trajectory)
+    assert isinstance(actual.trajectory[len(actual.trajectory) // 2], CompactState)
+    assert actual.steps == expected.steps
@@ -0,0 +1,88 @@
+import random
+from statistics import mean, pstdev
+
+from services.core.market import MarketPath, generate_market_path
+from services.core.state import RiskLimits, State
+from services.core.strategy.evaluate import evaluate_signals_with_rationale
+from services.core.strategy.indicators import IndicatorEngine, RollingWindow
+from services.core.strategy.types import (
+    MeanReversionRule,
+    SmaCrossoverRule,
+    StrategyMetadata,
+    StrategySizing,
+    StrategySpec,
+    StrategyUniverse,
+    ThresholdPriceRule,
+)
+
+
+def _spec(symbols, rules) -> StrategySpec:
+    return StrategySpec(
+        metadata=StrategyMetadata(name="Test", version="1", description=""),
+        universe=StrategyUniverse(symbols=symbols),
+        sizing=StrategySizing(max_position_qty_per_symbol=5, order_qty=1),
+        rules=rules,
+    )
+
+
+def _state() -> State:
+    return State(cash_balance=1000.0, risk_limits=RiskLimits(2.0, 0.8, 5000.0))
+
+
+def test_rolling_window_matches_statistics_exactly() -> None:
+    rng = random.Random(7)
+    values = [round(rng.uniform(90, 110), 2) for _ in range(400)] + [100.0] * 12
+    window = RollingWindow(9)
+
+    for index, value in enumerate(values):
+        window.push(value)
+        expected = values[max(0, index - 8) : index + 1]
+        assert window.values() == expected
+        assert window.mean() == mean(expected)
+        assert window.pstdev() == pstdev(expected)
+    assert window.pstdev() == 0.0
+
+
+def test_incremental_signals_match_history_rescan() -> None:
+    path = generate_market_path(["AAPL", "MSFT"], n_steps=300, seed=11)
+    flat_tail = [{"AAPL": 100.0, "MSFT": 200.0}] * 8
+    path = MarketPath(symbols=path.symbols, steps=list(path.steps) + flat_tail)
+    spec = _spec(
+        ["AAPL", "MSFT"],
+        [
+            SmaCrossoverRule(symbol="AAPL", short_window=3, long_window=8),
+            SmaCrossoverRule(symbol="MSFT", short_window=12, long_window=5),
+            MeanReversionRule(symbol="AAPL", window=8, z_buy_below=-1.0, z_sell_above=1.0),
+            MeanReversionRule(symbol="MSFT", window=4, z_buy_below=-0.5, z_sell_above=0.5),
+            ThresholdPriceRule(symbol="MSFT", buy_below=150.0),
+        ],
+    )
+    engine = IndicatorEngine()
+
+    for step_index in range(len(path.steps)):
+        prices = path.price_context(step_index)
+        expected = evaluate_signals_with_rationale(spec, _state(), prices, step_index, path)
+        actual = evaluate_signals_with_rationale(
+            spec, _state(), prices, step_index, path, indicators=engine
+        )
+        assert actual == expected
+
+
+def test_indicator_engine_replays_on_rewind_and_new_path() -> None:
+    path = MarketPath(
+        symbols=["AAPL"],
+        steps=[{"AAPL": price} for price in [100.0, 101.0, 103.0, 106.0, 110.0]],
+    )
+    engine = IndicatorEngine()
+    engine.advance(path, 3)
+    window = engine.window("AAPL", 2)
+    assert window.values() == [103.0, 106.0]
+
+    engine.advance(path, 1)
+    assert engine.window("AAPL", 2).values() == [100.0, 101.0]
+
+    other = MarketPath(symbols=["AAPL"], steps=[{"AAPL": 50.0}, {"MSFT": 1.0}, {"AAPL": 52.0}])
+    engine.advance(other, 2)
+    rebuilt = engine.window("AAPL", 2)
+    assert rebuilt.values() == [50.0, 52.0]
+    assert rebuilt.count == 2
@@ -0,0 +1,93 @@
+import json
+import os
+
+import pytest
+
+from services.core.strategy import load
+from services.core.strategy.load import (
+    clear_strategy_cache,
+    load_strategy,
+    strategy_cache_info,
+)
+
+
+def _payload(buy_below: float) -> dict:
+    return {
+        "metadata": {"name": "Demo", "version": "1.0", "description": "Test"},
+        "universe": {"symbols": ["AAPL"]},
+        "sizing": {"max_position_qty_per_symbol": 2, "order_qty": 1},
+        "rules": [{"type": "threshold_price", "symbol": "AAPL", "buy_below": buy_below}],
+    }
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    clear_strategy_cache()
+    yield
+    clear_strategy_cache()
+
+
+def test_load_strategy_reuses_validated_spec(tmp_path) -> None:
+    path = tmp_path / "strategy.json"
+    path.write_text(json.dumps(_payload(100.0)))
+
+    first = load_strategy(str(path))
+    second = load_strategy(str(tmp_path / "." / "strategy.json"))
+    uncached = load_strategy(str(path), use_cache=False)
+
+    assert second == first and second is not first
+    assert uncached is not first and uncached == first
+    info = strategy_cache_info()
+    assert (info.hits, info.misses, info.size) == (1, 1, 1)
+
+
+def test_load_strategy_revalidates_changed_content(tmp_path) -> None:
+    path = tmp_path / "strategy.json"
+    path.write_text(json.dumps(_payload(100.0)))
+    first = load_strategy(str(path))
+
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert load_strategy(str(path)) == first
+
+    path.write_text(json.dumps(_payload(95.0)))
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 2_000_000))
+    changed = load_strategy(str(path))
+
+    assert changed != first
+    assert changed.rules[0].buy_below == 95.0
+    assert strategy_cache_info().misses == 2
+
+
+def test_load_strategy_cache_is_bounded(tmp_path, monkeypatch) -> None:
+    monkeypatch.setattr(load, "_CACHE", load._StrategyCache(max_size=2))
+    paths = []
+    for index in range(3):
+        path = tmp_path / f"strategy_{index}.json"
+        path.write_text(json.dumps(_payload(100.0 + index)))
+        paths.append(path)
+
+    first = load_strategy(str(paths[0]))
+    load_strategy(str(paths[1]))
+    load_strategy(str(paths[0]))
+    load_strategy(str(paths[2]))
+
+    assert strategy_cache_info().size == 2
+    assert load_strategy(str(paths[0])) == first
+    assert load_strategy(str(paths[1])) != first
+    assert strategy_cache_info().misses == 4
+
+
+def test_load_strategy_returns_independent_copies(tmp_path) -> None:
+    path = tmp_path / "strategy.json"
+    path.write_text(json.dumps(_payload(100.0)))
+
+    first = load_strategy(str(path))
+    first.rules = [first.rules[0].model_copy(update={"buy_below": 50.0})]
+    first.sizing = first.sizing.model_copy(update={"order_qty": 3})
+
+    second = load_strategy(str(path))
+    assert second is not first
+    assert second.rules[0].buy_below == 100.0
+    assert second.sizing.order_qty == 1
+    assert strategy_cache_info().hits == 1
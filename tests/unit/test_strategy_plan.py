@@ -0,0 +1,146 @@
+import random
+
+from services.core.market import MarketPath
+from services.core.strategy.indicators import IndicatorEngine
+from services.core.strategy.plan import compile_strategy
+from services.core.strategy.rules import (
+    _prices_for_symbol,
+    _sma_signal,
+    _threshold_signal,
+    _zscore_signal,
+)
+from services.core.strategy.types import (
+    MeanReversionRule,
+    Signal,
+    SmaCrossoverRule,
+    StrategyMetadata,
+    StrategySizing,
+    StrategySpec,
+    StrategyUniverse,
+    ThresholdPriceRule,
+)
+
+
+def _spec(symbols, rules) -> StrategySpec:
+    return StrategySpec(
+        metadata=StrategyMetadata(name="Test", version="1", description=""),
+        universe=StrategyUniverse(symbols=symbols),
+        sizing=StrategySizing(max_position_qty_per_symbol=5, order_qty=1),
+        rules=rules,
+    )
+
+
+def _rule_by_rule(strategy, price_ctx, step_index, market_path):
+    signals = {symbol: Signal.HOLD for symbol in strategy.universe.symbols}
+    rationales = {symbol: "" for symbol in strategy.universe.symbols}
+    for rule in strategy.rules:
+        price = price_ctx.get(rule.symbol)
+        if price is None:
+            continue
+        history = _prices_for_symbol(market_path, rule.symbol, step_index)
+        if isinstance(rule, ThresholdPriceRule):
+            signal, rationale = _threshold_signal(rule, price)
+        elif isinstance(rule, SmaCrossoverRule):
+            signal, rationale = _sma_signal(rule, history)
+        else:
+            signal, rationale = _zscore_signal(rule, history, price)
+        if signal != Signal.HOLD:
+            signals[rule.symbol] = signal
+            rationales[rule.symbol] = rationale
+        if signal == Signal.HOLD and not rationales.get(rule.symbol):
+            rationales[rule.symbol] = rationale
+    return signals, rationales
+
+
+def _random_rules(rng: random.Random, symbols, count):
+    rules = []
+    for _ in range(count):
+        symbol = rng.choice(symbols)
+        kind = rng.randrange(3)
+        if kind == 0:
+            rules.append(
+                ThresholdPriceRule(
+                    symbol=symbol,
+                    buy_below=rng.choice([None, 98.0, 99.5]),
+                    sell_above=rng.choice([None, 101.0, 102.5]),
+                )
+            )
+        elif kind == 1:
+            rules.append(
+                SmaCrossoverRule(
+                    symbol=symbol,
+                    short_window=rng.randint(1, 6),
+                    long_window=rng.randint(2, 10),
+                )
+            )
+        else:
+            rules.append(
+                MeanReversionRule(
+                    symbol=symbol,
+                    window=rng.randint(2, 8),
+                    z_buy_below=rng.choice([-1.5, -0.5]),
+                    z_sell_above=rng.choice([0.5, 1.5]),
+                )
+            )
+    return rules
+
+
+def test_compiled_plan_matches_rule_by_rule_evaluation() -> None:
+    rng = random.Random(11)
+    symbols = ["AAPL", "MSFT", "NVDA"]
+    steps = []
+    for _ in range(60):
+        step = {symbol: round(100 + rng.uniform(-3, 3), 2) for symbol in symbols}
+        if rng.random() < 0.2:
+            del step["NVDA"]
+        steps.append(step)
+    path = MarketPath(symbols=symbols, steps=steps)
+    spec = _spec(["AAPL", "MSFT"], _random_rules(rng, symbols, 120))
+    plan = compile_strategy(spec)
+    indicators = IndicatorEngine()
+
+    for step_index in range(len(steps)):
+        price_ctx = path.price_context(step_index)
+        expected = _rule_by_rule(spec, price_ctx, step_index, path)
+        stepwise = plan.evaluate(price_ctx, step_index, path)
+        incremental = plan.evaluate(price_ctx, step_index, path, indicators)
+        assert (stepwise.signals, stepwise.rationales) == expected
+        assert (incremental.signals, incremental.rationales) == expected
+
+
+def test_compiled_plan_groups_rules_by_symbol_and_is_cached() -> None:
+    spec = _spec(
+        ["AAPL", "MSFT"],
+        [
+            ThresholdPriceRule(symbol="AAPL", buy_below=99.0),
+            ThresholdPriceRule(symbol="MSFT", sell_above=201.0),
+            SmaCrossoverRule(symbol="AAPL", short_window=2, long_window=3),
+        ],
+    )
+
+    plan = compile_strategy(spec)
+    evaluation = plan.evaluate({"AAPL": 98.0}, 0)
+
+    assert compile_strategy(spec) is plan
+    assert compile_strategy(spec.model_copy(deep=True)) is plan
+    assert [symbol for symbol, _ in plan.groups] == ["AAPL", "MSFT"]
+    assert [len(evaluators) for _, evaluators in plan.groups] == [2, 1]
+    assert evaluation.signals == {"AAPL": Signal.BUY, "MSFT": Signal.HOLD}
+    assert evaluation.rationales == {
+        "AAPL": "price < buy_below (98.00 < 99.00)",
+        "MSFT": "",
+    }
+
+
+def test_compiled_plan_follows_in_place_spec_edits() -> None:
+    spec = _spec(["AAPL"], [ThresholdPriceRule(symbol="AAPL", buy_below=99.0)])
+    plan = compile_strategy(spec)
+
+    spec.rules[0].buy_below = 97.0
+    edited = compile_strategy(spec)
+    spec.rules.append(ThresholdPriceRule(symbol="AAPL", sell_above=97.5))
+
+    assert edited is not plan
+    assert plan.evaluate({"AAPL": 98.0}, 0).signals == {"AAPL": Signal.BUY}
+    assert edited.evaluate({"AAPL": 98.0}, 0).signals == {"AAPL": Signal.HOLD}
+    assert compile_strategy(spec).evaluate({"AAPL": 98.0}, 0).signals == {"AAPL": Signal.SELL}
@@ -0,0 +1,100 @@
+import random
+
+import numpy as np
+import pytest
+
+from services.core.market import MarketPath
+from services.core.market.generator import generate_market_path
+from services.core.state import RiskLimits, State
+from services.core.strategy.evaluate import evaluate_signals_with_rationale
+from services.core.strategy.types import (
+    MeanReversionRule,
+    Signal,
+    SmaCrossoverRule,
+    StrategyMetadata,
+    StrategySizing,
+    StrategySpec,
+    StrategyUniverse,
+    ThresholdPriceRule,
+)
+from services.core.strategy.vectorized import precompute_signals
+
+
+def _spec(symbols, rules) -> StrategySpec:
+    return StrategySpec(
+        metadata=StrategyMetadata(name="Test", version="1", description=""),
+        universe=StrategyUniverse(symbols=symbols),
+        sizing=StrategySizing(max_position_qty_per_symbol=5, order_qty=1),
+        rules=rules,
+    )
+
+
+def _assert_matches_stepwise(spec: StrategySpec, path) -> None:
+    state = State(cash_balance=1000.0, risk_limits=RiskLimits(2.0, 0.8, 5000.0))
+    matrix = precompute_signals(spec, path)
+    for step_index in range(len(path.steps)):
+        expected = evaluate_signals_with_rationale(
+            spec, state, path.price_context(step_index), step_index, path
+        )
+        actual = matrix.evaluation(step_index)
+        assert actual == expected, step_index
+        assert list(actual.signals) == list(expected.signals)
+        assert list(actual.rationales) == list(expected.rationales)
+
+
+def test_signal_matrix_matches_stepwise_evaluation_with_gaps_and_ties() -> None:
+    rng = random.Random(7)
+    steps = []
+    for index in range(240):
+        # Flat stretches force SMA ties and std=0; cents land on rounding edges.
+        price = 100.0 if 40 <= index < 60 else round(100 + rng.uniform(-3, 3), 3)
+        step = {"AAPL": price, "MSFT": round(200 + rng.uniform(-5, 5), 2)}
+        if rng.random() < 0.15:
+            del step["MSFT"]
+        steps.append(step)
+    path = MarketPath(symbols=["AAPL", "MSFT"], steps=steps)
+    spec = _spec(
+        ["AAPL", "MSFT"],
+        [
+            ThresholdPriceRule(symbol="AAPL", buy_below=98.0, sell_above=102.0),
+            SmaCrossoverRule(symbol="AAPL", short_window=3, long_window=8),
+            MeanReversionRule(symbol="AAPL", window=5, z_buy_below=-1.0, z_sell_above=1.0),
+            SmaCrossoverRule(symbol="MSFT", short_window=6, long_window=2),
+            MeanReversionRule(symbol="MSFT", window=4, z_buy_below=-0.5, z_sell_above=0.5),
+            ThresholdPriceRule(symbol="NVDA", buy_below=1.0),
+        ],
+    )
+
+    _assert_matches_stepwise(spec, path)
+    _assert_matches_stepwise(spec, path.to_columnar())
+
+
+def test_signal_matrix_matches_stepwise_on_generated_path() -> None:
+    path = generate_market_path(["AAPL", "MSFT", "NVDA"], n_steps=300, seed=3)
+    spec = _spec(
+        ["AAPL", "MSFT", "NVDA"],
+        [
+            SmaCrossoverRule(symbol="AAPL", short_window=5, long_window=20),
+            MeanReversionRule(symbol="MSFT", window=10, z_buy_below=-1.0, z_sell_above=1.0),
+            ThresholdPriceRule(symbol="NVDA", buy_below=95.0, sell_above=105.0),
+        ],
+    )
+
+    _assert_matches_stepwise(spec, path)
+
+
+def test_signal_matrix_codes_and_bounds() -> None:
+    path = MarketPath(
+        symbols=["AAPL"],
+        steps=[{"AAPL": price} for price in [100.0, 97.0, 104.0, 100.0]],
+    )
+    spec = _spec(["AAPL"], [ThresholdPriceRule(symbol="AAPL", buy_below=98.0, sell_above=102.0)])
+
+    matrix = precompute_signals(spec, path, n_steps=3)
+
+    assert matrix.codes.shape == (3, 1)
+    assert matrix.codes[:, 0].tolist() == [0, 1, -1]
+    assert matrix.signals_at(1) == {"AAPL": Signal.BUY}
+    assert np.issubdtype(matrix.codes.dtype, np.integer)
+    with pytest.raises(IndexError):
+        matrix.evaluation(3)
@@ -0,0 +1,111 @@
+from pathlib import Path
+
+import pytest
+
+from services.core.loop import run_loop
+from services.core.market import MarketPath
+from services.core.strategy import load_strategy
+from services.core.sweep import (
+    SweepResult,
+    apply_overrides,
+    parameter_grid,
+    random_search,
+    rank_results,
+    run_sweep,
+)
+
+FIXTURE_PATH = Path("examples/fixtures/trading_path.json")
+STRATEGY_PATH = "examples/strategies/sma_crossover_demo.json"
+
+
+def test_search_spaces_and_overrides() -> None:
+    base = load_strategy(STRATEGY_PATH)
+    grid = parameter_grid({"rules.0.short_window": [1, 2], "sizing.order_qty": [1, 2]})
+    samples = random_search(
+        {"rules.0.long_window": (3, 6), "rules.1.short_window": [1, 2]}, n_samples=5, seed=3
+    )
+
+    assert len(grid) == 4
+    assert grid[1] == {"rules.0.short_window": 1, "sizing.order_qty": 2}
+    assert samples == random_search(
+        {"rules.0.long_window": (3, 6), "rules.1.short_window": [1, 2]}, n_samples=5, seed=3
+    )
+    assert all(3 <= sample["rules.0.long_window"] <= 6 for sample in samples)
+
+    updated = apply_overrides(base, {"rules.0.short_window": 3, "sizing.order_qty": 2})
+    assert updated.rules[0].short_window == 3
+    assert updated.sizing.order_qty == 2
+    assert base.rules[0].short_window == 2
+    with pytest.raises(ValueError):
+        apply_overrides(base, {"rules.9.short_window": 3})
+    with pytest.raises(ValueError):
+        apply_overrides(base, {"sizing.unknown": 3})
+
+
+def test_run_sweep_ranks_candidates_and_reports_invalid_ones() -> None:
+    base = load_strategy(STRATEGY_PATH)
+    candidates = parameter_grid({"rules.0.short_window": [1, 2, 3]}) + [
+        {"rules.0.long_window": 1}
+    ]
+
+    market_path = MarketPath.from_fixture(FIXTURE_PATH)
+    results = run_sweep(base, market_path, candidates, max_workers=1)
+
+    assert [result.index for result in results][-1] == 3
+    assert results[-1].error is not None and "long_window" in results[-1].error
+    returns = [result.total_return for result in results[:-1]]
+    assert returns == sorted(returns, reverse=True)
+    assert all(
+        result.approved_steps + result.rejected_steps <= len(market_path.steps)
+        for result in results
+    )
+
+
+def test_run_sweep_values_every_candidate_at_the_last_step(tmp_path) -> None:
+    base = load_strategy(STRATEGY_PATH)
+    market_path = MarketPath.from_fixture(FIXTURE_PATH)
+    candidates = parameter_grid({"timing.evaluation_frequency_steps": [1, 3]})
+
+    results = run_sweep(base, market_path, candidates, max_workers=1)
+
+    final_prices = market_path.price_context(len(market_path.steps) - 1)
+    for result in results:
+        loop = run_loop(
+            market_path=market_path,
+            strategy=apply_overrides(base, result.params),
+            steps=len(market_path.steps),
+            data_dir=tmp_path,
+            ephemeral=True,
+        )
+        assert result.final_equity == loop.final_state.equity(final_prices)
+    sparse = run_loop(
+        market_path=market_path,
+        strategy=apply_overrides(base, candidates[1]),
+        steps=len(market_path.steps),
+        data_dir=tmp_path,
+        ephemeral=True,
+    )
+    assert sparse.tape_rows[-1].step_index < len(market_path.steps) - 1
+    assert sparse.tape_rows[-1].prices != final_prices
+
+
+def test_run_sweep_process_pool_matches_serial() -> None:
+    base = load_strategy(STRATEGY_PATH)
+    candidates = parameter_grid({"rules.0.short_window": [1, 2], "rules.0.long_window": [3, 4]})
+
+    serial = run_sweep(base, str(FIXTURE_PATH), candidates, max_workers=1)
+    parallel = run_sweep(base, str(FIXTURE_PATH), candidates, max_workers=2)
+
+    assert parallel == serial
+
+
+def test_rank_results_puts_errors_last() -> None:
+    results = [
+        SweepResult(index=0, params={}, total_return=0.01),
+        SweepResult(index=1, params={}, error="invalid"),
+        SweepResult(index=2, params={}, total_return=0.05),
+    ]
+
+    assert [result.index for result in rank_results(results)] == [2, 0, 1]
+    with pytest.raises(ValueError):
+        rank_results(results, metric="sharpe")
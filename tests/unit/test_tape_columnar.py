@@ -0,0 +1,86 @@
+import json
+import subprocess
+from pathlib import Path
+
+import numpy as np
+
+from services.core.loop import run_loop
+from services.core.market import MarketPath
+from services.core.observability import write_tape_json
+from services.core.observability.columnar import DECISION_CODES, ColumnarTape
+from services.core.strategy import load_strategy
+
+FIXTURE_PATH = Path("examples/fixtures/trading_path.json")
+STRATEGY_PATH = Path("examples/strategies/threshold_demo.json")
+
+
+def _tape_rows(data_dir: Path):
+    market_path = MarketPath.from_fixture(FIXTURE_PATH)
+    return run_loop(
+        market_path=market_path,
+        strategy=load_strategy(STRATEGY_PATH),
+        steps=len(market_path.steps),
+        data_dir=data_dir,
+        ephemeral=True,
+    ).tape_rows
+
+
+def _row(step_index, prices, signals, decision, actions):
+    return {
+        "step_index": step_index,
+        "prices": prices,
+        "signals": signals,
+        "decision": decision,
+        "actions": [{}] * actions,
+        "state_delta": {},
+    }
+
+
+def test_columns_match_tape_rows(tmp_path):
+    rows = _tape_rows(tmp_path)
+    tape = ColumnarTape.from_rows(rows)
+
+    assert len(tape) == len(rows)
+    assert tape.symbols == list(rows[0].prices)
+    for index, row in enumerate(rows):
+        assert tape.step_index[index] == row.step_index
+        assert tape.decision[index] == DECISION_CODES[row.decision]
+        assert tape.cash[index] == row.state_delta["cash"]["after"]
+        assert tape.equity[index] == row.state_delta["equity"]["after"]
+        for position, symbol in enumerate(tape.symbols):
+            assert tape.prices[index, position] == row.prices[symbol]
+    counts = tape.decision_counts()
+    assert sum(counts.values()) == len(rows)
+    assert counts["APPROVED"] == sum(row.decision == "APPROVED" for row in rows)
+    assert set(tape.columns()) >= {"cash", "price_AAPL", "signal_MSFT"}
+
+
+def test_late_symbols_are_padded_and_round_trip(tmp_path):
+    rows = [
+        _row(0, {"AAPL": 1.0}, {"AAPL": "BUY"}, "HOLD", actions=0),
+        _row(1, {"AAPL": 2.0, "MSFT": 3.0}, {"AAPL": "HOLD", "MSFT": "SELL"}, "REJECTED", 1),
+    ]
+    tape = ColumnarTape.from_rows(rows)
+    tape.save(tmp_path / "tape.npz")
+    loaded = ColumnarTape.load(tmp_path / "tape.npz")
+
+    assert loaded.symbols == ["AAPL", "MSFT"]
+    assert np.isnan(loaded.prices[0, 1]) and loaded.prices[1, 1] == 3.0
+    assert loaded.signals.tolist() == [[1, 0], [0, -1]]
+    assert loaded.n_actions.tolist() == [0, 1]
+    assert np.isnan(loaded.cash).all()
+
+
+def test_export_script_writes_npz(tmp_path):
+    write_tape_json(tmp_path / "tape.json", _tape_rows(tmp_path / "loop"))
+
+    result = subprocess.run(
+        ["python3", "scripts/export_tape_columnar.py", "--tape", str(tmp_path / "tape.json")],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    summary = json.loads(result.stdout)
+    tape = ColumnarTape.load(tmp_path / "tape.npz")
+    assert summary["rows"] == len(tape) > 0
+    assert summary["decisions"] == tape.decision_counts()
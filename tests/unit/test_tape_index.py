@@ -0,0 +1,104 @@
+import json
+import subprocess
+from pathlib import Path
+
+from services.core.loop import run_loop
+from services.core.market.generator import generate_market_path
+from services.core.observability import (
+    JsonlTapeWriter,
+    TapeIndex,
+    build_tape_index,
+    iter_tape,
+    load_tape_index,
+    row_matches,
+    write_tape_json,
+)
+from services.core.observability.tape_index import tape_index_path
+from services.core.strategy import load_strategy
+
+STRATEGY_PATH = Path("examples/strategies/mean_reversion_demo.json")
+
+
+def _write_tape(tmp_path: Path) -> Path:
+    market_path = generate_market_path(["AAPL", "MSFT"], n_steps=300, seed=4)
+    tape_path = tmp_path / "tape.jsonl"
+    with JsonlTapeWriter(tape_path, index=True) as sink:
+        result = run_loop(
+            market_path=market_path,
+            strategy=load_strategy(STRATEGY_PATH),
+            steps=len(market_path.steps),
+            data_dir=tmp_path / "loop",
+            ephemeral=True,
+            tape_sink=sink,
+        )
+    write_tape_json(tmp_path / "tape.json", result.tape_rows)
+    return tape_path
+
+
+def test_index_selects_the_rows_a_scan_would(tmp_path):
+    tape_path = _write_tape(tmp_path)
+    index = TapeIndex.load(tape_index_path(tape_path))
+    rows = list(iter_tape(tape_path))
+    approved = next(row for row in rows if row["decision"] == "APPROVED")
+
+    assert index == build_tape_index(tape_path)
+    for filters in (
+        {"decision": "REJECTED"},
+        {"decision": "APPROVED", "symbol": "MSFT"},
+        {"run_id": approved["run_id"]},
+        {"step": rows[-1]["step_index"]},
+        {"symbol": "AAPL", "decision": "HOLD"},
+    ):
+        expected = [row for row in rows if row_matches(row, **filters)]
+        assert list(index.read_rows(tape_path, index.select(**filters))) == expected
+    assert index.select(decision="REJECTED")
+
+
+def test_stale_or_missing_index_is_rebuilt(tmp_path):
+    tape_path = _write_tape(tmp_path)
+    sidecar = tape_index_path(tape_path)
+    rows = list(iter_tape(tape_path))
+    with tape_path.open("a") as handle:
+        handle.write(json.dumps({**rows[0], "step_index": 10_000}) + "\n")
+
+    index = load_tape_index(tape_path)
+    assert len(index) == len(rows) + 1
+    assert index.select(step=10_000) == [len(rows)]
+    assert TapeIndex.load(sidecar) == index
+
+    size = tape_path.stat().st_size
+    rewritten = tape_path.read_text().replace('"step_index": 10000,', '"step_index": 11000,')
+    tape_path.write_text(rewritten)
+    assert tape_path.stat().st_size == size
+    assert load_tape_index(tape_path, build=False) is None
+    assert load_tape_index(tape_path).select(step=11_000) == [len(rows)]
+
+    sidecar.unlink()
+    assert load_tape_index(tape_path, build=False) is None
+    assert load_tape_index(tmp_path / "tape.json") is None
+
+
+def test_replay_filters_agree_for_indexed_and_scanned_tapes(tmp_path):
+    tape_path = _write_tape(tmp_path)
+
+    def replay(path: Path, *filters: str) -> list:
+        result = subprocess.run(
+            ["python3", "scripts/replay_tape.py", "--tape", str(path), "--format", "json"]
+            + list(filters),
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        return json.loads(result.stdout)
+
+    for filters in (("--decision", "REJECTED"), ("--symbol", "msft", "--max-steps", "3")):
+        indexed = replay(tape_path, *filters)
+        scanned = replay(tmp_path / "tape.json", *filters)
+        assert indexed == scanned
+        assert indexed
+    rejected = subprocess.run(
+        ["python3", "scripts/replay_tape.py", "--tape", str(tape_path), "--max-steps", "-1"],
+        capture_output=True,
+        text=True,
+    )
+    assert rejected.returncode == 2 and "--max-steps" in rejected.stderr
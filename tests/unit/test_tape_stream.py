@@ -0,0 +1,58 @@
+import json
+from pathlib import Path
+
+from services.core.loop import run_loop
+from services.core.market import MarketPath
+from services.core.observability import JsonlTapeWriter, iter_tape, write_tape_json
+from services.core.observability import tape as tape_module
+from services.core.strategy import load_strategy
+
+FIXTURE_PATH = Path("examples/fixtures/trading_path.json")
+STRATEGY_PATH = Path("examples/strategies/threshold_demo.json")
+
+
+def _loop(data_dir: Path, **options):
+    market_path = MarketPath.from_fixture(FIXTURE_PATH)
+    return run_loop(
+        market_path=market_path,
+        strategy=load_strategy(STRATEGY_PATH),
+        steps=len(market_path.steps),
+        data_dir=data_dir,
+        **options,
+    )
+
+
+def test_loop_streams_tape_rows(tmp_path):
+    with JsonlTapeWriter(tmp_path / "tape.jsonl") as sink:
+        retained = _loop(tmp_path / "a", tape_sink=sink)
+    expected = json.loads(json.dumps([row.to_dict() for row in retained.tape_rows]))
+    assert list(iter_tape(tmp_path / "tape.jsonl")) == expected
+
+    with JsonlTapeWriter(tmp_path / "streamed.jsonl") as sink:
+        streamed = _loop(tmp_path / "b", tape_sink=sink, retain_tape=False)
+    assert streamed.tape_rows == []
+    assert sink.rows_written == len(expected)
+
+
+def test_iter_tape_reads_json_arrays_incrementally(tmp_path, monkeypatch):
+    rows = _loop(tmp_path / "loop").tape_rows
+    write_tape_json(tmp_path / "tape.json", rows)
+    expected = json.loads((tmp_path / "tape.json").read_text())
+    monkeypatch.setattr(tape_module, "_READ_CHUNK", 7)
+
+    assert list(iter_tape(tmp_path / "tape.json")) == expected
+    assert list(iter_tape(tmp_path / "tape.json", max_steps=2)) == expected[:2]
+    (tmp_path / "empty.json").write_text(" [ ] ")
+    assert list(iter_tape(tmp_path / "empty.json")) == []
+
+
+def test_jsonl_writer_flushes_periodically(tmp_path):
+    rows = _loop(tmp_path / "loop").tape_rows
+    path = tmp_path / "tape.jsonl"
+    writer = JsonlTapeWriter(path, flush_every=2)
+    for row in rows[:3]:
+        writer.write(row)
+
+    assert len(path.read_text().splitlines()) == 2
+    writer.close()
+    assert len(list(iter_tape(path))) == 3
@@ -0,0 +1,62 @@
+import random
+
+from services.core.actions import PlaceBuy, PlaceSell
+from services.core.state import CompactState, RiskLimits, State
+from services.core.verifier import verify_transition
+from services.core.verifier.verify import verify_transition_full
+
+SYMBOLS = ["AAPL", "MSFT", "NVDA", "TSLA", ""]
+
+
+def _random_case(rng: random.Random):
+    positions = {
+        symbol: rng.choice([0.0, 1.0, 2.5, -3.0, float(rng.randint(-50, 200))])
+        for symbol in rng.sample(SYMBOLS[:-1], rng.randint(0, 4))
+    }
+    limits = RiskLimits(
+        max_leverage=rng.choice([0.0, 0.5, 1.0, 2.0, 10.0]),
+        max_position_pct=rng.choice([-0.1, 0.0, 0.2, 0.5, 1.0, 5.0]),
+        max_position_value=rng.choice([-1.0, 0.0, 100.0, 1_000.0, 1e6]),
+    )
+    state = State(
+        cash_balance=rng.choice([-100.0, 0.0, 50.0, 1_000.0, 1e5]),
+        positions=positions,
+        exposure=rng.random() * 100,
+        risk_limits=limits,
+    )
+    action_type = rng.choice([PlaceBuy, PlaceSell])
+    action = action_type(
+        symbol=rng.choice(SYMBOLS),
+        quantity=rng.choice([-1, 0, 1, 3, 40, 500]),
+        price=rng.choice([-2.0, 0.0, 0.5, 10.0, 99.0]),
+    )
+    return state, action
+
+
+def test_incremental_verifier_matches_full_scan_on_random_states():
+    rng = random.Random(17)
+    rejected = 0
+    for _ in range(5_000):
+        state, action = _random_case(rng)
+        expected = verify_transition_full(state, action)
+
+        assert verify_transition(state, action) == expected
+        assert verify_transition(CompactState.from_state(state), action) == expected
+        rejected += not expected.accepted
+
+    assert 0 < rejected < 5_000
+
+
+def test_incremental_verifier_reports_touched_symbol_limits():
+    state = State(
+        cash_balance=1_000.0,
+        positions={f"S{index}": 1.0 for index in range(1_000)} | {"AAPL": 5.0},
+        risk_limits=RiskLimits(2.0, 0.4, 600.0),
+    )
+    result = verify_transition(state, PlaceBuy(symbol="AAPL", quantity=2, price=100.0))
+
+    assert [error.code for error in result.errors] == [
+        "position_value_limit",
+        "position_concentration",
+    ]
+    assert result == verify_transition_full(state, PlaceBuy("AAPL", 2, 100.0))